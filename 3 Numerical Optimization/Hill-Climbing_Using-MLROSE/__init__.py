@@ -3,9 +3,14 @@
 
 from .algorithms import (hill_climb, random_hill_climb, simulated_annealing,
                          genetic_alg, mimic)
-from .decay import GeomDecay, ArithDecay, ExpDecay, CustomSchedule
+from .checkpoint import Checkpoint
+from .decay import (GeomDecay, ArithDecay, ExpDecay, CustomSchedule,
+                    AdaptiveDecay)
 from .fitness import (OneMax, FlipFlop, FourPeaks, SixPeaks, ContinuousPeaks,
                       Knapsack, TravellingSales, Queens, MaxKColor, 
                       CustomFitness)
-from .neural import NeuralNetwork, LinearRegression, LogisticRegression
+from .neural import (NeuralNetwork, LinearRegression, LogisticRegression,
+                     FittedNetwork, load_network)
 from .opt_probs import DiscreteOpt, ContinuousOpt, TSPOpt
+from .optimizers import Momentum, Nesterov, RMSProp, Adam
+from .search import parallel_search
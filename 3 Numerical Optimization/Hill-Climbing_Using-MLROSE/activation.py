@@ -2,9 +2,10 @@
 
 
 import numpy as np
+from scipy.special import expit
 
 
-def identity(x, deriv=False):
+def identity(x, deriv=False, out=None):
     """Linear activation function
 
     Parameters
@@ -16,20 +17,35 @@ def identity(x, deriv=False):
         Whether to return the function or its derivative.
         Set True for derivative.
 
+    out: array, default: None
+        Array with the same shape as x in which to store the result, which
+        may be x itself. If :code:`None`, x itself is returned, or a new
+        array for the derivative.
+
     Returns
     -------
     fx: array
         Value of activation function at x
     """
-    if not deriv:
-        fx = x
+    if out is None:
+        if not deriv:
+            fx = x
+        else:
+            # Keep the type of floating point inputs, e.g. float32
+            fx = np.ones(np.shape(x),
+                         dtype=np.result_type(np.asarray(x), 1.0))
     else:
-        fx = np.ones(np.shape(x))
+        fx = out
+
+        if not deriv:
+            np.copyto(fx, x)
+        else:
+            fx.fill(1)
 
     return fx
 
 
-def relu(x, deriv=False):
+def relu(x, deriv=False, out=None):
     """ReLU activation function
 
     Parameters
@@ -41,21 +57,28 @@ def relu(x, deriv=False):
         Whether to return the function or its derivative.
         Set True for derivative.
 
+    out: array, default: None
+        Array with the same shape as x in which to store the result, which
+        may be x itself. If :code:`None`, a new array is allocated.
+
     Returns
     -------
     fx: array
         Value of activation function at x
     """
-    fx = np.copy(x)
-    fx[np.where(fx < 0)] = 0
+    if not deriv:
+        fx = np.maximum(x, 0, out=out)
+    else:
+        if out is None:
+            out = np.empty(np.shape(x),
+                           dtype=np.result_type(np.asarray(x), 1.0))
 
-    if deriv:
-        fx[np.where(fx > 0)] = 1
+        fx = np.greater(x, 0, out=out)
 
     return fx
 
 
-def sigmoid(x, deriv=False):
+def sigmoid(x, deriv=False, out=None):
     """Sigmoid activation function
 
     Parameters
@@ -67,20 +90,25 @@ def sigmoid(x, deriv=False):
         Whether to return the function or its derivative.
         Set True for derivative.
 
+    out: array, default: None
+        Array with the same shape as x in which to store the result, which
+        may be x itself. If :code:`None`, a new array is allocated.
+
     Returns
     -------
     fx: array
         Value of activation function at x
     """
-    fx = 1/(1 + np.exp(-x))
+    # Evaluate 1/(1 + exp(-x)) without overflowing exp for large negative x
+    fx = expit(x, out=out)
 
     if deriv:
-        fx *= (1 - fx)
+        fx *= 1 - fx
 
     return fx
 
 
-def softmax(x):
+def softmax(x, out=None):
     """Softmax activation function
 
     Parameters
@@ -88,20 +116,28 @@ def softmax(x):
     x: array
         Array containing input data.
 
+    out: array, default: None
+        Array with the same shape as x in which to store the result, which
+        may be x itself. If :code:`None`, a new array is allocated.
+
     Returns
     -------
     fx: array
         Value of activation function at x
     """
-    max_prob = np.max(x, axis=1).reshape((-1, 1))
-    fx = np.exp(x - max_prob)
-    sum_prob = np.sum(fx, axis=1).reshape((-1, 1))
-    fx = np.divide(fx, sum_prob)
+    # Integer inputs can't hold the result, so are converted to float
+    if out is None and not np.issubdtype(np.asarray(x).dtype, np.floating):
+        x = np.asarray(x, dtype=float)
+
+    # Subtract the largest value in each row, so that exp cannot overflow
+    fx = np.subtract(x, np.max(x, axis=1, keepdims=True), out=out)
+    np.exp(fx, out=fx)
+    fx /= np.sum(fx, axis=1, keepdims=True)
 
     return fx
 
 
-def tanh(x, deriv=False):
+def tanh(x, deriv=False, out=None):
     """Hyperbolic tan activation function
 
     Parameters
@@ -113,14 +149,19 @@ def tanh(x, deriv=False):
         Whether to return the function or its derivative.
         Set True for derivative.
 
+    out: array, default: None
+        Array with the same shape as x in which to store the result, which
+        may be x itself. If :code:`None`, a new array is allocated.
+
     Returns
     -------
     fx: array
         Value of activation function at x
     """
-    fx = np.tanh(x)
+    fx = np.tanh(x, out=out)
 
     if deriv:
-        fx = 1 - fx**2
+        np.square(fx, out=fx)
+        np.subtract(1, fx, out=fx)
 
     return fx
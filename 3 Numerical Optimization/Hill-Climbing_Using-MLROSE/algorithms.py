@@ -1,13 +1,149 @@
 """ Functions to implement the randomized optimization and search algorithms.
+
+Each algorithm (and :code:`gradient_descent` in :code:`mlrose.neural`)
+accepts a per-iteration callback, which is called at the end of every
+iteration as :code:`callback(iteration, state, fitness, best_fitness,
+evals, elapsed)`, where:
+
+* iteration is the iteration number within the current run (or restart);
+* state is the current state vector. It is the problem's own array, so
+  must be copied if it is kept, and must not be modified;
+* fitness and best_fitness are the current fitness and the best fitness
+  found so far, on the scale of the fitness function (i.e. not negated
+  for minimization problems);
+* evals is the number of fitness evaluations so far; and
+* elapsed is the time in seconds since the algorithm started, including
+  any time before it was resumed from a checkpoint.
+
+If the callback returns :code:`True`, the algorithm stops, skipping any
+remaining restarts, and returns its result as if it had reached its maximum
+number of iterations. If no callback is given, the only cost is one check
+per iteration.
 """
 
 
+import time
 import numpy as np
 from .decay import GeomDecay
 
 
+def _callback_stop(callback, problem, iters, best_fitness, start_time):
+    """Call an algorithm's per-iteration callback with its progress.
+
+    Parameters
+    ----------
+    callback: callable
+        Callback function, as described in the module docstring.
+    problem: optimization object
+        Optimization problem being solved.
+    iters: int
+        Current iteration of the algorithm.
+    best_fitness: float
+        Best fitness found so far, multiplied by :code:`problem.maximize`.
+    start_time: float
+        Value of :code:`time.perf_counter()` when the algorithm started.
+
+    Returns
+    -------
+    stop: bool
+        Whether the callback requested that the algorithm stops.
+    """
+    return bool(callback(iters, problem.get_state(),
+                         problem.get_maximize()*problem.get_fitness(),
+                         problem.get_maximize()*best_fitness,
+                         problem.get_stats()['total_evals'],
+                         time.perf_counter() - start_time))
+
+
+def _load_checkpoint(checkpoint, problem):
+    """Restore an optimization problem, its stats, its fitness function's
+    position in its mini-batches (if any) and the state of numpy's random
+    number generator from an algorithm's checkpoint.
+
+    Parameters
+    ----------
+    checkpoint: Checkpoint object
+        Checkpoint of the algorithm, or :code:`None`.
+    problem: optimization object
+        Optimization problem being solved.
+
+    Returns
+    -------
+    values: dict
+        Values saved by the algorithm, or :code:`None` if there is no saved
+        checkpoint to resume from.
+    """
+    if checkpoint is None:
+        return None
+
+    values = checkpoint.load()
+
+    if values is None:
+        return None
+
+    if len(values['state']) != problem.get_length():
+        raise Exception("""checkpoint state must have same length as"""
+                        + """ problem.""")
+
+    # Restore the mini-batch first, as changing it clears any cached values
+    # of the fitness function
+    if getattr(problem.fitness_fn, 'batch_size', None) is not None:
+        problem.fitness_fn.set_batch_state(values)
+
+    problem.set_state(values['state'], values['fitness'])
+
+    if 'population' in values:
+        problem.set_population(values['population'], values['pop_fitness'])
+
+    problem.stats.update(values['stats'])
+    np.random.set_state(('MT19937', values['random_keys'])
+                        + tuple(values['random_values']))
+
+    return values
+
+
+def _save_checkpoint(checkpoint, problem, start_time, **values):
+    """Save an algorithm's progress to its checkpoint, together with the
+    problem's current state, its stats, its fitness function's position in
+    its mini-batches (if any) and the state of numpy's random number
+    generator.
+
+    Parameters
+    ----------
+    checkpoint: Checkpoint object
+        Checkpoint of the algorithm.
+    problem: optimization object
+        Optimization problem being solved.
+    start_time: float
+        Value of :code:`time.perf_counter()` when the algorithm started.
+    values: dict
+        Algorithm variables to save. A fitness curve of :code:`None` is not
+        saved.
+    """
+    if values.get('curve') is None:
+        values.pop('curve', None)
+    else:
+        values['curve'] = np.asarray(values['curve'])
+
+    random_state = np.random.get_state()
+
+    values['state'] = np.asarray(problem.get_state())
+    values['fitness'] = float(problem.get_fitness())
+    values['stats'] = problem.stats
+    values['elapsed'] = time.perf_counter() - start_time
+    values['random_keys'] = random_state[1]
+    values['random_values'] = [int(random_state[2]), int(random_state[3]),
+                               float(random_state[4])]
+
+    if getattr(problem.fitness_fn, 'batch_size', None) is not None:
+        values.update(problem.fitness_fn.get_batch_state())
+
+    checkpoint.save(values)
+
+
 def hill_climb(problem, max_iters=np.inf, restarts=0, init_state=None,
-               curve=False, random_state=None):
+               curve=False, random_state=None, callback=None,
+               checkpoint=None):
     """Use standard hill climbing to find the optimum for a given
     optimization problem.
 
@@ -32,6 +168,18 @@ def hill_climb(problem, max_iters=np.inf, restarts=0, init_state=None,
     random_state: int, default: None
         If random_state is a positive integer, random_state is the seed used
         by np.random.seed(); otherwise, the random seed is not set.
+    callback: callable, default: None
+        Function called at the end of every iteration as
+        :code:`callback(iteration, state, fitness, best_fitness, evals,
+        elapsed)`, with the iteration number, the current state, the current
+        and best fitness values, the number of fitness evaluations so far and
+        the time elapsed in seconds. If it returns :code:`True`, the
+        algorithm stops. If :code:`None`, no callback is used.
+    checkpoint: Checkpoint object, default: None
+        Checkpoint to which the algorithm's progress is saved periodically,
+        e.g. :code:`mlrose.Checkpoint('run.ckpt')`. If the checkpoint file
+        already exists, the algorithm resumes from the saved progress. If
+        :code:`None`, no checkpoint is saved.
 
     Returns
     -------
@@ -65,34 +213,73 @@ def hill_climb(problem, max_iters=np.inf, restarts=0, init_state=None,
 
     best_fitness = -1*np.inf
     best_state = None
+    start_time = time.perf_counter()
+    first_restart = 0
+    stop = False
 
     if curve:
         fitness_curve = []
 
-    for _ in range(restarts + 1):
-        # Initialize optimization problem
-        if init_state is None:
-            problem.reset()
+    # Resume from checkpoint, if one has been saved
+    saved = _load_checkpoint(checkpoint, problem)
+
+    if saved is not None:
+        first_restart = restarts + 1 if saved['done'] else saved['restart']
+        best_fitness = saved['best_fitness']
+        best_state = saved['best_state']
+        start_time -= saved['elapsed']
+
+        if curve:
+            fitness_curve = list(saved.get('curve', []))
+
+    for restart in range(first_restart, restarts + 1):
+        # Initialize optimization problem, unless resuming this restart
+        if saved is not None:
+            iters = saved['iters']
+            saved = None
+
         else:
-            problem.set_state(init_state)
+            if init_state is None:
+                problem.reset()
+            else:
+                problem.set_state(init_state)
 
-        iters = 0
+            iters = 0
 
         while iters < max_iters:
             iters += 1
 
             # Find neighbors and determine best neighbor
+            start = time.perf_counter()
             problem.find_neighbors()
+            problem.add_time('neighbor', start)
+
             next_state = problem.best_neighbor()
-            next_fitness = problem.eval_fitness(next_state)
+            next_fitness = problem.eval_fitness(next_state, trusted=True)
+            problem.log_stats(iters)
 
             # If best neighbor is an improvement, move to that state
-            if next_fitness > problem.get_fitness():
-                problem.set_state(next_state)
+            improved = next_fitness > problem.get_fitness()
 
-            else:
+            if improved:
+                problem.set_state(next_state, next_fitness)
+
+            if callback is not None and _callback_stop(
+                    callback, problem, iters,
+                    max(best_fitness, problem.get_fitness()), start_time):
+                stop = True
+                break
+
+            if not improved:
                 break
 
+            if checkpoint is not None and iters % checkpoint.interval == 0:
+                _save_checkpoint(checkpoint, problem, start_time, done=False,
+                                 restart=restart, iters=iters,
+                                 best_fitness=best_fitness,
+                                 best_state=best_state,
+                                 curve=fitness_curve if curve else None)
+
         # Update best state and best fitness
         if problem.get_fitness() > best_fitness:
             best_fitness = problem.get_fitness()
@@ -101,6 +288,14 @@ def hill_climb(problem, max_iters=np.inf, restarts=0, init_state=None,
         if curve:
             fitness_curve.append(problem.get_fitness())
 
+        if stop:
+            break
+
+    if checkpoint is not None:
+        _save_checkpoint(checkpoint, problem, start_time, done=True,
+                         best_fitness=best_fitness, best_state=best_state,
+                         curve=fitness_curve if curve else None)
+
     best_fitness = problem.get_maximize()*best_fitness
 
     if curve:
@@ -110,7 +305,8 @@ def hill_climb(problem, max_iters=np.inf, restarts=0, init_state=None,
 
 
 def random_hill_climb(problem, max_attempts=10, max_iters=np.inf, restarts=0,
-                      init_state=None, curve=False, random_state=None):
+                      init_state=None, curve=False, random_state=None,
+                      callback=None, checkpoint=None):
     """Use randomized hill climbing to find the optimum for a given
     optimization problem.
 
@@ -137,6 +333,18 @@ def random_hill_climb(problem, max_attempts=10, max_iters=np.inf, restarts=0,
     random_state: int, default: None
         If random_state is a positive integer, random_state is the seed used
         by np.random.seed(); otherwise, the random seed is not set.
+    callback: callable, default: None
+        Function called at the end of every iteration as
+        :code:`callback(iteration, state, fitness, best_fitness, evals,
+        elapsed)`, with the iteration number, the current state, the current
+        and best fitness values, the number of fitness evaluations so far and
+        the time elapsed in seconds. If it returns :code:`True`, the
+        algorithm stops. If :code:`None`, no callback is used.
+    checkpoint: Checkpoint object, default: None
+        Checkpoint to which the algorithm's progress is saved periodically,
+        e.g. :code:`mlrose.Checkpoint('run.ckpt')`. If the checkpoint file
+        already exists, the algorithm resumes from the saved progress. If
+        :code:`None`, no checkpoint is saved.
 
     Returns
     -------
@@ -174,44 +382,92 @@ def random_hill_climb(problem, max_attempts=10, max_iters=np.inf, restarts=0,
 
     best_fitness = -1*np.inf
     best_state = None
+    start_time = time.perf_counter()
+    stop = False
+    first_restart = 0
 
     if curve:
         fitness_curve = []
 
-    for _ in range(restarts + 1):
-        # Initialize optimization problem and attempts counter
-        if init_state is None:
-            problem.reset()
+    # Resume from checkpoint, if one has been saved
+    saved = _load_checkpoint(checkpoint, problem)
+
+    if saved is not None:
+        first_restart = restarts + 1 if saved['done'] else saved['restart']
+        best_fitness = saved['best_fitness']
+        best_state = saved['best_state']
+        start_time -= saved['elapsed']
+
+        if curve:
+            fitness_curve = list(saved.get('curve', []))
+
+    for restart in range(first_restart, restarts + 1):
+        # Initialize optimization problem and attempts counter, unless
+        # resuming this restart
+        if saved is not None:
+            attempts = saved['attempts']
+            iters = saved['iters']
+            saved = None
+
         else:
-            problem.set_state(init_state)
+            if init_state is None:
+                problem.reset()
+            else:
+                problem.set_state(init_state)
 
-        attempts = 0
-        iters = 0
+            attempts = 0
+            iters = 0
 
         while (attempts < max_attempts) and (iters < max_iters):
             iters += 1
 
             # Find random neighbor and evaluate fitness
+            start = time.perf_counter()
             next_state = problem.random_neighbor()
-            next_fitness = problem.eval_fitness(next_state)
+            problem.add_time('neighbor', start)
+
+            next_fitness = problem.eval_fitness(next_state, trusted=True)
 
             # If best neighbor is an improvement,
             # move to that state and reset attempts counter
             if next_fitness > problem.get_fitness():
-                problem.set_state(next_state)
+                problem.set_state(next_state, next_fitness)
                 attempts = 0
 
             else:
                 attempts += 1
 
+            problem.log_stats(iters)
+
             if curve:
                 fitness_curve.append(problem.get_fitness())
 
+            if checkpoint is not None and iters % checkpoint.interval == 0:
+                _save_checkpoint(checkpoint, problem, start_time, done=False,
+                                 restart=restart, attempts=attempts,
+                                 iters=iters, best_fitness=best_fitness,
+                                 best_state=best_state,
+                                 curve=fitness_curve if curve else None)
+
+            if callback is not None and _callback_stop(
+                    callback, problem, iters,
+                    max(best_fitness, problem.get_fitness()), start_time):
+                stop = True
+                break
+
         # Update best state and best fitness
         if problem.get_fitness() > best_fitness:
             best_fitness = problem.get_fitness()
             best_state = problem.get_state()
 
+        if stop:
+            break
+
+    if checkpoint is not None:
+        _save_checkpoint(checkpoint, problem, start_time, done=True,
+                         best_fitness=best_fitness, best_state=best_state,
+                         curve=fitness_curve if curve else None)
+
     best_fitness = problem.get_maximize()*best_fitness
 
     if curve:
@@ -222,7 +478,7 @@ def random_hill_climb(problem, max_attempts=10, max_iters=np.inf, restarts=0,
 
 def simulated_annealing(problem, schedule=GeomDecay(), max_attempts=10,
                         max_iters=np.inf, init_state=None, curve=False,
-                        random_state=None):
+                        random_state=None, callback=None, checkpoint=None):
     """Use simulated annealing to find the optimum for a given
     optimization problem.
 
@@ -234,6 +490,11 @@ def simulated_annealing(problem, schedule=GeomDecay(), max_attempts=10,
         :code:`TSPOpt()`.
     schedule: schedule object, default: :code:`mlrose.GeomDecay()`
         Schedule used to determine the value of the temperature parameter.
+        If the schedule has a :code:`get_table` method, the temperatures are
+        precomputed in chunks and looked up at each iteration. If it has an
+        :code:`update` method, such as :code:`mlrose.AdaptiveDecay()`, it is
+        reset at the start of the run and updated after every iteration with
+        :code:`update(delta_e, accepted, fitness)`.
     max_attempts: int, default: 10
         Maximum number of attempts to find a better neighbor at each step.
     max_iters: int, default: np.inf
@@ -249,6 +510,18 @@ def simulated_annealing(problem, schedule=GeomDecay(), max_attempts=10,
     random_state: int, default: None
         If random_state is a positive integer, random_state is the seed used
         by np.random.seed(); otherwise, the random seed is not set.
+    callback: callable, default: None
+        Function called at the end of every iteration as
+        :code:`callback(iteration, state, fitness, best_fitness, evals,
+        elapsed)`, with the iteration number, the current state, the current
+        and best fitness values, the number of fitness evaluations so far and
+        the time elapsed in seconds. If it returns :code:`True`, the
+        algorithm stops. If :code:`None`, no callback is used.
+    checkpoint: Checkpoint object, default: None
+        Checkpoint to which the algorithm's progress is saved periodically,
+        e.g. :code:`mlrose.Checkpoint('run.ckpt')`. If the checkpoint file
+        already exists, the algorithm resumes from the saved progress. If
+        :code:`None`, no checkpoint is saved.
 
     Returns
     -------
@@ -280,20 +553,64 @@ def simulated_annealing(problem, schedule=GeomDecay(), max_attempts=10,
     if isinstance(random_state, int) and random_state > 0:
         np.random.seed(random_state)
 
-    # Initialize problem, time and attempts counter
-    if init_state is None:
-        problem.reset()
-    else:
-        problem.set_state(init_state)
-
     if curve:
         fitness_curve = []
 
-    attempts = 0
-    iters = 0
+    # Resume from checkpoint, if one has been saved. Otherwise, initialize
+    # problem, time and attempts counter.
+    saved = _load_checkpoint(checkpoint, problem)
+    start_time = time.perf_counter()
+
+    # Adaptive schedules are updated from the outcome of every iteration
+    adaptive = hasattr(schedule, 'update')
+
+    if saved is not None:
+        done = saved['done']
+        attempts = saved['attempts']
+        iters = saved['iters']
+        best_fitness = saved['best_fitness']
+        start_time -= saved['elapsed']
+
+        if curve:
+            fitness_curve = list(saved.get('curve', []))
+
+        if adaptive:
+            schedule.set_state(saved['schedule'])
+
+    else:
+        if init_state is None:
+            problem.reset()
+        else:
+            problem.set_state(init_state)
+
+        done = False
+        attempts = 0
+        iters = 0
+        best_fitness = problem.get_fitness()
+
+        if adaptive:
+            schedule.reset()
+
+    # Precompute the temperatures in chunks, up to the iteration at which
+    # they stop changing, if the schedule supports it
+    if hasattr(schedule, 'get_table'):
+        floor_iter = schedule.get_floor_iter()
+        table_start = iters
+        temp_table = schedule.get_table(table_start, max_iters)
+    else:
+        temp_table = None
+
+    while not done and (attempts < max_attempts) and (iters < max_iters):
+        if temp_table is None:
+            temp = schedule.evaluate(iters)
+        else:
+            if iters - table_start >= len(temp_table) \
+                    and iters <= floor_iter:
+                table_start = iters
+                temp_table = schedule.get_table(table_start, max_iters)
+
+            temp = temp_table[min(iters - table_start, len(temp_table) - 1)]
 
-    while (attempts < max_attempts) and (iters < max_iters):
-        temp = schedule.evaluate(iters)
         iters += 1
 
         if temp == 0:
@@ -301,8 +618,11 @@ def simulated_annealing(problem, schedule=GeomDecay(), max_attempts=10,
 
         else:
             # Find random neighbor and evaluate fitness
+            start = time.perf_counter()
             next_state = problem.random_neighbor()
-            next_fitness = problem.eval_fitness(next_state)
+            problem.add_time('neighbor', start)
+
+            next_fitness = problem.eval_fitness(next_state, trusted=True)
 
             # Calculate delta E and change prob
             delta_e = next_fitness - problem.get_fitness()
@@ -311,15 +631,42 @@ def simulated_annealing(problem, schedule=GeomDecay(), max_attempts=10,
             # If best neighbor is an improvement or random value is less
             # than prob, move to that state and reset attempts counter
             if (delta_e > 0) or (np.random.uniform() < prob):
-                problem.set_state(next_state)
+                problem.set_state(next_state, next_fitness)
                 attempts = 0
 
             else:
                 attempts += 1
 
+            if adaptive:
+                schedule.update(delta_e, attempts == 0, problem.get_fitness())
+
+        problem.log_stats(iters)
+
         if curve:
             fitness_curve.append(problem.get_fitness())
 
+        if checkpoint is not None and iters % checkpoint.interval == 0:
+            _save_checkpoint(checkpoint, problem, start_time, done=False,
+                             attempts=attempts, iters=iters,
+                             best_fitness=best_fitness,
+                             schedule=schedule.get_state() if adaptive
+                             else None,
+                             curve=fitness_curve if curve else None)
+
+        if callback is not None:
+            best_fitness = max(best_fitness, problem.get_fitness())
+
+            if _callback_stop(callback, problem, iters, best_fitness,
+                              start_time):
+                break
+
+    if checkpoint is not None:
+        _save_checkpoint(checkpoint, problem, start_time, done=True,
+                         attempts=attempts, iters=iters,
+                         best_fitness=best_fitness,
+                         schedule=schedule.get_state() if adaptive else None,
+                         curve=fitness_curve if curve else None)
+
     best_fitness = problem.get_maximize()*problem.get_fitness()
     best_state = problem.get_state()
 
@@ -330,7 +677,8 @@ def simulated_annealing(problem, schedule=GeomDecay(), max_attempts=10,
 
 
 def genetic_alg(problem, pop_size=200, mutation_prob=0.1, max_attempts=10,
-                max_iters=np.inf, curve=False, random_state=None):
+                max_iters=np.inf, curve=False, random_state=None,
+                callback=None, checkpoint=None):
     """Use a standard genetic algorithm to find the optimum for a given
     optimization problem.
 
@@ -357,6 +705,18 @@ def genetic_alg(problem, pop_size=200, mutation_prob=0.1, max_attempts=10,
     random_state: int, default: None
         If random_state is a positive integer, random_state is the seed used
         by np.random.seed(); otherwise, the random seed is not set.
+    callback: callable, default: None
+        Function called at the end of every iteration as
+        :code:`callback(iteration, state, fitness, best_fitness, evals,
+        elapsed)`, with the iteration number, the current state, the current
+        and best fitness values, the number of fitness evaluations so far and
+        the time elapsed in seconds. If it returns :code:`True`, the
+        algorithm stops. If :code:`None`, no callback is used.
+    checkpoint: Checkpoint object, default: None
+        Checkpoint to which the algorithm's progress is saved periodically,
+        e.g. :code:`mlrose.Checkpoint('run.ckpt')`. If the checkpoint file
+        already exists, the algorithm resumes from the saved progress. If
+        :code:`None`, no checkpoint is saved.
 
     Returns
     -------
@@ -400,16 +760,32 @@ def genetic_alg(problem, pop_size=200, mutation_prob=0.1, max_attempts=10,
     if curve:
         fitness_curve = []
 
-    # Initialize problem, population and attempts counter
-    problem.reset()
-    problem.random_pop(pop_size)
-    attempts = 0
-    iters = 0
+    # Resume from checkpoint, if one has been saved. Otherwise, initialize
+    # problem, population and attempts counter.
+    saved = _load_checkpoint(checkpoint, problem)
+    start_time = time.perf_counter()
 
-    while (attempts < max_attempts) and (iters < max_iters):
+    if saved is not None:
+        done = saved['done']
+        attempts = saved['attempts']
+        iters = saved['iters']
+        start_time -= saved['elapsed']
+
+        if curve:
+            fitness_curve = list(saved.get('curve', []))
+
+    else:
+        problem.reset()
+        problem.random_pop(pop_size)
+        done = False
+        attempts = 0
+        iters = 0
+
+    while not done and (attempts < max_attempts) and (iters < max_iters):
         iters += 1
 
         # Calculate breeding probabilities
+        start = time.perf_counter()
         problem.eval_mate_probs()
 
         # Create next generation of population
@@ -423,27 +799,50 @@ def genetic_alg(problem, pop_size=200, mutation_prob=0.1, max_attempts=10,
             parent_2 = problem.get_population()[selected[1]]
 
             # Create offspring
-            child = problem.reproduce(parent_1, parent_2, mutation_prob)
+            child = problem.reproduce(parent_1, parent_2, mutation_prob,
+                                      trusted=True)
             next_gen.append(child)
 
         next_gen = np.array(next_gen)
+        problem.add_time('reproduce', start)
         problem.set_population(next_gen)
 
         next_state = problem.best_child()
-        next_fitness = problem.eval_fitness(next_state)
+        next_fitness = problem.best_child_fitness()
 
         # If best child is an improvement,
         # move to that state and reset attempts counter
         if next_fitness > problem.get_fitness():
-            problem.set_state(next_state)
+            problem.set_state(next_state, next_fitness)
             attempts = 0
 
         else:
             attempts += 1
 
+        problem.log_stats(iters)
+
         if curve:
             fitness_curve.append(problem.get_pop_fitness())
 
+        if checkpoint is not None and iters % checkpoint.interval == 0:
+            _save_checkpoint(checkpoint, problem, start_time, done=False,
+                             attempts=attempts, iters=iters,
+                             population=problem.get_population(),
+                             pop_fitness=problem.get_pop_fitness(),
+                             curve=fitness_curve if curve else None)
+
+        # The current state is the best found so far
+        if callback is not None and _callback_stop(
+                callback, problem, iters, problem.get_fitness(), start_time):
+            break
+
+    if checkpoint is not None:
+        _save_checkpoint(checkpoint, problem, start_time, done=True,
+                         attempts=attempts, iters=iters,
+                         population=problem.get_population(),
+                         pop_fitness=problem.get_pop_fitness(),
+                         curve=fitness_curve if curve else None)
+
     best_fitness = problem.get_maximize()*problem.get_fitness()
     best_state = problem.get_state()
 
@@ -454,7 +853,8 @@ def genetic_alg(problem, pop_size=200, mutation_prob=0.1, max_attempts=10,
 
 
 def mimic(problem, pop_size=200, keep_pct=0.2, max_attempts=10,
-          max_iters=np.inf, curve=False, random_state=None):
+          max_iters=np.inf, curve=False, random_state=None, callback=None,
+          checkpoint=None):
     """Use MIMIC to find the optimum for a given optimization problem.
 
     Parameters
@@ -479,6 +879,18 @@ def mimic(problem, pop_size=200, keep_pct=0.2, max_attempts=10,
     random_state: int, default: None
         If random_state is a positive integer, random_state is the seed used
         by np.random.seed(); otherwise, the random seed is not set.
+    callback: callable, default: None
+        Function called at the end of every iteration as
+        :code:`callback(iteration, state, fitness, best_fitness, evals,
+        elapsed)`, with the iteration number, the current state, the current
+        and best fitness values, the number of fitness evaluations so far and
+        the time elapsed in seconds. If it returns :code:`True`, the
+        algorithm stops. If :code:`None`, no callback is used.
+    checkpoint: Checkpoint object, default: None
+        Checkpoint to which the algorithm's progress is saved periodically,
+        e.g. :code:`mlrose.Checkpoint('run.ckpt')`. If the checkpoint file
+        already exists, the algorithm resumes from the saved progress. If
+        :code:`None`, no checkpoint is saved.
 
     Returns
     -------
@@ -529,16 +941,32 @@ def mimic(problem, pop_size=200, keep_pct=0.2, max_attempts=10,
     if curve:
         fitness_curve = []
 
-    # Initialize problem, population and attempts counter
-    problem.reset()
-    problem.random_pop(pop_size)
-    attempts = 0
-    iters = 0
+    # Resume from checkpoint, if one has been saved. Otherwise, initialize
+    # problem, population and attempts counter.
+    saved = _load_checkpoint(checkpoint, problem)
+    start_time = time.perf_counter()
 
-    while (attempts < max_attempts) and (iters < max_iters):
+    if saved is not None:
+        done = saved['done']
+        attempts = saved['attempts']
+        iters = saved['iters']
+        start_time -= saved['elapsed']
+
+        if curve:
+            fitness_curve = list(saved.get('curve', []))
+
+    else:
+        problem.reset()
+        problem.random_pop(pop_size)
+        done = False
+        attempts = 0
+        iters = 0
+
+    while not done and (attempts < max_attempts) and (iters < max_iters):
         iters += 1
 
         # Get top n percent of population
+        start = time.perf_counter()
         problem.find_top_pct(keep_pct)
 
         # Update probability estimates
@@ -546,24 +974,45 @@ def mimic(problem, pop_size=200, keep_pct=0.2, max_attempts=10,
 
         # Generate new sample
         new_sample = problem.sample_pop(pop_size)
+        problem.add_time('sample', start)
         problem.set_population(new_sample)
 
         next_state = problem.best_child()
-
-        next_fitness = problem.eval_fitness(next_state)
+        next_fitness = problem.best_child_fitness()
 
         # If best child is an improvement,
         # move to that state and reset attempts counter
         if next_fitness > problem.get_fitness():
-            problem.set_state(next_state)
+            problem.set_state(next_state, next_fitness)
             attempts = 0
 
         else:
             attempts += 1
 
+        problem.log_stats(iters)
+
         if curve:
             fitness_curve.append(problem.get_pop_fitness())
 
+        if checkpoint is not None and iters % checkpoint.interval == 0:
+            _save_checkpoint(checkpoint, problem, start_time, done=False,
+                             attempts=attempts, iters=iters,
+                             population=problem.get_population(),
+                             pop_fitness=problem.get_pop_fitness(),
+                             curve=fitness_curve if curve else None)
+
+        # The current state is the best found so far
+        if callback is not None and _callback_stop(
+                callback, problem, iters, problem.get_fitness(), start_time):
+            break
+
+    if checkpoint is not None:
+        _save_checkpoint(checkpoint, problem, start_time, done=True,
+                         attempts=attempts, iters=iters,
+                         population=problem.get_population(),
+                         pop_fitness=problem.get_pop_fitness(),
+                         curve=fitness_curve if curve else None)
+
     best_fitness = problem.get_maximize()*problem.get_fitness()
     best_state = problem.get_state().astype(int)
 
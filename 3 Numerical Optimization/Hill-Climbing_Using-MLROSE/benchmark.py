@@ -0,0 +1,480 @@
+""" Benchmark suite for the randomized optimization algorithms.
+
+Run from the command line with, for example::
+
+    python -m mlrose.benchmark --sizes 20 50 --output results.json
+    python -m mlrose.benchmark --baseline results.json
+"""
+
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+from .algorithms import (hill_climb, random_hill_climb, simulated_annealing,
+                         genetic_alg, mimic)
+from .fitness import (OneMax, FourPeaks, Knapsack, Queens, MaxKColor,
+                      TravellingSales)
+from .opt_probs import DiscreteOpt, TSPOpt
+
+
+def _onemax(size, rng):
+    """OneMax problem, with target the optimum, size."""
+    return DiscreteOpt(size, OneMax()), size
+
+
+def _fourpeaks(size, rng):
+    """FourPeaks problem with t_pct 0.1, with target the optimum,
+    2*size - T - 1."""
+    threshold = np.ceil(0.1*size)
+
+    return DiscreteOpt(size, FourPeaks(t_pct=0.1)), 2*size - threshold - 1
+
+
+def _knapsack(size, rng):
+    """0-1 Knapsack problem with random integer weights and values, with
+    target the value of the greedy solution by value per unit weight."""
+    weights = rng.randint(1, 50, size=size)
+    values = rng.randint(1, 50, size=size)
+    fitness = Knapsack(weights, values, max_weight_pct=0.35)
+
+    # Fill knapsack greedily, best ratio first, with each item that fits
+    total_weight = 0
+    target = 0
+
+    for i in np.argsort(-values/weights, kind='stable'):
+        if total_weight + weights[i] <= fitness._w:
+            total_weight += weights[i]
+            target += values[i]
+
+    return DiscreteOpt(size, fitness), target
+
+
+def _queens(size, rng):
+    """N-Queens problem, minimizing the number of attacking pairs, with
+    target the optimum, 0."""
+    return DiscreteOpt(size, Queens(), maximize=False, max_val=size), 0
+
+
+def _maxkcolor(size, rng):
+    """Max-3 color problem on a random 3-colorable graph with 2*size edges
+    (or every allowed edge, for small sizes), with target the optimum, 0."""
+    # Only join nodes of different colors in a hidden, balanced coloring, so
+    # that a coloring with no conflicts exists
+    colors = rng.permutation(np.arange(size) % 3)
+    node1, node2 = np.triu_indices(size, k=1)
+    cross = np.flatnonzero(colors[node1] != colors[node2])
+
+    chosen = np.sort(rng.choice(cross, size=min(2*size, len(cross)),
+                                replace=False))
+    edges = list(zip(node1[chosen].tolist(), node2[chosen].tolist()))
+
+    return DiscreteOpt(size, MaxKColor(edges), maximize=False,
+                       max_val=3), 0
+
+
+def _travelling_sales(size, rng):
+    """Travelling salesperson problem on random points in the unit square,
+    with target the length of the nearest neighbor tour from node 0."""
+    coords = rng.rand(size, 2)
+    dists = np.sqrt(np.sum((coords[:, None] - coords[None])**2, axis=-1))
+
+    # Build nearest neighbor tour
+    node = 0
+    visited = np.zeros(size, dtype=bool)
+    visited[0] = True
+    target = 0
+
+    for _ in range(size - 1):
+        next_node = np.argmin(np.where(visited, np.inf, dists[node]))
+        target += dists[node, next_node]
+        visited[next_node] = True
+        node = next_node
+
+    target += dists[node, 0]
+    fitness = TravellingSales(coords=[tuple(c) for c in coords])
+
+    return TSPOpt(size, fitness), target
+
+
+# Problems to benchmark. Each function takes the problem size and a
+# RandomState for generating the instance, and returns the problem and a
+# target fitness value for the time-to-target measurements.
+PROBLEMS = {'OneMax': _onemax,
+            'FourPeaks': _fourpeaks,
+            'Knapsack': _knapsack,
+            'Queens': _queens,
+            'MaxKColor': _maxkcolor,
+            'TravellingSales': _travelling_sales}
+
+# Algorithms to benchmark, with their parameters
+ALGORITHMS = {'hill_climb': (hill_climb, {'restarts': 10}),
+              'random_hill_climb': (random_hill_climb,
+                                    {'max_attempts': 100, 'max_iters': 1000}),
+              'simulated_annealing': (simulated_annealing,
+                                      {'max_attempts': 100,
+                                       'max_iters': 1000}),
+              'genetic_alg': (genetic_alg, {'pop_size': 200,
+                                            'max_attempts': 10,
+                                            'max_iters': 100}),
+              'mimic': (mimic, {'pop_size': 100, 'max_attempts': 10,
+                                'max_iters': 20})}
+
+DEFAULT_SIZES = [10, 30, 50]
+
+
+def _run_once(problem_name, size, algorithm, seed, random_state,
+              memory=False):
+    """Run an algorithm once on a problem instance and measure it.
+
+    Parameters
+    ----------
+    problem_name: string
+        Key of problem in :code:`PROBLEMS`.
+    size: int
+        Problem size.
+    algorithm: string
+        Key of algorithm in :code:`ALGORITHMS`.
+    seed: int
+        Seed used to generate the problem instance.
+    random_state: int
+        Seed used by the algorithm.
+    memory: bool, default: False
+        Whether to trace memory allocations, to measure the peak memory used.
+        Tracing slows down the run, so its timings should not be used.
+
+    Returns
+    -------
+    run: dict
+        Dictionary of measurements: :code:`target`, :code:`best_fitness`,
+        :code:`evals`, :code:`time`, :code:`time_to_target` and
+        :code:`evals_to_target` (both :code:`None` if the target was not
+        reached) and, if memory is :code:`True`, :code:`peak_memory` in
+        bytes.
+    """
+    problem, target = PROBLEMS[problem_name](size,
+                                             np.random.RandomState(seed))
+    algorithm_fn, params = ALGORITHMS[algorithm]
+    sign = problem.get_maximize()
+    reached = {}
+
+    def callback(iteration, state, fitness, best_fitness, evals, elapsed):
+        # Record when the best fitness first reaches the target
+        if not reached and sign*best_fitness >= sign*target:
+            reached['time'] = elapsed
+            reached['evals'] = evals
+
+        return False
+
+    if memory:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    best_fitness = algorithm_fn(problem, random_state=random_state,
+                                callback=callback, **params)[1]
+    run_time = time.perf_counter() - start
+
+    run = {'target': float(target),
+           'best_fitness': float(best_fitness),
+           'evals': int(problem.get_stats()['total_evals']),
+           'time': run_time,
+           'time_to_target': reached.get('time'),
+           'evals_to_target': reached.get('evals')}
+
+    if memory:
+        run['peak_memory'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return run
+
+
+def run_case(problem_name, size, algorithm, repeats=3, seed=1, memory=True):
+    """Benchmark an algorithm on one problem instance.
+
+    Parameters
+    ----------
+    problem_name: string
+        Key of problem in :code:`PROBLEMS`.
+    size: int
+        Problem size.
+    algorithm: string
+        Key of algorithm in :code:`ALGORITHMS`.
+    repeats: int, default: 3
+        Number of timed runs, with algorithm seeds :code:`seed`,
+        :code:`seed + 1`, ..., :code:`seed + repeats - 1`.
+    seed: int, default: 1
+        Seed used to generate the problem instance and the first algorithm
+        seed. Must be greater than 0.
+    memory: bool, default: True
+        Whether to make an extra run with memory tracing, to measure the
+        peak memory used.
+
+    Returns
+    -------
+    result: dict
+        Dictionary of results, giving medians over the timed runs of the
+        evaluations per second (:code:`evals_per_sec`), run time
+        (:code:`time`), time to target (:code:`time_to_target`) and
+        evaluations to target (:code:`evals_to_target`), both over the runs
+        that reached the target; the proportion of runs that reached the
+        target (:code:`success_rate`); the mean best fitness
+        (:code:`best_fitness`); and the peak memory in bytes
+        (:code:`peak_memory`).
+    """
+    runs = [_run_once(problem_name, size, algorithm, seed, seed + i)
+            for i in range(repeats)]
+    reached = [run for run in runs if run['time_to_target'] is not None]
+
+    result = {'problem': problem_name,
+              'size': size,
+              'algorithm': algorithm,
+              'params': ALGORITHMS[algorithm][1],
+              'target': runs[0]['target'],
+              'best_fitness': float(np.mean([run['best_fitness']
+                                             for run in runs])),
+              'evals': int(np.median([run['evals'] for run in runs])),
+              'time': float(np.median([run['time'] for run in runs])),
+              'evals_per_sec': float(np.median([run['evals']/run['time']
+                                                for run in runs])),
+              'success_rate': len(reached)/repeats,
+              'time_to_target': None,
+              'evals_to_target': None,
+              'peak_memory': None}
+
+    if reached:
+        result['time_to_target'] = float(np.median(
+            [run['time_to_target'] for run in reached]))
+        result['evals_to_target'] = float(np.median(
+            [run['evals_to_target'] for run in reached]))
+
+    if memory:
+        result['peak_memory'] = _run_once(problem_name, size, algorithm,
+                                          seed, seed, memory=True)[
+                                              'peak_memory']
+
+    return result
+
+
+def run_benchmarks(problems=None, sizes=None, algorithms=None, repeats=3,
+                   seed=1, memory=True, verbose=False):
+    """Benchmark each algorithm on each problem at each size.
+
+    Parameters
+    ----------
+    problems: list of strings, default: None
+        Keys of problems in :code:`PROBLEMS`. If :code:`None`, all problems
+        are used.
+    sizes: list of ints, default: None
+        Problem sizes. If :code:`None`, :code:`DEFAULT_SIZES` is used.
+    algorithms: list of strings, default: None
+        Keys of algorithms in :code:`ALGORITHMS`. If :code:`None`, all
+        algorithms are used.
+    repeats: int, default: 3
+        Number of timed runs of each case.
+    seed: int, default: 1
+        Seed used to generate the problem instances and the algorithm seeds.
+    memory: bool, default: True
+        Whether to measure the peak memory used in each case.
+    verbose: bool, default: False
+        Whether to print each result as it completes.
+
+    Returns
+    -------
+    results: dict
+        Dictionary with keys :code:`meta`, describing the benchmark settings
+        and environment, and :code:`results`, a list of the dictionaries
+        returned by :code:`run_case`.
+    """
+    if problems is None:
+        problems = list(PROBLEMS)
+
+    if sizes is None:
+        sizes = DEFAULT_SIZES
+
+    if algorithms is None:
+        algorithms = list(ALGORITHMS)
+
+    for name in problems:
+        if name not in PROBLEMS:
+            raise Exception("""Unknown problem: %s.""" % (name,))
+
+    for name in algorithms:
+        if name not in ALGORITHMS:
+            raise Exception("""Unknown algorithm: %s.""" % (name,))
+
+    if (not isinstance(repeats, int)) or (repeats <= 0):
+        raise Exception("""repeats must be a positive integer.""")
+
+    if (not isinstance(seed, int)) or (seed <= 0):
+        raise Exception("""seed must be a positive integer.""")
+
+    results = []
+
+    for problem_name in problems:
+        for size in sizes:
+            for algorithm in algorithms:
+                result = run_case(problem_name, size, algorithm, repeats,
+                                  seed, memory)
+                results.append(result)
+
+                if verbose:
+                    print(_format_result(result))
+                    sys.stdout.flush()
+
+    meta = _environment()
+    meta['repeats'] = repeats
+    meta['seed'] = seed
+
+    return {'meta': meta, 'results': results}
+
+
+def _environment():
+    """Describe the environment that benchmarks are run in.
+
+    Returns
+    -------
+    meta: dict
+        Dictionary giving the date and the Python, numpy and platform
+        versions.
+    """
+    return {'date': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor()}
+
+
+def _format_result(result):
+    """Format a benchmark result as a line of text."""
+    if result['time_to_target'] is None:
+        to_target = '%10s' % ('-',)
+    else:
+        to_target = '%9.4fs' % (result['time_to_target'],)
+
+    if result['peak_memory'] is None:
+        memory = '%9s' % ('-',)
+    else:
+        memory = '%7.0fkB' % (result['peak_memory']/1e3,)
+
+    return '%-16s %5d %-20s %11.0f/s %s %4.0f%% %s' % (
+        result['problem'], result['size'], result['algorithm'],
+        result['evals_per_sec'], to_target, 100*result['success_rate'],
+        memory)
+
+
+def compare_results(results, baseline, key='evals_per_sec', tolerance=0.1):
+    """Compare benchmark results with baseline results.
+
+    Parameters
+    ----------
+    results: list of dicts
+        Results, as returned by :code:`run_benchmarks` or
+        :code:`run_case`.
+    baseline: list of dicts
+        Baseline results, in the same form. Only cases in both lists are
+        compared.
+    key: string, default: 'evals_per_sec'
+        Result to compare. Higher values are taken to be better.
+    tolerance: float, default: 0.1
+        Relative change treated as noise. Cases whose ratio to the baseline
+        is below :code:`1 - tolerance` are reported as regressions.
+
+    Returns
+    -------
+    comparison: list of dicts
+        For each case, a dictionary with keys :code:`problem`, :code:`size`,
+        :code:`algorithm`, :code:`baseline`, :code:`value`, :code:`ratio`
+        (value/baseline) and :code:`regression`.
+    """
+    baseline_values = {(row['problem'], row['size'], row['algorithm']):
+                       row[key] for row in baseline}
+    comparison = []
+
+    for row in results:
+        case = (row['problem'], row['size'], row['algorithm'])
+        old = baseline_values.get(case)
+
+        if old is None or row[key] is None or old == 0:
+            continue
+
+        ratio = row[key]/old
+        comparison.append({'problem': case[0],
+                           'size': case[1],
+                           'algorithm': case[2],
+                           'baseline': old,
+                           'value': row[key],
+                           'ratio': ratio,
+                           'regression': ratio < 1 - tolerance})
+
+    return comparison
+
+
+def main(args=None):
+    """Run the benchmark suite from the command line.
+
+    Parameters
+    ----------
+    args: list of strings, default: None
+        Command line arguments. If :code:`None`, :code:`sys.argv` is used.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m mlrose.benchmark',
+        description='Benchmark the mlrose optimization algorithms.')
+    parser.add_argument('--problems', nargs='+', choices=list(PROBLEMS),
+                        help='problems to benchmark (default: all)')
+    parser.add_argument('--sizes', nargs='+', type=int,
+                        help='problem sizes (default: %s)'
+                        % (' '.join(str(size) for size in DEFAULT_SIZES),))
+    parser.add_argument('--algorithms', nargs='+', choices=list(ALGORITHMS),
+                        help='algorithms to benchmark (default: all)')
+    parser.add_argument('--repeats', type=int, default=3,
+                        help='timed runs per case (default: 3)')
+    parser.add_argument('--seed', type=int, default=1,
+                        help='seed for problem instances and algorithms'
+                        ' (default: 1)')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='skip the peak memory measurements')
+    parser.add_argument('--output', help='path of JSON file for results')
+    parser.add_argument('--baseline',
+                        help='path of JSON results to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='relative slowdown reported as a regression'
+                        ' (default: 0.1)')
+    args = parser.parse_args(args)
+
+    results = run_benchmarks(args.problems, args.sizes, args.algorithms,
+                             args.repeats, args.seed, not args.no_memory,
+                             verbose=True)
+
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            baseline = json.load(file)['results']
+
+        comparison = compare_results(results['results'], baseline,
+                                     tolerance=args.tolerance)
+        regressions = 0
+
+        print('\nevals/sec compared with %s:' % (args.baseline,))
+
+        for row in comparison:
+            regressions += row['regression']
+            print('%-16s %5d %-20s %6.2fx%s' % (
+                row['problem'], row['size'], row['algorithm'], row['ratio'],
+                '  REGRESSION' if row['regression'] else ''))
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
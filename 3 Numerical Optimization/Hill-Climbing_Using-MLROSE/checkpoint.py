@@ -0,0 +1,167 @@
+""" Classes for saving and resuming the progress of optimization algorithms.
+"""
+
+
+import json
+import os
+import numpy as np
+
+
+def _json_default(value):
+    """Convert numpy scalars and arrays to Python types when encoding JSON.
+
+    Parameters
+    ----------
+    value: object
+        Object not supported by the JSON encoder.
+
+    Returns
+    -------
+    converted: int, float, bool or list
+        Equivalent Python value.
+    """
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+
+    raise TypeError("""%s is not JSON serializable."""
+                    % (type(value).__name__,))
+
+
+class Checkpoint:
+    """Periodic checkpoint of an optimization algorithm's progress, saved to
+    a file so that an interrupted run can be resumed.
+
+    Every `interval` iterations, and when the algorithm finishes, the
+    algorithm saves its full state to the file: the current state and
+    fitness, its counters, its population (if any), its best state so far,
+    its fitness curve, the problem's stats, the fitness function's position
+    in its mini-batches (if it uses them), the running values of the
+    gradient descent optimizer (if any) and the state of numpy's random
+    number generator. If the file already exists when the algorithm starts,
+    the algorithm resumes from the saved state instead of starting again, so
+    a resumed run gives the same result as an uninterrupted one, except as
+    described in the notes below. Resuming a run that had already finished
+    returns its saved result.
+
+    Parameters
+    ----------
+    path: string
+        Path of checkpoint file. The file is replaced atomically, so it
+        always holds a complete checkpoint, even if the run is interrupted
+        while saving.
+
+    interval: int, default: 100
+        Number of algorithm iterations between saves.
+
+    Example
+    -------
+    .. highlight:: python
+    .. code-block:: python
+
+        >>> import mlrose
+        >>> checkpoint = mlrose.Checkpoint('ga_run.ckpt', interval=50)
+        >>> best_state, best_fitness = mlrose.genetic_alg(
+        ...     problem, max_iters=10000, checkpoint=checkpoint)
+
+    Note
+    ----
+    The checkpoint file does not record which problem or algorithm
+    parameters it was saved with, so a file should only be used to resume
+    the run that saved it.
+
+    The state of the per-iteration callback is not saved, so a resumed run
+    can differ from an uninterrupted one if the callback keeps state that
+    affects when it stops the algorithm. In particular, a neural network
+    fitted with validation data restarts its validation loss tracking when
+    resumed. A neural network fitted on the full dataset by
+    :code:`random_hill_climb` or :code:`simulated_annealing` evaluates
+    weights incrementally from cached layer values, which are not saved, so
+    its losses after resuming can also differ by rounding errors.
+    """
+
+    def __init__(self, path, interval=100):
+
+        if (not isinstance(interval, int) and not interval.is_integer()) \
+                or (interval <= 0):
+            raise Exception("""interval must be a positive integer.""")
+
+        self.path = path
+        self.interval = int(interval)
+
+    def exists(self):
+        """Check whether a checkpoint has been saved.
+
+        Returns
+        -------
+        exists: bool
+            Whether the checkpoint file exists.
+        """
+        return os.path.exists(self.path)
+
+    def load(self):
+        """Load the saved checkpoint, if there is one.
+
+        Returns
+        -------
+        values: dict
+            Dictionary of saved values, or :code:`None` if the checkpoint
+            file does not exist.
+        """
+        if not self.exists():
+            return None
+
+        with np.load(self.path, allow_pickle=False) as data:
+            values = json.loads(str(data['header']))
+
+            for key in data.files:
+                if key != 'header':
+                    values[key] = data[key]
+
+        return values
+
+    def save(self, values):
+        """Save a checkpoint, replacing any previous one.
+
+        Parameters
+        ----------
+        values: dict
+            Dictionary of values to save. Numpy arrays are saved in binary
+            form, and all other values must be supported by JSON or be numpy
+            scalars.
+        """
+        arrays = {}
+        header = {}
+
+        for key, value in values.items():
+            if isinstance(value, np.ndarray):
+                arrays[key] = value
+            else:
+                header[key] = value
+
+        # Write to a temporary file first, so that an interruption cannot
+        # leave a partly written checkpoint in place of the previous one
+        temp_path = self.path + '.tmp'
+
+        with open(temp_path, 'wb') as file:
+            np.savez(file, header=np.array(json.dumps(
+                header, default=_json_default)), **arrays)
+
+        os.replace(temp_path, self.path)
+
+    def part(self, index):
+        """Create a checkpoint for one part of a run made up of several
+        algorithm runs, such as one random restart, saved alongside this
+        one.
+
+        Parameters
+        ----------
+        index: int
+            Index of part.
+
+        Returns
+        -------
+        checkpoint: Checkpoint object
+            Checkpoint with the same interval, saved to this checkpoint's
+            path with the suffix :code:`.<index>`.
+        """
+        return Checkpoint('%s.%d' % (self.path, index), self.interval)
@@ -0,0 +1,762 @@
+""" Classes for defining decay schedules for simulated annealing."""
+
+
+import numpy as np
+
+
+# Maximum number of temperatures precomputed at once by get_table(), so that
+# a slowly decaying schedule does not allocate a table for every iteration
+# until it reaches its minimum temperature
+TABLE_CHUNK = 10000
+
+
+def _floor_iter(schedule, estimate):
+    """Find the first iteration at which a decaying schedule's temperature
+    is at its minimum value, starting from an estimate calculated with
+    logarithms or division that may be out by one due to rounding error.
+
+    Parameters
+    ----------
+    schedule: schedule object
+        Schedule with a :code:`min_temp` attribute and an :code:`evaluate`
+        method.
+    estimate: float
+        Estimate of the first iteration at the minimum temperature.
+
+    Returns
+    -------
+    floor_iter: int
+        First iteration at which the temperature equals min_temp.
+    """
+    t = max(int(np.ceil(estimate)), 0)
+
+    while t > 0 and schedule.evaluate(t - 1) <= schedule.min_temp:
+        t -= 1
+
+    while schedule.evaluate(t) > schedule.min_temp:
+        t += 1
+
+    return t
+
+
+def _temp_table(schedule, start, max_iters):
+    """Precompute a decaying schedule's temperature at up to
+    :code:`TABLE_CHUNK` consecutive iterations, stopping early when it
+    reaches its minimum value or max_iters is reached.
+
+    Parameters
+    ----------
+    schedule: schedule object
+        Schedule with :code:`evaluate_many` and :code:`get_floor_iter`
+        methods.
+    start: int
+        First iteration to evaluate.
+    max_iters: int
+        Maximum number of iterations. May be :code:`np.inf`.
+
+    Returns
+    -------
+    table: array
+        Numpy array containing the temperature at iterations start,
+        start + 1, start + 2, ... At least one value is returned.
+    """
+    stop = min(start + TABLE_CHUNK, schedule.get_floor_iter() + 1,
+               max_iters)
+
+    return schedule.evaluate_many(np.arange(start, max(int(stop), start + 1)))
+
+
+class GeomDecay:
+    """
+    Schedule for geometrically decaying the simulated
+    annealing temperature parameter T according to the formula:
+
+    .. math::
+
+        T(t) = \\max(T_{0} \\times r^{t}, T_{min})
+
+    where:
+
+    * :math:`T_{0}` is the initial temperature (at time t = 0);
+    * :math:`r` is the rate of geometric decay; and
+    * :math:`T_{min}` is the minimum temperature value.
+
+    Parameters
+    ----------
+    init_temp: float, default: 1.0
+        Initial value of temperature parameter T. Must be greater than 0.
+    decay: float, default: 0.99
+        Temperature decay parameter, r. Must be between 0 and 1.
+    min_temp: float, default: 0.001
+        Minimum value of temperature parameter. Must be greater than 0.
+
+    Example
+    -------
+    .. highlight:: python
+    .. code-block:: python
+
+       >>> import mlrose
+       >>> schedule = mlrose.GeomDecay(init_temp=10, decay=0.95, min_temp=1)
+       >>> schedule.evaluate(5)
+       7.73780...
+    """
+
+    def __init__(self, init_temp=1.0, decay=0.99, min_temp=0.001):
+
+        self.init_temp = init_temp
+        self.decay = decay
+        self.min_temp = min_temp
+
+        if self.init_temp <= 0:
+            raise Exception("""init_temp must be greater than 0.""")
+
+        if (self.decay <= 0) or (self.decay > 1):
+            raise Exception("""decay must be between 0 and 1.""")
+
+        if self.min_temp <= 0:
+            raise Exception("""min_temp must be greater than 0.""")
+        elif self.min_temp > self.init_temp:
+            raise Exception("""init_temp must be greater than min_temp.""")
+
+    def evaluate(self, t):
+        """Evaluate the temperature parameter at time t.
+
+        Parameters
+        ----------
+        t: int
+            Time at which the temperature paramter T is evaluated.
+
+        Returns
+        -------
+        temp: float
+            Temperature parameter at time t.
+        """
+        # Evaluate in the same way as a precomputed table, so that the
+        # values are exactly equal
+        temp = float(self.evaluate_many([t])[0])
+
+        return temp
+
+    def evaluate_many(self, t):
+        """Evaluate the temperature parameter at several times at once.
+
+        Parameters
+        ----------
+        t: array
+            Numpy array of times at which the temperature parameter T is
+            evaluated.
+
+        Returns
+        -------
+        temps: array
+            Numpy array containing the temperature parameter at each time.
+        """
+        temps = np.power(self.decay, np.asarray(t, dtype=float))
+        temps *= self.init_temp
+
+        return np.maximum(temps, self.min_temp, out=temps)
+
+    def get_floor_iter(self):
+        """Return the first time at which the temperature parameter reaches
+        its minimum value.
+
+        Returns
+        -------
+        floor_iter: int
+            First time at which T equals min_temp, or :code:`np.inf` if T
+            never decays to min_temp.
+        """
+        if self.init_temp == self.min_temp:
+            return 0
+
+        if self.decay == 1:
+            return np.inf
+
+        return _floor_iter(self, np.log(self.min_temp/self.init_temp)
+                           / np.log(self.decay))
+
+    def get_table(self, start=0, max_iters=np.inf):
+        """Precompute the temperature parameter at up to :code:`TABLE_CHUNK`
+        consecutive times, for the annealing loop to look up.
+
+        Parameters
+        ----------
+        start: int, default: 0
+            First time to evaluate.
+        max_iters: int, default: np.inf
+            Time at which to stop evaluating.
+
+        Returns
+        -------
+        table: array
+            Numpy array containing T at times start, start + 1, ..., ending
+            early at the time T reaches its minimum value, after which T
+            does not change.
+        """
+        return _temp_table(self, start, max_iters)
+
+
+class ArithDecay:
+    """
+    Schedule for arithmetically decaying the simulated
+    annealing temperature parameter T according to the formula:
+
+    .. math::
+
+        T(t) = \\max(T_{0} - rt, T_{min})
+
+    where:
+
+    * :math:`T_{0}` is the initial temperature (at time t = 0);
+    * :math:`r` is the rate of arithmetic decay; and
+    * :math:`T_{min}` is the minimum temperature value.
+
+    Parameters
+    ----------
+    init_temp: float, default: 1.0
+        Initial value of temperature parameter T. Must be greater than 0.
+    decay: float, default: 0.0001
+        Temperature decay parameter, r. Must be greater than 0.
+    min_temp: float, default: 0.001
+        Minimum value of temperature parameter. Must be greater than 0.
+
+    Example
+    -------
+    .. highlight:: python
+    .. code-block:: python
+
+       >>> import mlrose
+       >>> schedule = mlrose.ArithDecay(init_temp=10, decay=0.95, min_temp=1)
+       >>> schedule.evaluate(5)
+       5.25
+    """
+
+    def __init__(self, init_temp=1.0, decay=0.0001, min_temp=0.001):
+
+        self.init_temp = init_temp
+        self.decay = decay
+        self.min_temp = min_temp
+
+        if self.init_temp <= 0:
+            raise Exception("""init_temp must be greater than 0.""")
+
+        if self.decay <= 0:
+            raise Exception("""decay must be greater than 0.""")
+
+        if self.min_temp <= 0:
+            raise Exception("""min_temp must be greater than 0.""")
+        elif self.min_temp > self.init_temp:
+            raise Exception("""init_temp must be greater than min_temp.""")
+
+    def evaluate(self, t):
+        """Evaluate the temperature parameter at time t.
+
+        Parameters
+        ----------
+        t: int
+            Time at which the temperature paramter T is evaluated.
+
+        Returns
+        -------
+        temp: float
+            Temperature parameter at time t.
+        """
+        # Evaluate in the same way as a precomputed table, so that the
+        # values are exactly equal
+        temp = float(self.evaluate_many([t])[0])
+
+        return temp
+
+    def evaluate_many(self, t):
+        """Evaluate the temperature parameter at several times at once.
+
+        Parameters
+        ----------
+        t: array
+            Numpy array of times at which the temperature parameter T is
+            evaluated.
+
+        Returns
+        -------
+        temps: array
+            Numpy array containing the temperature parameter at each time.
+        """
+        temps = np.multiply(self.decay, np.asarray(t, dtype=float))
+        np.subtract(self.init_temp, temps, out=temps)
+
+        return np.maximum(temps, self.min_temp, out=temps)
+
+    def get_floor_iter(self):
+        """Return the first time at which the temperature parameter reaches
+        its minimum value.
+
+        Returns
+        -------
+        floor_iter: int
+            First time at which T equals min_temp.
+        """
+        return _floor_iter(self, (self.init_temp - self.min_temp)/self.decay)
+
+    def get_table(self, start=0, max_iters=np.inf):
+        """Precompute the temperature parameter at up to :code:`TABLE_CHUNK`
+        consecutive times, for the annealing loop to look up.
+
+        Parameters
+        ----------
+        start: int, default: 0
+            First time to evaluate.
+        max_iters: int, default: np.inf
+            Time at which to stop evaluating.
+
+        Returns
+        -------
+        table: array
+            Numpy array containing T at times start, start + 1, ..., ending
+            early at the time T reaches its minimum value, after which T
+            does not change.
+        """
+        return _temp_table(self, start, max_iters)
+
+
+class ExpDecay:
+    """
+    Schedule for exponentially decaying the simulated
+    annealing temperature parameter T according to the formula:
+
+    .. math::
+
+        T(t) = \\max(T_{0} e^{-rt}, T_{min})
+
+    where:
+
+    * :math:`T_{0}` is the initial temperature (at time t = 0);
+    * :math:`r` is the rate of exponential decay; and
+    * :math:`T_{min}` is the minimum temperature value.
+
+    Parameters
+    ----------
+    init_temp: float, default: 1.0
+        Initial value of temperature parameter T. Must be greater than 0.
+    exp_const: float, default: 0.005
+        Exponential constant parameter, r. Must be greater than 0.
+    min_temp: float, default: 0.001
+        Minimum value of temperature parameter. Must be greater than 0.
+
+    Example
+    -------
+    .. highlight:: python
+    .. code-block:: python
+
+       >>> import mlrose
+       >>> schedule = mlrose.ExpDecay(init_temp=10, exp_const=0.05, min_temp=1)
+       >>> schedule.evaluate(5)
+       7.78800...
+    """
+
+    def __init__(self, init_temp=1.0, exp_const=0.005, min_temp=0.001):
+
+        self.init_temp = init_temp
+        self.exp_const = exp_const
+        self.min_temp = min_temp
+
+        if self.init_temp <= 0:
+            raise Exception("""init_temp must be greater than 0.""")
+
+        if self.exp_const <= 0:
+            raise Exception("""exp_const must be greater than 0.""")
+
+        if self.min_temp <= 0:
+            raise Exception("""min_temp must be greater than 0.""")
+        elif self.min_temp > self.init_temp:
+            raise Exception("""init_temp must be greater than min_temp.""")
+
+    def evaluate(self, t):
+        """Evaluate the temperature parameter at time t.
+
+        Parameters
+        ----------
+        t: int
+            Time at which the temperature paramter T is evaluated.
+
+        Returns
+        -------
+        temp: float
+            Temperature parameter at time t.
+        """
+        # Evaluate in the same way as a precomputed table, so that the
+        # values are exactly equal
+        temp = float(self.evaluate_many([t])[0])
+
+        return temp
+
+    def evaluate_many(self, t):
+        """Evaluate the temperature parameter at several times at once.
+
+        Parameters
+        ----------
+        t: array
+            Numpy array of times at which the temperature parameter T is
+            evaluated.
+
+        Returns
+        -------
+        temps: array
+            Numpy array containing the temperature parameter at each time.
+        """
+        temps = np.multiply(-1.0*self.exp_const, np.asarray(t, dtype=float))
+        np.exp(temps, out=temps)
+        temps *= self.init_temp
+
+        return np.maximum(temps, self.min_temp, out=temps)
+
+    def get_floor_iter(self):
+        """Return the first time at which the temperature parameter reaches
+        its minimum value.
+
+        Returns
+        -------
+        floor_iter: int
+            First time at which T equals min_temp.
+        """
+        return _floor_iter(self, np.log(self.init_temp/self.min_temp)
+                           / self.exp_const)
+
+    def get_table(self, start=0, max_iters=np.inf):
+        """Precompute the temperature parameter at up to :code:`TABLE_CHUNK`
+        consecutive times, for the annealing loop to look up.
+
+        Parameters
+        ----------
+        start: int, default: 0
+            First time to evaluate.
+        max_iters: int, default: np.inf
+            Time at which to stop evaluating.
+
+        Returns
+        -------
+        table: array
+            Numpy array containing T at times start, start + 1, ..., ending
+            early at the time T reaches its minimum value, after which T
+            does not change.
+        """
+        return _temp_table(self, start, max_iters)
+
+
+class CustomSchedule:
+    """Class for generating your own temperature schedule.
+
+    Parameters
+    ----------
+    schedule: callable
+        Function for calculating the temperature at time t with the signature
+        :code:`schedule(t, **kwargs)`.
+
+    kwargs: additional arguments
+        Additional parameters to be passed to schedule.
+
+    Example
+    -------
+    .. highlight:: python
+    .. code-block:: python
+
+       >>> import mlrose
+       >>> def custom(t, c): return t + c
+       >>> kwargs = {'c': 10}
+       >>> schedule = mlrose.CustomSchedule(custom, **kwargs)
+       >>> schedule.evaluate(5)
+       15
+
+    Note
+    ----
+    A custom schedule has no precomputed table, since the function may be
+    expensive or never settle at a constant value, so the annealing loop
+    evaluates it at every iteration.
+    """
+
+    def __init__(self, schedule, **kwargs):
+
+        self.schedule = schedule
+        self.kwargs = kwargs
+
+    def evaluate(self, t):
+        """Evaluate the temperature parameter at time t.
+
+        Parameters
+        ----------
+        t: int
+            Time at which the temperature paramter T is evaluated.
+
+        Returns
+        -------
+        temp: float
+            Temperature parameter at time t.
+        """
+        temp = self.schedule(t=t, **self.kwargs)
+
+        return temp
+
+    def evaluate_many(self, t):
+        """Evaluate the temperature parameter at several times, by calling
+        the schedule function at each time.
+
+        Parameters
+        ----------
+        t: array
+            Numpy array of times at which the temperature parameter T is
+            evaluated.
+
+        Returns
+        -------
+        temps: array
+            Numpy array containing the temperature parameter at each time.
+        """
+        temps = np.array([self.evaluate(step) for step in np.ravel(t)],
+                         dtype=float)
+
+        return np.reshape(temps, np.shape(t))
+
+
+class AdaptiveDecay:
+    """
+    Schedule that adapts the simulated annealing temperature parameter T to
+    the progress of the search, rather than decaying it as a fixed function
+    of time.
+
+    The iterations are divided into windows. At the end of each window, T is
+    rescaled so that the proportion of worsening moves accepted approaches a
+    target acceptance ratio, which decays geometrically from one window to
+    the next:
+
+    .. math::
+
+        T_{k+1} = \\max(T_{k} \\times \\frac{\\log a_{k}}{\\log \\alpha_{k}},
+        T_{min}), \\quad \\alpha_{k} = \\alpha_{0} \\times d^{k}
+
+    where:
+
+    * :math:`a_{k}` is the acceptance ratio of worsening moves in window k;
+    * :math:`\\alpha_{0}` is the initial target acceptance ratio;
+    * :math:`d` is the decay rate of the target; and
+    * :math:`T_{min}` is the minimum temperature value.
+
+    The change in T is limited to a factor of 2 per window. If the best
+    fitness has not improved for `patience` windows, the search is reheated
+    to the temperature and target at which the best fitness was last
+    improved.
+
+    Parameters
+    ----------
+    init_temp: float, default: None
+        Initial value of temperature parameter T. Must be greater than 0. If
+        :code:`None`, every move is accepted for the first window, and T is
+        then set to the standard deviation of the fitness over that window.
+    init_accept: float, default: 0.5
+        Initial target acceptance ratio of worsening moves. Must be between
+        0 and 1.
+    accept_decay: float, default: 0.9
+        Rate at which the target acceptance ratio decays per window, d. Must
+        be between 0 and 1.
+    window: int, default: 100
+        Number of iterations between adjustments of T.
+    patience: int, default: 10
+        Number of windows without an improvement in the best fitness after
+        which the search is reheated. If :code:`None`, the search is never
+        reheated.
+    min_temp: float, default: 0.001
+        Minimum value of temperature parameter. Must be greater than 0.
+
+    Example
+    -------
+    .. highlight:: python
+    .. code-block:: python
+
+       >>> import mlrose
+       >>> schedule = mlrose.AdaptiveDecay(init_accept=0.5, window=50)
+       >>> best_state, best_fitness = mlrose.simulated_annealing(
+       ...     problem, schedule=schedule, max_attempts=1000)
+
+    Note
+    ----
+    The schedule is updated by :code:`simulated_annealing` after every
+    iteration, through its :code:`update` method, and is reset at the start
+    of each run. The search only reheats while it keeps running, so
+    max_attempts should allow for at least `patience` windows without an
+    accepted move.
+    """
+
+    def __init__(self, init_temp=None, init_accept=0.5, accept_decay=0.9,
+                 window=100, patience=10, min_temp=0.001):
+
+        if init_temp is not None and init_temp <= 0:
+            raise Exception("""init_temp must be None or greater than 0.""")
+
+        if (init_accept <= 0) or (init_accept >= 1):
+            raise Exception("""init_accept must be between 0 and 1.""")
+
+        if (accept_decay <= 0) or (accept_decay > 1):
+            raise Exception("""accept_decay must be between 0 and 1.""")
+
+        if (not isinstance(window, int) and not window.is_integer()) \
+                or (window <= 0):
+            raise Exception("""window must be a positive integer.""")
+
+        if patience is not None and (
+                (not isinstance(patience, int) and not patience.is_integer())
+                or (patience <= 0)):
+            raise Exception("""patience must be None or a positive"""
+                            + """ integer.""")
+
+        if min_temp <= 0:
+            raise Exception("""min_temp must be greater than 0.""")
+        elif init_temp is not None and min_temp > init_temp:
+            raise Exception("""init_temp must be greater than min_temp.""")
+
+        self.init_temp = init_temp
+        self.init_accept = init_accept
+        self.accept_decay = accept_decay
+        self.window = int(window)
+        self.patience = None if patience is None else int(patience)
+        self.min_temp = min_temp
+        self.reset()
+
+    def reset(self):
+        """Return the schedule to its initial state, ready for a new run."""
+        # Temperature and target acceptance ratio
+        if self.init_temp is None:
+            self.temp = np.inf
+        else:
+            self.temp = self.init_temp
+
+        self.target = self.init_accept
+
+        # Best fitness found, and the temperature and target when it was
+        # found, for reheating
+        self.best_fitness = -np.inf
+        self.best_temp = self.temp
+        self.best_target = self.target
+        self.stalled = 0
+
+        # Statistics of the current window
+        self.steps = 0
+        self.worse = 0
+        self.worse_accepted = 0
+        self.fitness_mean = 0.0
+        self.fitness_m2 = 0.0
+
+    def evaluate(self, t):
+        """Evaluate the temperature parameter at time t.
+
+        Parameters
+        ----------
+        t: int
+            Time at which the temperature paramter T is evaluated. Not used,
+            since T only depends on the updates made so far.
+
+        Returns
+        -------
+        temp: float
+            Temperature parameter at time t.
+        """
+        return self.temp
+
+    def update(self, delta_e, accepted, fitness):
+        """Record the outcome of an annealing iteration, and adjust the
+        temperature parameter at the end of each window.
+
+        Parameters
+        ----------
+        delta_e: float
+            Change in fitness that the move would have made.
+        accepted: bool
+            Whether the move was accepted.
+        fitness: float
+            Fitness of the current state after the iteration.
+        """
+        self.steps += 1
+
+        if delta_e < 0:
+            self.worse += 1
+
+            if accepted:
+                self.worse_accepted += 1
+
+        # Update running mean and variance of the fitness
+        change = fitness - self.fitness_mean
+        self.fitness_mean += change/self.steps
+        self.fitness_m2 += change*(fitness - self.fitness_mean)
+
+        if fitness > self.best_fitness:
+            self.best_fitness = fitness
+            self.best_temp = self.temp
+            self.best_target = self.target
+            self.stalled = 0
+
+        if self.steps == self.window:
+            self.end_window()
+
+    def end_window(self):
+        """Adjust the temperature parameter from the statistics of the window
+        just ended, and start a new window.
+        """
+        if self.temp == np.inf:
+            # Initial temperature is the standard deviation of the fitness
+            # during a random walk
+            self.temp = max(np.sqrt(self.fitness_m2/self.steps),
+                            self.min_temp)
+            self.best_temp = self.temp
+
+        else:
+            if self.worse > 0:
+                # Smooth the acceptance ratio, so that it is never 0 or 1
+                ratio = (self.worse_accepted + 0.5)/(self.worse + 1)
+                factor = np.log(ratio)/np.log(self.target)
+                factor = min(max(factor, 0.5), 2.0)
+
+                self.temp = max(self.temp*factor, self.min_temp)
+
+            self.target *= self.accept_decay
+            self.stalled += 1
+
+            # Reheat after stagnation
+            if self.patience is not None and self.stalled >= self.patience:
+                self.temp = self.best_temp
+                self.target = self.best_target
+                self.stalled = 0
+
+        self.steps = 0
+        self.worse = 0
+        self.worse_accepted = 0
+        self.fitness_mean = 0.0
+        self.fitness_m2 = 0.0
+
+    def get_state(self):
+        """Return the current state of the schedule, e.g. for saving to a
+        checkpoint.
+
+        Returns
+        -------
+        state: dict
+            Dictionary of the schedule's variables.
+        """
+        return {'temp': self.temp,
+                'target': self.target,
+                'best_fitness': self.best_fitness,
+                'best_temp': self.best_temp,
+                'best_target': self.best_target,
+                'stalled': self.stalled,
+                'steps': self.steps,
+                'worse': self.worse,
+                'worse_accepted': self.worse_accepted,
+                'fitness_mean': self.fitness_mean,
+                'fitness_m2': self.fitness_m2}
+
+    def set_state(self, state):
+        """Restore a state of the schedule returned by :code:`get_state`.
+
+        Parameters
+        ----------
+        state: dict
+            Dictionary of the schedule's variables.
+        """
+        for key, value in state.items():
+            setattr(self, key, value)
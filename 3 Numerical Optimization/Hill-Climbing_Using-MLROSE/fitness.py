@@ -2,6 +2,35 @@
 
 
 import numpy as np
+from scipy.spatial import cKDTree
+
+
+# Number of set bits in each possible byte value
+BIT_COUNTS = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def count_bits(packed):
+    """Count the set bits in each row of a packed bit array.
+
+    Parameters
+    ----------
+    packed: array
+        Array of dtype uint8, as produced by :code:`np.packbits`. Either 1-D
+        (a single packed state) or 2-D (one packed state per row).
+
+    Returns
+    -------
+    counts: int or array
+        Number of set bits in packed, or in each row of packed.
+    """
+    packed = np.asarray(packed)
+
+    if packed.dtype != np.uint8:
+        raise Exception("""packed must be an array of dtype uint8.""")
+
+    counts = np.sum(BIT_COUNTS[packed], axis=-1, dtype=np.int64)
+
+    return counts
 
 
 class OneMax:
@@ -23,6 +52,11 @@ class OneMax:
         >>> state = np.array([0, 1, 0, 1, 1, 1, 1])
         >>> fitness.evaluate(state)
         5
+        >>> states = np.array([[0, 1, 0, 1, 1, 1, 1], [1, 1, 1, 0, 0, 0, 0]])
+        >>> fitness.evaluate_many(states)
+        array([5, 3])
+        >>> fitness.evaluate_packed(np.packbits(states, axis=1))
+        array([5, 3])
 
     Note
     -----
@@ -51,6 +85,43 @@ class OneMax:
         fitness = np.sum(state)
         return fitness
 
+    def evaluate_many(self, states):
+        """Evaluate the fitness of several state vectors.
+
+        Parameters
+        ----------
+        states: array
+            2-D array containing one state vector per row.
+
+        Returns
+        -------
+        fitness: array
+            1-D array containing the fitness of each state vector.
+        """
+        fitness = np.sum(states, axis=1)
+        return fitness
+
+    def evaluate_packed(self, packed):
+        """Evaluate the fitness of bit-string state vectors stored as packed
+        bits, by counting set bits with a lookup table.
+
+        Parameters
+        ----------
+        packed: array
+            Array of dtype uint8 produced by :code:`np.packbits` from a single
+            bit-string state vector (1-D) or from a population of them with
+            :code:`axis=1` (2-D). Padding bits must be zero, as produced by
+            :code:`np.packbits`.
+
+        Returns
+        -------
+        fitness: int or array
+            Fitness of the state vector, or 1-D array containing the fitness
+            of each row.
+        """
+        fitness = count_bits(packed)
+        return fitness
+
     def get_prob_type(self):
         """ Return the problem type.
 
@@ -80,6 +151,11 @@ class FlipFlop:
         >>> state = np.array([0, 1, 0, 1, 1, 1, 1])
         >>> fitness.evaluate(state)
         3
+        >>> states = np.array([[0, 1, 0, 1, 1, 1, 1], [1, 0, 1, 0, 1, 0, 1]])
+        >>> fitness.evaluate_many(states)
+        array([3, 6])
+        >>> fitness.evaluate_packed(np.packbits(states, axis=1), 7)
+        array([3, 6])
 
     Note
     ----
@@ -104,12 +180,87 @@ class FlipFlop:
         fitness: float
             Value of fitness function.
         """
+        fitness = self.evaluate_trusted(np.asarray(state))
 
-        fitness = 0
+        return fitness
 
-        for i in range(1, len(state)):
-            if state[i] != state[i - 1]:
-                fitness += 1
+    def evaluate_trusted(self, state):
+        """Evaluate the fitness of a state vector without converting it to an
+        array.
+
+        Parameters
+        ----------
+        state: array
+            Numpy array containing state vector for evaluation.
+
+        Returns
+        -------
+        fitness: float
+            Value of fitness function.
+        """
+        fitness = np.count_nonzero(state[1:] != state[:-1])
+
+        return fitness
+
+    def evaluate_many(self, states):
+        """Evaluate the fitness of several state vectors.
+
+        Parameters
+        ----------
+        states: array
+            2-D array containing one state vector per row.
+
+        Returns
+        -------
+        fitness: array
+            1-D array containing the fitness of each state vector.
+        """
+        states = np.asarray(states)
+        fitness = np.count_nonzero(states[:, 1:] != states[:, :-1], axis=1)
+
+        return fitness
+
+    def evaluate_packed(self, packed, length):
+        """Evaluate the fitness of bit-string state vectors stored as packed
+        bits. Each packed state is XORed with a copy of itself shifted by one
+        bit, and the set bits of the result are counted with a lookup table.
+
+        Parameters
+        ----------
+        packed: array
+            Array of dtype uint8 produced by :code:`np.packbits` from a single
+            bit-string state vector (1-D) or from a population of them with
+            :code:`axis=1` (2-D).
+        length: int
+            Number of bits in each (unpacked) state vector.
+
+        Returns
+        -------
+        fitness: int or array
+            Fitness of the state vector, or 1-D array containing the fitness
+            of each row.
+        """
+        packed = np.asarray(packed)
+
+        if packed.dtype != np.uint8:
+            raise Exception("""packed must be an array of dtype uint8.""")
+
+        n_bytes = np.shape(packed)[-1]
+
+        if (length < 1) or (length > 8*n_bytes) \
+           or (length <= 8*(n_bytes - 1)):
+            raise Exception("""length does not match the number of packed"""
+                            + """ bytes.""")
+
+        # Shift each packed state left by one bit, carrying the leading bit
+        # of each byte from the byte that follows it
+        shifted = packed << np.uint8(1)
+        shifted[..., :-1] |= packed[..., 1:] >> np.uint8(7)
+
+        # Only compare the (length - 1) pairs of consecutive bits
+        mask = np.packbits(np.arange(8*n_bytes) < length - 1)
+
+        fitness = count_bits((packed ^ shifted) & mask)
 
         return fitness
 
@@ -596,6 +747,24 @@ class Knapsack:
             raise Exception("""The state array must be the same size as the"""
                             + """ weight and values arrays.""")
 
+        fitness = self.evaluate_trusted(state)
+
+        return fitness
+
+    def evaluate_trusted(self, state):
+        """Evaluate the fitness of a state vector without validating it.
+
+        Parameters
+        ----------
+        state: array
+            State array for evaluation. Assumed to be the same length as the
+            weights and values arrays.
+
+        Returns
+        -------
+        fitness: float
+            Value of fitness function.
+        """
         # Calculate total weight and value of knapsack
         total_weight = np.sum(state*self.weights)
         total_value = np.sum(state*self.values)
@@ -680,11 +849,13 @@ class TravellingSales:
 
         elif coords is not None:
             self.is_coords = True
+            coord_array = np.asarray(coords, dtype=float)
             path_list = []
             dist_list = []
 
         else:
             self.is_coords = False
+            coord_array = None
 
             # Remove any duplicates from list
             distances = list({tuple(sorted(dist[0:2]) + [dist[2]])
@@ -707,6 +878,7 @@ class TravellingSales:
             path_list = list(zip(node1_list, node2_list))
 
         self.coords = coords
+        self.coord_array = coord_array
         self.distances = distances
         self.path_list = path_list
         self.dist_list = dist_list
@@ -742,6 +914,33 @@ class TravellingSales:
             raise Exception("""All elements of state must be less than"""
                             + """ len(state).""")
 
+        fitness = self.evaluate_trusted(state)
+
+        return fitness
+
+    def evaluate_trusted(self, state):
+        """Evaluate the fitness of a state vector without validating it.
+
+        Parameters
+        ----------
+        state: array
+            State array for evaluation. Assumed to contain each integer
+            between 0 and (len(state) - 1), inclusive, exactly once.
+
+        Returns
+        -------
+        fitness: float
+            Value of fitness function. Returns :code:`np.inf` if travel between
+            two consecutive nodes on the tour is not possible.
+        """
+        if self.is_coords:
+            # Calculate length of every leg of journey, including final leg
+            legs = self.coord_array[state] - self.coord_array[np.roll(state,
+                                                                      -1)]
+            fitness = np.sum(np.sqrt(np.sum(legs**2, axis=1)))
+
+            return fitness
+
         fitness = 0
 
         # Calculate length of each leg of journey
@@ -788,6 +987,45 @@ class TravellingSales:
         """
         return self.prob_type
 
+    def nearest_nodes(self, k):
+        """Find the k nearest nodes to every node, using a KD-tree built
+        from coords.
+
+        Parameters
+        ----------
+        k: int
+            Number of nearest nodes to find for each node. Must be less than
+            the number of nodes.
+
+        Returns
+        -------
+        nearest: array
+            Numpy array of shape (number of nodes, k), where row i lists the
+            k nodes closest to node i, ordered from nearest to furthest.
+        """
+        if not self.is_coords:
+            raise Exception("""nearest_nodes requires coords to be"""
+                            + """ specified.""")
+
+        n_nodes = len(self.coord_array)
+
+        if (not isinstance(k, int) and not k.is_integer()) or (k < 1) \
+           or (k >= n_nodes):
+            raise Exception("""k must be a positive integer less than the"""
+                            + """ number of nodes.""")
+
+        k = int(k)
+        tree = cKDTree(self.coord_array)
+        _, nearest = tree.query(self.coord_array, k=k + 1)
+
+        # Drop each node from its own list. If duplicate coordinates push a
+        # node out of its own k + 1 nearest, drop the furthest node instead.
+        is_self = nearest == np.arange(n_nodes).reshape([-1, 1])
+        is_self[~np.any(is_self, axis=1), -1] = True
+        nearest = np.reshape(nearest[~is_self], [n_nodes, k])
+
+        return nearest
+
 
 class Queens:
     """Fitness function for N-Queens optimization problem. Evaluates the
@@ -955,6 +1193,11 @@ class CustomFitness:
         Specifies problem type as 'discrete', 'continuous', 'tsp' or 'either'
         (denoting either discrete or continuous).
 
+    vectorized: bool, default: False
+        Whether fitness_fn operates on a batch of states. If :code:`True`,
+        fitness_fn is passed a 2-D array with one state per row and must
+        return a 1-D array containing the fitness of each row.
+
     kwargs: additional arguments
         Additional parameters to be passed to the fitness function.
 
@@ -971,14 +1214,25 @@ class CustomFitness:
         >>> state = np.array([1, 2, 3, 4, 5])
         >>> fitness.evaluate(state)
         150
+        >>> def cust_fn_vec(states, c): return c*np.sum(states, axis=1)
+        >>> fitness_vec = mlrose.CustomFitness(cust_fn_vec, vectorized=True,
+                                               **kwargs)
+        >>> fitness_vec.evaluate_many(np.array([[1, 2], [3, 4]]))
+        array([30, 70])
     """
 
-    def __init__(self, fitness_fn, problem_type='either', **kwargs):
+    def __init__(self, fitness_fn, problem_type='either', vectorized=False,
+                 **kwargs):
 
         if problem_type not in ['discrete', 'continuous', 'tsp', 'either']:
             raise Exception("""problem_type does not exist.""")
+
+        if not isinstance(vectorized, bool):
+            raise Exception("""vectorized must be True or False.""")
+
         self.fitness_fn = fitness_fn
         self.problem_type = problem_type
+        self.vectorized = vectorized
         self.kwargs = kwargs
 
     def evaluate(self, state):
@@ -994,8 +1248,38 @@ class CustomFitness:
         fitness: float
             Value of fitness function.
         """
+        if self.vectorized:
+            states = np.reshape(state, [1, -1])
+            fitness = self.fitness_fn(states, **self.kwargs)[0]
+        else:
+            fitness = self.fitness_fn(state, **self.kwargs)
+
+        return fitness
+
+    def evaluate_many(self, states):
+        """Evaluate the fitness of several state vectors.
+
+        Parameters
+        ----------
+        states: array
+            2-D array containing one state vector per row.
+
+        Returns
+        -------
+        fitness: array
+            1-D array containing the fitness of each state vector.
+        """
+        if self.vectorized:
+            fitness = np.asarray(self.fitness_fn(np.asarray(states),
+                                                 **self.kwargs))
+
+            if fitness.shape != (len(states),):
+                raise Exception("""fitness_fn must return one fitness value"""
+                                + """ per state.""")
+        else:
+            fitness = np.array([self.fitness_fn(state, **self.kwargs)
+                                for state in states])
 
-        fitness = self.fitness_fn(state, **self.kwargs)
         return fitness
 
     def get_prob_type(self):
@@ -0,0 +1,128 @@
+""" Neural network loss functions."""
+
+
+import numpy as np
+
+# Predicted probabilities are clipped to [EPS, 1 - EPS] before taking logs
+EPS = np.finfo(np.float64).eps
+
+
+def binary_cross_entropy(y_true, y_pred):
+    """Binary cross-entropy (log loss) for a single output column of
+    predicted probabilities of class 1.
+
+    Parameters
+    ----------
+    y_true: array
+        2D array of true labels, with one column.
+
+    y_pred: array
+        Array of predicted probabilities, with the same shape as y_true, or
+        a 3D array stacking several such arrays along its first axis.
+
+    Returns
+    -------
+    loss: float or array
+        Mean loss over the observations, calculated in float64. If y_pred is
+        3D, a 1D array giving the loss of each of its 2D arrays.
+    """
+    y_pred = np.asarray(y_pred, dtype=np.float64)
+
+    log_p = np.log(np.clip(y_pred, EPS, 1 - EPS))
+    log_q = np.log(np.clip(1 - y_pred, EPS, 1 - EPS))
+
+    # Combine log(p) and log(1 - p) in place, weighted by the labels
+    log_p *= y_true
+    log_q *= 1 - y_true
+    log_p += log_q
+
+    loss = -np.sum(log_p, axis=(-2, -1))/np.shape(y_pred)[-2]
+
+    return loss
+
+
+def categorical_cross_entropy(y_true, y_pred):
+    """Categorical cross-entropy (log loss) for one-hot encoded labels and
+    predicted class probabilities.
+
+    Parameters
+    ----------
+    y_true: array
+        2D array of one-hot encoded true labels.
+
+    y_pred: array
+        Array of predicted probabilities, with the same shape as y_true, or
+        a 3D array stacking several such arrays along its first axis.
+
+    Returns
+    -------
+    loss: float or array
+        Mean loss over the observations, calculated in float64. If y_pred is
+        3D, a 1D array giving the loss of each of its 2D arrays.
+    """
+    log_probs = np.clip(np.asarray(y_pred, dtype=np.float64), EPS, 1 - EPS)
+    np.log(log_probs, out=log_probs)
+    log_probs *= y_true
+
+    loss = -np.sum(log_probs, axis=(-2, -1))/np.shape(y_pred)[-2]
+
+    return loss
+
+
+def softmax_cross_entropy(y_true, outputs):
+    """Categorical cross-entropy of the softmax of the output layer values,
+    calculated from the log-softmax without forming the probabilities or
+    clipping them.
+
+    Parameters
+    ----------
+    y_true: array
+        2D array of one-hot encoded true labels.
+
+    outputs: array
+        Array of output layer values before the softmax is applied, with the
+        same shape as y_true, or a 3D array stacking several such arrays
+        along its first axis.
+
+    Returns
+    -------
+    loss: float or array
+        Mean loss over the observations, calculated in float64. If outputs
+        is 3D, a 1D array giving the loss of each of its 2D arrays.
+    """
+    shifted = np.asarray(outputs, dtype=np.float64) \
+        - np.max(outputs, axis=-1, keepdims=True)
+    log_sums = np.log(np.sum(np.exp(shifted), axis=-1))
+
+    # log(softmax) = shifted - log_sums, so the loss of each observation is
+    # sum(y_true*log_sums) - sum(y_true*shifted)
+    loss = (np.sum(log_sums*np.sum(y_true, axis=-1), axis=-1)
+            - np.sum(shifted*y_true, axis=(-2, -1)))/np.shape(outputs)[-2]
+
+    return loss
+
+
+def mean_squared_error(y_true, y_pred):
+    """Mean squared error over all observations and outputs.
+
+    Parameters
+    ----------
+    y_true: array
+        2D array of true values.
+
+    y_pred: array
+        Array of predicted values, with the same shape as y_true, or a 3D
+        array stacking several such arrays along its first axis.
+
+    Returns
+    -------
+    loss: float or array
+        Mean squared error, calculated in float64. If y_pred is 3D, a 1D
+        array giving the loss of each of its 2D arrays.
+    """
+    errors = np.subtract(y_pred, y_true, dtype=np.float64)
+    np.square(errors, out=errors)
+
+    loss = np.mean(errors, axis=(-2, -1))
+
+    return loss
@@ -0,0 +1,511 @@
+""" Micro-benchmarks for the fitness functions and optimization problem
+primitives.
+
+Run from the command line with, for example::
+
+    python -m mlrose.microbench --output baseline.json
+    python -m mlrose.microbench --baseline baseline.json
+
+Timings depend on the machine and how busy it is, so a baseline should be
+recorded on the same machine as the timings it is compared with, shortly
+before them, with the default settings. A reference baseline for the
+default cases, recorded with the default settings on the machine described
+in its :code:`meta` section, is stored with this module as
+:code:`microbench_baseline.json`, and is used if :code:`--baseline` is
+given without a path. To replace it after a deliberate change in
+performance, run::
+
+    python -m mlrose.microbench --output mlrose/microbench_baseline.json
+"""
+
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from .benchmark import _environment
+from .fitness import (OneMax, FlipFlop, FourPeaks, SixPeaks, ContinuousPeaks,
+                      Knapsack, TravellingSales, Queens, MaxKColor)
+from .opt_probs import DiscreteOpt, TSPOpt
+
+
+DEFAULT_LENGTHS = [10, 30, 50]
+DEFAULT_MAX_VALS = [2, 4, 8]
+
+# Population size and proportion kept for the MIMIC primitives
+POP_SIZE = 100
+KEEP_PCT = 0.2
+
+# Reference baseline stored with this module
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                'microbench_baseline.json')
+
+# Minimum loop time and number of loops for timings compared with a
+# baseline, below which differences are mostly noise
+MIN_COMPARE_TIME = 0.05
+MIN_COMPARE_REPEAT = 5
+
+
+def _evaluate_case(fitness, states):
+    """Return a function evaluating a fitness function on each of a list of
+    states in turn."""
+    evaluate = fitness.evaluate
+    count = len(states)
+    index = [0]
+
+    def run():
+        evaluate(states[index[0] % count])
+        index[0] += 1
+
+    return run
+
+
+def _fitness_cases(length, max_val, rng):
+    """Generate the fitness function cases for one length and max_val.
+
+    Parameters
+    ----------
+    length: int
+        Length of state vectors.
+    max_val: int
+        Number of unique values that each state element can take.
+    rng: RandomState
+        Random number generator used to generate the instances and states.
+
+    Returns
+    -------
+    cases: list of tuples
+        List of (name, function) pairs.
+    """
+    states = rng.randint(max_val, size=(100, length))
+    cases = []
+
+    # Bit string fitness functions are only defined for binary states
+    if max_val == 2:
+        for fitness in [OneMax(), FlipFlop(), FourPeaks(), SixPeaks(),
+                        ContinuousPeaks()]:
+            cases.append(('%s.evaluate' % (type(fitness).__name__,),
+                          _evaluate_case(fitness, states)))
+
+    weights = rng.randint(1, 50, size=length)
+    values = rng.randint(1, 50, size=length)
+    cases.append(('Knapsack.evaluate',
+                  _evaluate_case(Knapsack(weights, values), states)))
+
+    edges = {tuple(sorted(edge)) for edge in rng.randint(length,
+                                                         size=(2*length, 2))
+             if edge[0] != edge[1]}
+    cases.append(('MaxKColor.evaluate',
+                  _evaluate_case(MaxKColor(sorted(edges)), states)))
+
+    return cases
+
+
+def _permutation_cases(length, rng):
+    """Generate the cases for problems with states that are permutations,
+    where max_val is the length.
+
+    Parameters
+    ----------
+    length: int
+        Length of state vectors.
+    rng: RandomState
+        Random number generator used to generate the instances and states.
+
+    Returns
+    -------
+    cases: list of tuples
+        List of (name, function) pairs.
+    """
+    states = [rng.permutation(length) for _ in range(100)]
+    coords = [tuple(c) for c in rng.rand(length, 2)]
+    fitness = TravellingSales(coords=coords)
+    cases = [('Queens.evaluate', _evaluate_case(Queens(), states)),
+             ('TravellingSales.evaluate', _evaluate_case(fitness, states))]
+
+    # Fit MIMIC probability model, so that samples can be drawn from it
+    problem = TSPOpt(length, fitness)
+    problem.random_pop(POP_SIZE)
+    problem.find_top_pct(KEEP_PCT)
+    problem.eval_node_probs()
+    problem.find_sample_order()
+    cases.append(('TSPOpt.random_mimic', problem.random_mimic))
+
+    return cases
+
+
+def _problem_cases(length, max_val, rng):
+    """Generate the DiscreteOpt primitive cases for one length and max_val.
+
+    Parameters
+    ----------
+    length: int
+        Length of state vectors.
+    max_val: int
+        Number of unique values that each state element can take.
+    rng: RandomState
+        Random number generator used to generate the instances and states.
+
+    Returns
+    -------
+    cases: list of tuples
+        List of (name, function) pairs.
+    """
+    problem = DiscreteOpt(length, OneMax(), max_val=max_val)
+    problem.reset()
+    problem.random_pop(POP_SIZE)
+    problem.find_top_pct(KEEP_PCT)
+    problem.eval_node_probs()
+
+    parent_1, parent_2 = problem.get_population()[:2]
+
+    return [('DiscreteOpt.find_neighbors', problem.find_neighbors),
+            ('DiscreteOpt.random_neighbor', problem.random_neighbor),
+            ('DiscreteOpt.reproduce',
+             lambda: problem.reproduce(parent_1, parent_2, 0.1,
+                                       trusted=True)),
+            ('DiscreteOpt.eval_node_probs', problem.eval_node_probs),
+            ('DiscreteOpt.sample_pop', lambda: problem.sample_pop(POP_SIZE))]
+
+
+def make_cases(lengths=None, max_vals=None, seed=1):
+    """Generate the micro-benchmark cases.
+
+    Parameters
+    ----------
+    lengths: list of ints, default: None
+        Lengths of state vectors. If :code:`None`, :code:`DEFAULT_LENGTHS`
+        is used.
+    max_vals: list of ints, default: None
+        Numbers of unique values that each state element can take. If
+        :code:`None`, :code:`DEFAULT_MAX_VALS` is used. Cases on
+        permutations (Queens, TravellingSales and TSPOpt) use the length
+        instead.
+    seed: int, default: 1
+        Seed used to generate the instances and states.
+
+    Returns
+    -------
+    cases: list of dicts
+        List of cases, each with keys :code:`name`, :code:`length`,
+        :code:`max_val` and :code:`run`, a function of no arguments that
+        calls the primitive once.
+    """
+    if lengths is None:
+        lengths = DEFAULT_LENGTHS
+
+    if max_vals is None:
+        max_vals = DEFAULT_MAX_VALS
+
+    cases = []
+
+    for length in lengths:
+        # Seed the global generator too, which the problem objects use
+        np.random.seed(seed)
+        rng = np.random.RandomState(seed)
+
+        for name, run in _permutation_cases(length, rng):
+            cases.append({'name': name, 'length': length, 'max_val': length,
+                          'run': run})
+
+        for max_val in max_vals:
+            for name, run in (_fitness_cases(length, max_val, rng)
+                              + _problem_cases(length, max_val, rng)):
+                cases.append({'name': name, 'length': length,
+                              'max_val': max_val, 'run': run})
+
+    return sorted(cases, key=lambda case: (case['name'], case['length'],
+                                           case['max_val']))
+
+
+def time_case(run, repeat=5, min_time=0.05):
+    """Time a function of no arguments.
+
+    The function is called in a loop, with the number of calls chosen so
+    that each loop takes at least min_time seconds, and the loop is timed
+    repeat times.
+
+    Parameters
+    ----------
+    run: callable
+        Function to time.
+    repeat: int, default: 5
+        Number of timed loops.
+    min_time: float, default: 0.05
+        Minimum time of each loop in seconds.
+
+    Returns
+    -------
+    timing: dict
+        Dictionary with keys :code:`number` (calls per loop), :code:`best`
+        and :code:`median` (time per call in seconds, over the loops).
+    """
+    # Find number of calls per loop, which also warms up the function
+    number = 1
+
+    while True:
+        start = time.perf_counter()
+
+        for _ in range(number):
+            run()
+
+        elapsed = time.perf_counter() - start
+
+        if elapsed >= min_time:
+            break
+
+        number = max(2*number, int(1.2*number*min_time/max(elapsed, 1e-9)))
+
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+
+        for _ in range(number):
+            run()
+
+        times.append((time.perf_counter() - start)/number)
+
+    return {'number': number,
+            'best': min(times),
+            'median': float(np.median(times))}
+
+
+def run_microbenchmarks(lengths=None, max_vals=None, names=None, repeat=5,
+                        min_time=0.05, seed=1, verbose=False):
+    """Time each micro-benchmark case.
+
+    Parameters
+    ----------
+    lengths: list of ints, default: None
+        Lengths of state vectors, as for :code:`make_cases`.
+    max_vals: list of ints, default: None
+        Numbers of unique values of each state element, as for
+        :code:`make_cases`.
+    names: list of strings, default: None
+        Only cases whose names contain one of these strings are timed. If
+        :code:`None`, all cases are timed.
+    repeat: int, default: 5
+        Number of timed loops of each case.
+    min_time: float, default: 0.05
+        Minimum time of each loop in seconds.
+    seed: int, default: 1
+        Seed used to generate the instances and states.
+    verbose: bool, default: False
+        Whether to print each result as it completes.
+
+    Returns
+    -------
+    results: dict
+        Dictionary with keys :code:`meta`, describing the benchmark settings
+        and environment, and :code:`results`, a list of dictionaries with
+        keys :code:`name`, :code:`length`, :code:`max_val` and the keys
+        returned by :code:`time_case`.
+    """
+    if (not isinstance(repeat, int)) or (repeat <= 0):
+        raise Exception("""repeat must be a positive integer.""")
+
+    if min_time <= 0:
+        raise Exception("""min_time must be greater than 0.""")
+
+    results = []
+
+    for case in make_cases(lengths, max_vals, seed):
+        if names is not None and not any(name in case['name']
+                                         for name in names):
+            continue
+
+        result = {'name': case['name'],
+                  'length': case['length'],
+                  'max_val': case['max_val']}
+        result.update(time_case(case['run'], repeat, min_time))
+        results.append(result)
+
+        if verbose:
+            print('%-30s %5d %5d %12.2fus' % (
+                result['name'], result['length'], result['max_val'],
+                1e6*result['best']))
+            sys.stdout.flush()
+
+    meta = _environment()
+    meta['repeat'] = repeat
+    meta['min_time'] = min_time
+    meta['seed'] = seed
+
+    return {'meta': meta, 'results': results}
+
+
+def compare_results(results, baseline, tolerance=0.1):
+    """Compare micro-benchmark timings with baseline timings.
+
+    Parameters
+    ----------
+    results: list of dicts
+        Results, as returned by :code:`run_microbenchmarks`.
+    baseline: list of dicts
+        Baseline results, in the same form. Only cases in both lists are
+        compared.
+    tolerance: float, default: 0.1
+        Relative change treated as noise. Cases more than
+        :code:`1 + tolerance` times slower than the baseline are reported
+        as regressions, and cases more than :code:`1 + tolerance` times
+        faster as improvements.
+
+    Returns
+    -------
+    comparison: list of dicts
+        For each case, a dictionary with keys :code:`name`, :code:`length`,
+        :code:`max_val`, :code:`baseline` and :code:`time` (best times per
+        call), :code:`ratio` (time/baseline) and :code:`status`, one of
+        'regression', 'improvement' or 'same'.
+    """
+    baseline_times = {(row['name'], row['length'], row['max_val']):
+                      row['best'] for row in baseline}
+    comparison = []
+
+    for row in results:
+        case = (row['name'], row['length'], row['max_val'])
+
+        if case not in baseline_times:
+            continue
+
+        ratio = row['best']/baseline_times[case]
+
+        if ratio > 1 + tolerance:
+            status = 'regression'
+        elif ratio < 1/(1 + tolerance):
+            status = 'improvement'
+        else:
+            status = 'same'
+
+        comparison.append({'name': case[0],
+                           'length': case[1],
+                           'max_val': case[2],
+                           'baseline': baseline_times[case],
+                           'time': row['best'],
+                           'ratio': ratio,
+                           'status': status})
+
+    return comparison
+
+
+def format_comparison(comparison):
+    """Format a comparison with baseline timings as a text report.
+
+    Parameters
+    ----------
+    comparison: list of dicts
+        Comparison, as returned by :code:`compare_results`.
+
+    Returns
+    -------
+    report: string
+        Report with a line for each case, followed by the number of
+        regressions and improvements.
+    """
+    lines = ['%-30s %5s %5s %12s %12s %7s' % ('case', 'len', 'vals',
+                                              'baseline', 'time', 'ratio')]
+
+    for row in comparison:
+        lines.append('%-30s %5d %5d %10.2fus %10.2fus %6.2fx%s' % (
+            row['name'], row['length'], row['max_val'],
+            1e6*row['baseline'], 1e6*row['time'], row['ratio'],
+            '' if row['status'] == 'same' else '  ' + row['status'].upper()))
+
+    statuses = [row['status'] for row in comparison]
+    lines.append('%d cases compared: %d regressions, %d improvements' % (
+        len(comparison), statuses.count('regression'),
+        statuses.count('improvement')))
+
+    return '\n'.join(lines)
+
+
+def main(args=None):
+    """Run the micro-benchmarks from the command line.
+
+    Parameters
+    ----------
+    args: list of strings, default: None
+        Command line arguments. If :code:`None`, :code:`sys.argv` is used.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m mlrose.microbench',
+        description='Time the mlrose fitness functions and problem'
+        ' primitives.')
+    parser.add_argument('--lengths', nargs='+', type=int,
+                        help='state vector lengths (default: %s)'
+                        % (' '.join(str(n) for n in DEFAULT_LENGTHS),))
+    parser.add_argument('--max-vals', nargs='+', type=int,
+                        help='values per state element (default: %s)'
+                        % (' '.join(str(n) for n in DEFAULT_MAX_VALS),))
+    parser.add_argument('--names', nargs='+',
+                        help='only time cases whose names contain one of'
+                        ' these strings')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='timed loops per case (default: 5)')
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help='minimum seconds per loop (default: 0.05)')
+    parser.add_argument('--seed', type=int, default=1,
+                        help='seed for instances and states (default: 1)')
+    parser.add_argument('--output', help='path of JSON file for results')
+    parser.add_argument('--baseline', nargs='?', const=DEFAULT_BASELINE,
+                        help='path of JSON results to compare against'
+                        ' (default if no path is given: the reference'
+                        ' baseline stored with this module)')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='relative slowdown reported as a regression'
+                        ' (default: 0.1)')
+    args = parser.parse_args(args)
+
+    # Short or few timing loops make the comparison report noise as
+    # regressions, so check the settings before anything is timed
+    if args.baseline is not None:
+        if args.min_time < MIN_COMPARE_TIME \
+                or args.repeat < MIN_COMPARE_REPEAT:
+            parser.error('--min-time must be at least %g and --repeat at'
+                         ' least %d when comparing with a baseline'
+                         % (MIN_COMPARE_TIME, MIN_COMPARE_REPEAT))
+
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+        if baseline['meta']['min_time'] < MIN_COMPARE_TIME \
+                or baseline['meta']['repeat'] < MIN_COMPARE_REPEAT:
+            parser.error('%s was recorded with --min-time %g and --repeat'
+                         ' %d, but at least %g and %d are needed for a'
+                         ' baseline' % (args.baseline,
+                                        baseline['meta']['min_time'],
+                                        baseline['meta']['repeat'],
+                                        MIN_COMPARE_TIME,
+                                        MIN_COMPARE_REPEAT))
+
+    results = run_microbenchmarks(args.lengths, args.max_vals, args.names,
+                                  args.repeat, args.min_time, args.seed,
+                                  verbose=True)
+
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline is not None:
+        comparison = compare_results(results['results'],
+                                     baseline['results'], args.tolerance)
+        print('\nCompared with %s:' % (args.baseline,))
+
+        if any(baseline['meta'].get(key) != results['meta'][key]
+               for key in ['platform', 'processor', 'python', 'numpy']):
+            print('Note: the baseline was recorded in a different'
+                  ' environment, so differences may not be due to the code.')
+
+        print(format_comparison(comparison))
+
+        if any(row['status'] == 'regression' for row in comparison):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
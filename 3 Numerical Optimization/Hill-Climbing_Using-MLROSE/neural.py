@@ -1,18 +1,36 @@
 """ Classes for defining neural network weight optimization problems."""
 
 
+import json
+import time
 import numpy as np
 from sklearn.base import BaseEstimator, ClassifierMixin, RegressorMixin
-from sklearn.metrics import mean_squared_error, log_loss
 from .activation import identity, relu, sigmoid, softmax, tanh
-from .algorithms import random_hill_climb, simulated_annealing, genetic_alg
+from .loss import (binary_cross_entropy, categorical_cross_entropy,
+                   softmax_cross_entropy, mean_squared_error)
+from .algorithms import (random_hill_climb, simulated_annealing, genetic_alg,
+                         _callback_stop, _load_checkpoint, _save_checkpoint)
 from .opt_probs import ContinuousOpt
+from .checkpoint import _json_default
 from .decay import GeomDecay
 
 from abc import ABCMeta
 from abc import abstractmethod
 from sklearn.externals import six
 
+# Saved networks start with this identifier, followed by the length of the
+# JSON header as a 4 byte little-endian integer, the header and the weights
+SAVED_NETWORK_ID = b'MLROSENN'
+
+# Approximate memory in bytes used by the stacked layer outputs when
+# NetworkWeights.evaluate_many passes several states through the network
+EVALUATE_MANY_BYTES = 2**24
+
+# Maximum number of incremental updates that NetworkWeights chains from the
+# layer values of a state evaluated in full, before evaluating in full again
+# to discard the accumulated rounding error
+INCREMENTAL_REFRESH = 100
+
 
 def flatten_weights(weights):
     """Flatten list of weights arrays into a 1D array.
@@ -27,18 +45,42 @@ def flatten_weights(weights):
     flat_weights: array
         1D weights array.
     """
-    flat_weights = []
-
-    for i in range(len(weights)):
-        flat_weights += list(weights[i].flatten())
+    if len(weights) == 0:
+        return np.array([])
 
-    flat_weights = np.array(flat_weights)
+    flat_weights = np.concatenate([np.ravel(w) for w in weights])
 
     return flat_weights
 
 
-def unflatten_weights(flat_weights, node_list):
-    """Convert 1D weights array into list of 2D arrays.
+def layer_offsets(node_list):
+    """Calculate the positions in the 1D weights array at which the weights
+    of each layer of the network start and end.
+
+    Parameters
+    ----------
+    node_list: list
+        List giving the number of nodes in each layer of the network,
+        including the input and output layers.
+
+    Returns
+    -------
+    offsets: list of ints
+        List of length len(node_list), where the weights of layer i are
+        stored in elements offsets[i] to offsets[i + 1] - 1. The last element
+        is the total number of weights.
+    """
+    offsets = [0]
+
+    for i in range(len(node_list) - 1):
+        offsets.append(offsets[-1] + node_list[i]*node_list[i + 1])
+
+    return offsets
+
+
+def unflatten_weights(flat_weights, node_list, offsets=None):
+    """Convert 1D weights array into list of 2D arrays. The 2D arrays are
+    views of flat_weights, so no weights are copied.
 
     Parameters
     ----------
@@ -49,32 +91,82 @@ def unflatten_weights(flat_weights, node_list):
         List giving the number of nodes in each layer of the network,
         including the input and output layers.
 
+    offsets: list of ints, default: None
+        Layer offsets of node_list, as returned by
+        :code:`layer_offsets(node_list)`. If :code:`None`, they are
+        calculated.
+
     Returns
     -------
     weights: list of arrays
         List of 2D arrays created from flat_weights.
     """
-    nodes = 0
-    for i in range(len(node_list) - 1):
-        nodes += node_list[i]*node_list[i + 1]
+    if offsets is None:
+        offsets = layer_offsets(node_list)
 
-    if len(flat_weights) != nodes:
-        raise Exception("""flat_weights must have length %d""" % (nodes,))
+    if len(flat_weights) != offsets[-1]:
+        raise Exception("""flat_weights must have length %d"""
+                        % (offsets[-1],))
 
     weights = []
-    start = 0
 
     for i in range(len(node_list) - 1):
-        end = start + node_list[i]*node_list[i + 1]
-        weights.append(np.reshape(flat_weights[start:end],
+        weights.append(np.reshape(flat_weights[offsets[i]:offsets[i + 1]],
                                   [node_list[i], node_list[i+1]]))
-        start = end
 
     return weights
 
 
+def _output_activation(node_list, is_classifier):
+    """Get the activation function for the output layer of a network.
+
+    Parameters
+    ----------
+    node_list: list of ints
+        Number of nodes in each layer, including the input and output layers.
+
+    is_classifier: bool
+        Whether the network is for classification or regression.
+
+    Returns
+    -------
+    output_activation: callable
+        Sigmoid for a binary classifier, softmax for a multi-class classifier
+        and identity for regression.
+    """
+    if not is_classifier:
+        return identity
+
+    if node_list[-1] == 1:
+        return sigmoid
+
+    return softmax
+
+
+def _optimizer_values(optimizer):
+    """Get the state of an optimizer as values to save in a checkpoint, with
+    the name of each value prefixed with :code:`optimizer_`.
+
+    Parameters
+    ----------
+    optimizer: optimizer object
+        Optimizer whose state is saved, or :code:`None`.
+
+    Returns
+    -------
+    values: dict
+        Dictionary of checkpoint values, empty if optimizer is :code:`None`.
+    """
+    if optimizer is None:
+        return {}
+
+    return {'optimizer_' + key: value
+            for key, value in optimizer.get_state().items()}
+
+
 def gradient_descent(problem, max_attempts=10, max_iters=np.inf,
-                     init_state=None, random_state=None):
+                     init_state=None, random_state=None, optimizer=None,
+                     callback=None, checkpoint=None):
     """Use gradient_descent to find the optimal neural network weights.
 
     Parameters
@@ -96,6 +188,27 @@ def gradient_descent(problem, max_attempts=10, max_iters=np.inf,
         If random_state is a positive integer, random_state is the seed used
         by np.random.seed(); otherwise, the random seed is not set.
 
+    optimizer: optimizer object, default: None
+        Optimizer used to calculate the weight updates from the gradient,
+        e.g. :code:`mlrose.Adam()`. If :code:`None`, the updates calculated by
+        the problem's :code:`calculate_updates()` method are used.
+
+    callback: callable, default: None
+        Function called at the end of every iteration as
+        :code:`callback(iteration, state, fitness, best_fitness, evals,
+        elapsed)`, with the iteration number, the current state, the current
+        and best fitness values, the number of fitness evaluations so far and
+        the time elapsed in seconds. If it returns :code:`True`, the
+        algorithm stops. If :code:`None`, no callback is used.
+
+    checkpoint: Checkpoint object, default: None
+        Checkpoint to which the algorithm's progress is saved periodically,
+        e.g. :code:`mlrose.Checkpoint('run.ckpt')`. If the checkpoint file
+        already exists, the algorithm resumes from the saved progress. The
+        optimizer's running values are saved with the progress, so the
+        optimizer must have :code:`get_state()` and :code:`set_state()`
+        methods. If :code:`None`, no checkpoint is saved.
+
     Returns
     -------
     best_state: array
@@ -115,27 +228,63 @@ def gradient_descent(problem, max_attempts=10, max_iters=np.inf,
     if init_state is not None and len(init_state) != problem.get_length():
         raise Exception("""init_state must have same length as problem.""")
 
+    if checkpoint is not None and optimizer is not None \
+            and not hasattr(optimizer, 'get_state'):
+        raise Exception("""optimizer must have get_state() and set_state()"""
+                        + """ methods to be used with a checkpoint.""")
+
     # Set random seed
     if isinstance(random_state, int) and random_state > 0:
         np.random.seed(random_state)
 
-    # Initialize problem, time and attempts counter
-    if init_state is None:
-        problem.reset()
+    # Resume from checkpoint, if one has been saved. Otherwise, initialize
+    # problem, time and attempts counter.
+    saved = _load_checkpoint(checkpoint, problem)
+    start_time = time.perf_counter()
+
+    if saved is not None:
+        done = saved['done']
+        attempts = saved['attempts']
+        iters = saved['iters']
+        best_fitness = saved['best_fitness']
+        best_state = saved['best_state']
+        start_time -= saved['elapsed']
+
+        # The gradient is taken from the layer values of the state most
+        # recently evaluated, so evaluate the restored state again, without
+        # counting it in the problem's stats
+        problem.fitness_fn.evaluate(problem.get_state())
+
     else:
-        problem.set_state(init_state)
+        if init_state is None:
+            problem.reset()
+        else:
+            problem.set_state(init_state)
+
+        done = False
+        attempts = 0
+        iters = 0
+        best_fitness = problem.get_maximize()*problem.get_fitness()
+        best_state = problem.get_state()
 
-    attempts = 0
-    iters = 0
+    # Initialize optimizer state, or restore it from the checkpoint
+    if optimizer is not None:
+        optimizer.reset(problem.get_length(), dtype=problem.dtype)
 
-    best_fitness = problem.get_maximize()*problem.get_fitness()
-    best_state = problem.get_state()
+        if saved is not None:
+            optimizer.set_state({key[len('optimizer_'):]: value
+                                 for key, value in saved.items()
+                                 if key.startswith('optimizer_')})
 
-    while (attempts < max_attempts) and (iters < max_iters):
+    while not done and (attempts < max_attempts) and (iters < max_iters):
         iters += 1
 
         # Update weights
-        updates = flatten_weights(problem.calculate_updates())
+        if optimizer is None:
+            updates = problem.calculate_updates(flat=True)
+        else:
+            updates = optimizer.calculate_updates(
+                problem.calculate_gradient())
 
         next_state = problem.update_state(updates)
         next_fitness = problem.eval_fitness(next_state)
@@ -150,6 +299,26 @@ def gradient_descent(problem, max_attempts=10, max_iters=np.inf,
             best_state = next_state
 
         problem.set_state(next_state)
+        problem.log_stats(iters)
+
+        if checkpoint is not None and iters % checkpoint.interval == 0:
+            _save_checkpoint(checkpoint, problem, start_time, done=False,
+                             attempts=attempts, iters=iters,
+                             best_fitness=best_fitness,
+                             best_state=np.asarray(best_state),
+                             **_optimizer_values(optimizer))
+
+        if callback is not None and _callback_stop(
+                callback, problem, iters, problem.get_maximize()*best_fitness,
+                start_time):
+            break
+
+    if checkpoint is not None:
+        _save_checkpoint(checkpoint, problem, start_time, done=True,
+                         attempts=attempts, iters=iters,
+                         best_fitness=best_fitness,
+                         best_state=np.asarray(best_state),
+                         **_optimizer_values(optimizer))
 
     return best_state, best_fitness
 
@@ -174,6 +343,8 @@ class NetworkWeights:
         Activation function for each of the hidden layers with the signature
         :code:`activation(x, deriv)`, where setting deriv is a boolean that
         determines whether to return the activation function or its derivative.
+        The built-in activation functions also write their values into
+        preallocated arrays, through their :code:`out` argument.
 
     bias: bool, default: True
         Whether a bias term is included in the network.
@@ -181,10 +352,51 @@ class NetworkWeights:
     is_classifer: bool, default: True
         Whether the network is for classification orregression. Set True for
         classification and False for regression.
+
+    batch_size: int, default: None
+        Number of observations used to evaluate the loss. If :code:`None`,
+        the full dataset is used. Otherwise, the loss is evaluated on a
+        mini-batch of the data, which is replaced each time
+        :code:`next_batch()` is called.
+
+    batch_mode: string, default: 'random'
+        How mini-batches are drawn. Must be one of: 'random' (consecutive
+        batches from a random permutation of the data, reshuffled after each
+        pass through the data) or 'rotate' (consecutive batches in the order
+        of the data, wrapping around at the end).
+
+    batch_rescore: bool, default: False
+        Whether the optimization problem should re-evaluate its current state
+        each time a new mini-batch is drawn, so that the current state and
+        candidate states are compared on the same data.
+
+    dtype: data-type, default: np.float64
+        Floating point type in which the inputs, weights and layer outputs are
+        stored and computed. The loss is always accumulated in float64.
+
+    incremental: bool, default: False
+        Whether to cache the layer outputs of evaluated states, so that a
+        state that differs from a cached one in a single weight (such as a
+        random neighbor) can be evaluated by only updating the layer values
+        affected by that weight. If the changed weight is in layer k, only
+        one output column of layer k and a rank-one update of layer k + 1 are
+        computed, rather than every layer. The cache is cleared whenever the
+        mini-batch changes, and a state is evaluated in full after every
+        :code:`INCREMENTAL_REFRESH` chained incremental updates, so that
+        rounding errors do not accumulate.
+
+    fused_loss: bool, default: False
+        Whether to calculate the loss of a multi-class classifier directly
+        from the output layer values with a fused softmax and cross-entropy,
+        which is more accurate for confident predictions as the
+        probabilities are not clipped. Can only be used if is_classifier is
+        :code:`True` and y has more than one column.
     """
 
     def __init__(self, X, y, node_list, activation, bias=True,
-                 is_classifier=True, learning_rate=0.1):
+                 is_classifier=True, learning_rate=0.1, batch_size=None,
+                 batch_mode='random', batch_rescore=False, dtype=np.float64,
+                 incremental=False, fused_loss=False):
 
         # Make sure y is an array and not a list
         y = np.array(y)
@@ -217,7 +429,50 @@ class NetworkWeights:
         if learning_rate <= 0:
             raise Exception("""learning_rate must be greater than 0.""")
 
-        self.X = X
+        if batch_size is not None and (
+                (not isinstance(batch_size, int)
+                 and not batch_size.is_integer())
+                or (batch_size <= 0) or (batch_size > np.shape(X)[0])):
+            raise Exception("""batch_size must be None or a positive integer"""
+                            + """ no greater than the length of X.""")
+
+        if batch_mode not in ['random', 'rotate']:
+            raise Exception("""batch_mode must be one of: 'random' or"""
+                            + """ 'rotate'.""")
+
+        if not isinstance(batch_rescore, bool):
+            raise Exception("""batch_rescore must be True or False.""")
+
+        if not np.issubdtype(dtype, np.floating):
+            raise Exception("""dtype must be a floating point type.""")
+
+        if not isinstance(incremental, bool):
+            raise Exception("""incremental must be True or False.""")
+
+        if not isinstance(fused_loss, bool):
+            raise Exception("""fused_loss must be True or False.""")
+
+        if fused_loss and (not is_classifier or np.shape(y)[1] == 1):
+            raise Exception("""fused_loss can only be used for a classifier"""
+                            + """ with more than one output.""")
+
+        self.dtype = np.dtype(dtype)
+
+        # Add bias column to inputs matrix once, if required, and keep X as
+        # a view of the inputs matrix rather than a second copy of the data
+        if bias:
+            self.input_matrix = np.ones([np.shape(X)[0], np.shape(X)[1] + 1],
+                                        dtype=self.dtype)
+            self.input_matrix[:, :-1] = X
+            self.X = self.input_matrix[:, :-1]
+        else:
+            self.input_matrix = np.asarray(X, dtype=self.dtype)
+            self.X = self.input_matrix
+
+        # Store y in the same type as the predictions, so that the output
+        # errors are not promoted to float64
+        y = np.asarray(y, dtype=self.dtype)
+
         self.y_true = y
         self.node_list = node_list
         self.activation = activation
@@ -225,28 +480,170 @@ class NetworkWeights:
         self.is_classifier = is_classifier
         self.learning_rate = learning_rate
 
+        # The built-in activation functions can write their values into an
+        # existing array, rather than allocating a new one
+        self.activation_out = activation in [identity, relu, sigmoid, tanh]
+
         # Determine appropriate loss function and output activation function
         if self.is_classifier:
-            self.loss = log_loss
-
             if np.shape(self.y_true)[1] == 1:
+                self.loss = binary_cross_entropy
                 self.output_activation = sigmoid
             else:
+                self.loss = categorical_cross_entropy
                 self.output_activation = softmax
         else:
             self.loss = mean_squared_error
             self.output_activation = identity
 
+        self.fused_loss = fused_loss
         self.inputs_list = []
+        self.output_values = y
         self.y_pred = y
         self.weights = []
         self.prob_type = 'continuous'
 
-        nodes = 0
-        for i in range(len(node_list) - 1):
-            nodes += node_list[i]*node_list[i + 1]
+        # Precompute where each layer's weights are stored in the state
+        self.offsets = layer_offsets(node_list)
+        self.nodes = self.offsets[-1]
+
+        # The forward and backward pass buffers are allocated when first
+        # needed, and again whenever the number of rows in the batch changes
+        self.workspace_rows = None
+
+        # Initialize layer caches used for incremental evaluation. Each cache
+        # holds a state, its layer outputs, its layer inputs, its predictions
+        # and the number of incremental updates they were derived with.
+        self.incremental = incremental
+        self.base_cache = None
+        self.last_cache = None
+
+        # Initialize mini-batches
+        self.batch_size = None if batch_size is None else int(batch_size)
+        self.batch_mode = batch_mode
+        self.batch_rescore = batch_rescore
+        self.batch_order = np.arange(np.shape(X)[0])
+        self.batch_start = 0
+        self.batch_inds = None
+        self.input_batch = self.input_matrix
+        self.y_batch = y
+
+        if self.batch_size is not None:
+            if self.batch_mode == 'random':
+                self.batch_order = np.random.permutation(np.shape(X)[0])
+
+            self.next_batch()
+
+    def init_workspace(self):
+        """Allocate the buffers used by the forward and backward passes for
+        the number of rows in the current batch: the output values, errors
+        (deltas) and activation derivatives of each layer, the predictions,
+        and the 1D gradient array with a 2D view of it for each layer. Has no
+        effect if the buffers already fit the current batch.
+        """
+        n_samples = np.shape(self.input_batch)[0]
+
+        if self.workspace_rows == n_samples:
+            return
+
+        self.workspace_rows = n_samples
+        self.output_buffers = []
+        self.delta_buffers = []
+        self.deriv_buffers = []
+
+        for nodes in self.node_list[1:]:
+            self.output_buffers.append(np.zeros([n_samples, nodes],
+                                                dtype=self.dtype))
+            self.delta_buffers.append(np.zeros([n_samples, nodes],
+                                               dtype=self.dtype))
+            self.deriv_buffers.append(np.zeros([n_samples, nodes],
+                                               dtype=self.dtype))
+
+        self.pred_buffer = np.zeros([n_samples, self.node_list[-1]],
+                                    dtype=self.dtype)
+
+        self.gradient = np.zeros(self.nodes, dtype=self.dtype)
+        self.gradient_list = unflatten_weights(self.gradient, self.node_list,
+                                               self.offsets)
+
+    def next_batch(self):
+        """Replace the mini-batch used to evaluate the loss with the next one.
+        Has no effect if :code:`batch_size` is :code:`None`.
+        """
+        if self.batch_size is None:
+            return
+
+        n_samples = len(self.batch_order)
+        end = self.batch_start + self.batch_size
+
+        if self.batch_mode == 'random':
+            # Start a new pass through a reshuffled dataset when there are
+            # not enough unused observations left for a full batch
+            if end > n_samples:
+                self.batch_order = np.random.permutation(n_samples)
+                self.batch_start = 0
+                end = self.batch_size
+
+            inds = self.batch_order[self.batch_start:end]
+        else:
+            inds = np.arange(self.batch_start, end) % n_samples
+
+        self.batch_start = end % n_samples
+        self.set_batch(inds)
+
+    def set_batch(self, inds):
+        """Set the observations used to evaluate the loss.
+
+        Parameters
+        ----------
+        inds: array
+            Indices of the rows of X and y to use. If :code:`None`, the full
+            dataset is used.
+        """
+        self.batch_inds = inds
+
+        if inds is None:
+            self.input_batch = self.input_matrix
+            self.y_batch = self.y_true
+        else:
+            self.input_batch = self.input_matrix[inds]
+            self.y_batch = self.y_true[inds]
 
-        self.nodes = nodes
+        # Cached layer values are only valid for the previous batch
+        self.base_cache = None
+        self.last_cache = None
+
+    def get_batch_state(self):
+        """Get the position in the sequence of mini-batches, so that it can
+        be saved to a checkpoint.
+
+        Returns
+        -------
+        batch_state: dict
+            Dictionary of the batch order, the start of the next batch and
+            the indices of the current batch.
+        """
+        batch_state = {'batch_order': np.copy(self.batch_order),
+                       'batch_start': self.batch_start}
+
+        if self.batch_inds is not None:
+            batch_state['batch_inds'] = np.asarray(self.batch_inds)
+
+        return batch_state
+
+    def set_batch_state(self, batch_state):
+        """Restore a position in the sequence of mini-batches returned by
+        :code:`get_batch_state()`, making its current batch the one used to
+        evaluate the loss.
+
+        Parameters
+        ----------
+        batch_state: dict
+            Dictionary of batch state values.
+        """
+        self.batch_order = np.array(batch_state['batch_order'])
+        self.batch_start = int(batch_state['batch_start'])
+        self.set_batch(batch_state.get('batch_inds'))
 
     def evaluate(self, state):
         """Evaluate the fitness of a state.
@@ -264,34 +661,257 @@ class NetworkWeights:
         if not len(state) == self.nodes:
             raise Exception("""state must have length %d""" % (self.nodes,))
 
-        self.inputs_list = []
-        self.weights = unflatten_weights(state, self.node_list)
+        state = np.asarray(state, dtype=self.dtype)
+
+        self.weights = unflatten_weights(state, self.node_list, self.offsets)
 
-        # Add bias column to inputs matrix, if required
-        if self.bias:
-            ones = np.ones([np.shape(self.X)[0], 1])
-            inputs = np.hstack((self.X, ones))
+        # Look for a cached state that differs from state in at most one
+        # weight
+        match = self.match_cache(state) if self.incremental else None
 
+        if match is not None:
+            self.evaluate_incremental(state, *match)
         else:
-            inputs = self.X
+            self.inputs_list = []
+            outputs_list = []
+
+            # Layer values are cached for incremental evaluation, so can only
+            # be written to the reusable buffers otherwise
+            if not self.incremental:
+                self.init_workspace()
+
+            # Pass data through network
+            inputs = self.input_batch
+
+            for i in range(len(self.weights)):
+                # Multiple inputs by weights
+                if self.incremental:
+                    outputs = np.dot(inputs, self.weights[i])
+                else:
+                    outputs = np.dot(inputs, self.weights[i],
+                                     out=self.output_buffers[i])
+
+                self.inputs_list.append(inputs)
+                outputs_list.append(outputs)
+
+                # Transform outputs to get inputs for next layer (or preds).
+                # Unless they are cached, the hidden layer outputs are only
+                # needed until they are transformed, so are overwritten.
+                if i < len(self.weights) - 1:
+                    if self.incremental or not self.activation_out:
+                        inputs = self.activation(outputs)
+                    else:
+                        inputs = self.activation(outputs, out=outputs)
+                else:
+                    self.output_values = outputs
+
+                    if self.incremental:
+                        self.y_pred = self.output_activation(outputs)
+                    else:
+                        self.y_pred = self.output_activation(
+                            outputs, out=self.pred_buffer)
+
+            if self.incremental:
+                self.base_cache = [np.copy(state), outputs_list,
+                                   self.inputs_list, self.y_pred, 0]
+                self.last_cache = self.base_cache
 
-        # Pass data through network
-        for i in range(len(self.weights)):
-            # Multiple inputs by weights
-            outputs = np.dot(inputs, self.weights[i])
-            self.inputs_list.append(inputs)
+        # Evaluate loss function
+        if self.fused_loss:
+            fitness = softmax_cross_entropy(self.y_batch, self.output_values)
+        else:
+            fitness = self.loss(self.y_batch, self.y_pred)
 
-            # Transform outputs to get inputs for next layer (or final preds)
+        return fitness
+
+    def match_cache(self, state):
+        """Find a cached state that differs from a given state in at most one
+        weight. The state most recently evaluated in full, and the one most
+        recently evaluated at all, are cached. A match with the latter
+        becomes the base for later matches, so that after a neighbor is
+        accepted, its own neighbors can be evaluated incrementally.
+
+        Parameters
+        ----------
+        state: array
+            State array for evaluation.
+
+        Caches derived with :code:`INCREMENTAL_REFRESH` or more incremental
+        updates are not matched, so that the state is evaluated in full.
+
+        Returns
+        -------
+        match: tuple
+            Tuple containing the matching cache and the (empty or length 1)
+            array of the index at which state differs from it. :code:`None`
+            if there is no match.
+        """
+        for cache in [self.base_cache, self.last_cache]:
+            if cache is None or cache[4] >= INCREMENTAL_REFRESH:
+                continue
+
+            diff = np.flatnonzero(state != cache[0])
+
+            if len(diff) <= 1:
+                self.base_cache = cache
+                return cache, diff
+
+        return None
+
+    def evaluate_incremental(self, state, cache, diff):
+        """Calculate the layer values of a state from the cached values of a
+        state that differs from it in at most one weight.
+
+        Parameters
+        ----------
+        state: array
+            State array for evaluation.
+
+        cache: list
+            Cache of the matching state, as found by :code:`match_cache`.
+
+        diff: array
+            Array of the (at most one) index at which state differs from the
+            cached state.
+        """
+        base_state, outputs_list, inputs_list, y_pred, updates = cache
+
+        if len(diff) == 0:
+            self.inputs_list = inputs_list
+            self.output_values = outputs_list[-1]
+            self.y_pred = y_pred
+            return
+
+        # Find the layer, row and column of the changed weight
+        ind = diff[0]
+        layer = np.searchsorted(self.offsets, ind, side='right') - 1
+        row, col = divmod(ind - self.offsets[layer],
+                          self.node_list[layer + 1])
+        change = state[ind] - base_state[ind]
+
+        # Layers before the changed weight are unaffected
+        new_outputs = outputs_list[:layer]
+        self.inputs_list = inputs_list[:layer + 1]
+        inputs = inputs_list[layer]
+
+        for i in range(layer, len(self.weights)):
+            if i == layer:
+                # Only one column of this layer's outputs changes
+                outputs = np.copy(outputs_list[i])
+                outputs[:, col] += change*inputs[:, row]
+            elif i == layer + 1:
+                # Only one column of this layer's inputs changed, so update
+                # its outputs with a rank-one correction
+                self.inputs_list.append(inputs)
+                outputs = outputs_list[i] + np.outer(
+                    inputs[:, col] - inputs_list[i][:, col],
+                    self.weights[i][col])
+            else:
+                self.inputs_list.append(inputs)
+                outputs = np.dot(inputs, self.weights[i])
+
+            new_outputs.append(outputs)
+
+            # Transform outputs to get inputs for next layer (or preds)
             if i < len(self.weights) - 1:
-                inputs = self.activation(outputs)
+                if i == layer:
+                    inputs = np.copy(inputs_list[i + 1])
+                    inputs[:, col] = self.activation(outputs[:, col])
+                else:
+                    inputs = self.activation(outputs)
             else:
+                self.output_values = outputs
                 self.y_pred = self.output_activation(outputs)
 
-        # Evaluate loss function
-        fitness = self.loss(self.y_true, self.y_pred)
+        self.last_cache = [np.copy(state), new_outputs, self.inputs_list,
+                           self.y_pred, updates + 1]
+
+    def evaluate_many(self, states):
+        """Evaluate the fitness of several states, such as a whole population,
+        with one forward pass through the network. Each layer's weights are
+        stacked into a 3-D array, so that each layer is computed with a few
+        large matrix products rather than one small product per state.
+
+        Unlike :code:`evaluate`, this does not store the layer inputs needed
+        by :code:`calculate_updates`.
+
+        Parameters
+        ----------
+        states: array
+            2-D array containing one state per row.
+
+        Returns
+        -------
+        fitness: array
+            1-D array containing the fitness of each state.
+        """
+        states = np.asarray(states, dtype=self.dtype)
+
+        if np.shape(states)[1] != self.nodes:
+            raise Exception("""state must have length %d""" % (self.nodes,))
+
+        n_samples = np.shape(self.input_batch)[0]
+        fitness = np.zeros(len(states))
+        chunk_size = self.get_chunk_size()
+
+        for first in range(0, len(states), chunk_size):
+            chunk = states[first:first + chunk_size]
+            n_chunk = len(chunk)
+
+            # Pass data through network
+            for i in range(len(self.node_list) - 1):
+                weights = np.reshape(
+                    chunk[:, self.offsets[i]:self.offsets[i + 1]],
+                    [n_chunk, self.node_list[i], self.node_list[i + 1]])
+
+                if i == 0:
+                    # All states share the same inputs, so compute the first
+                    # layer as a single matrix product with the weights of
+                    # every state placed side by side
+                    outputs = np.dot(self.input_batch, np.reshape(
+                        np.transpose(weights, [1, 0, 2]),
+                        [self.node_list[0], -1]))
+                    outputs = np.transpose(np.reshape(
+                        outputs, [n_samples, n_chunk, -1]), [1, 0, 2])
+                else:
+                    outputs = np.matmul(inputs, weights)
+
+                # Transform outputs to get inputs for next layer
+                if i < len(self.node_list) - 2:
+                    if self.activation_out:
+                        inputs = self.activation(outputs, out=outputs)
+                    else:
+                        inputs = self.activation(outputs)
+
+            # Evaluate loss function for all states in the chunk at once
+            if self.fused_loss:
+                fitness[first:first + n_chunk] = softmax_cross_entropy(
+                    self.y_batch, outputs)
+            else:
+                outputs = np.reshape(outputs, [n_chunk*n_samples, -1])
+                y_pred = np.reshape(
+                    self.output_activation(outputs, out=outputs),
+                    [n_chunk, n_samples, -1])
+                fitness[first:first + n_chunk] = self.loss(self.y_batch,
+                                                           y_pred)
 
         return fitness
 
+    def get_chunk_size(self):
+        """ Return the number of states passed through the network together
+        by :code:`evaluate_many`, chosen so that the stacked outputs of the
+        widest layer take up about :code:`EVALUATE_MANY_BYTES` bytes.
+
+        Returns
+        -------
+        chunk_size: int
+            Number of states per chunk.
+        """
+        state_bytes = np.shape(self.input_batch)[0] \
+            * max(self.node_list[1:])*self.dtype.itemsize
+
+        return max(1, EVALUATE_MANY_BYTES // state_bytes)
+
     def get_output_activation(self):
         """ Return the activation function for the output layer.
 
@@ -313,43 +933,516 @@ class NetworkWeights:
         """
         return self.prob_type
 
-    def calculate_updates(self):
-        """Calculate gradient descent updates.
+    def calculate_gradient(self):
+        """Calculate the gradient of the loss, summed over the observations,
+        at the state most recently evaluated. The errors and the gradient
+        are written into preallocated buffers, so no arrays are allocated
+        for them.
 
         Returns
         -------
-        updates_list: list
-            List of back propagation weight updates.
+        gradient: array
+            1D gradient array, in the same order as the state vector. This
+            array is reused by the next call.
         """
-        delta_list = []
-        updates_list = []
+        self.init_workspace()
 
         # Work backwards from final layer
         for i in range(len(self.inputs_list)-1, -1, -1):
+            delta = self.delta_buffers[i]
+
             # Final layer
             if i == len(self.inputs_list)-1:
-                delta = (self.y_pred - self.y_true)
+                np.subtract(self.y_pred, self.y_batch, out=delta)
             # Hidden layers
             else:
-                dot = np.dot(delta_list[-1], np.transpose(self.weights[i+1]))
-                activation = self.activation(self.inputs_list[i+1], deriv=True)
-                delta = dot * activation
+                np.dot(self.delta_buffers[i+1], self.weights[i+1].T,
+                       out=delta)
+                if self.activation_out:
+                    delta *= self.activation(self.inputs_list[i+1],
+                                             deriv=True,
+                                             out=self.deriv_buffers[i])
+                else:
+                    delta *= self.activation(self.inputs_list[i+1],
+                                             deriv=True)
+
+            # Calculate gradient directly into this layer's part of the 1D
+            # gradient array
+            np.dot(self.inputs_list[i].T, delta, out=self.gradient_list[i])
+
+        return self.gradient
+
+    def calculate_updates(self, flat=False):
+        """Calculate gradient descent updates.
 
-            delta_list.append(delta)
+        Parameters
+        ----------
+        flat: bool, default: False
+            Whether to return the updates as a 1D array, in the same order as
+            the state vector, rather than as a list of 2D arrays.
 
-            # Calculate updates
-            updates = -1.0*self.learning_rate*np.dot(np.transpose(self.inputs_list[i]),
-                                          delta)
+        Returns
+        -------
+        updates_list: list
+            List of back propagation weight updates, as new arrays. If flat is
+            :code:`True`, 1D updates array instead, which is reused by the
+            next call.
+        """
+        updates = self.calculate_gradient()
+        updates *= -1.0*self.learning_rate
 
-            updates_list.append(updates)
+        if flat:
+            return updates
 
-        # Reverse order of updates list
-        updates_list = updates_list[::-1]
+        # The list is returned to callers that may keep it, so is not left
+        # as views of the reused gradient array
+        updates_list = unflatten_weights(np.copy(updates), self.node_list,
+                                         self.offsets)
 
         return updates_list
 
 
-class BaseNeuralNetwork(six.with_metaclass(ABCMeta, BaseEstimator)):
+class ValidationMonitor:
+    """Algorithm callback that tracks the loss of the current weights on
+    validation data, keeps the weights with the lowest validation loss and
+    stops the algorithm once the validation loss has stopped improving. It
+    implements the per-iteration callback described in
+    :code:`mlrose.algorithms`.
+
+    Parameters
+    ----------
+    fitness_fn: NetworkWeights object
+        Fitness function defined on the validation data.
+
+    interval: int, default: 10
+        Number of algorithm iterations between evaluations of the validation
+        loss.
+
+    patience: int, default: 5
+        Number of consecutive evaluations without an improvement in the
+        validation loss of the current run after which the algorithm is
+        stopped.
+
+    Note
+    ----
+    When the monitor is used for several algorithm runs, such as random
+    restarts, :code:`reset()` should be called before each run. The
+    patience then applies to each run separately, while the weights with
+    the lowest validation loss over all of the runs are kept.
+    """
+
+    def __init__(self, fitness_fn, interval=10, patience=5):
+
+        self.fitness_fn = fitness_fn
+        self.interval = interval
+        self.patience = patience
+        self.best_loss = np.inf
+        self.best_weights = None
+        self.reset()
+
+    def reset(self):
+        """Start tracking a new algorithm run, keeping the best weights
+        found in previous runs.
+        """
+        self.run_best_loss = np.inf
+        self.waiting = 0
+
+    def __call__(self, iteration, state, fitness, best_fitness, evals,
+                 elapsed):
+        """Evaluate the validation loss, if it is due.
+
+        Parameters
+        ----------
+        iteration: int
+            Current iteration of the algorithm.
+
+        state: array
+            Current weights.
+
+        fitness, best_fitness, evals, elapsed:
+            Remaining callback arguments, which are not used.
+
+        Returns
+        -------
+        stop: bool
+            Whether the algorithm should stop.
+        """
+        if iteration % self.interval != 0:
+            return False
+
+        loss = self.fitness_fn.evaluate(state)
+
+        if loss < self.best_loss:
+            self.best_loss = loss
+            self.best_weights = np.copy(state)
+
+        if loss < self.run_best_loss:
+            self.run_best_loss = loss
+            self.waiting = 0
+        else:
+            self.waiting += 1
+
+        return self.waiting >= self.patience
+
+
+class FittedNetwork:
+    """Inference-only fitted neural network, which can predict data labels
+    but not be fitted. It is much quicker to create than an estimator, so is
+    suited to loading saved networks for prediction. Fitted estimators share
+    its prediction methods.
+
+    Parameters
+    ----------
+    fitted_weights: array
+        1D array of fitted weights.
+
+    node_list: list of ints
+        Number of nodes in each layer, including the input and output layers.
+
+    activation: string, default: 'relu'
+        Activation function for each of the hidden layers. Must be one of:
+        'identity', 'relu', 'sigmoid' or 'tanh'.
+
+    bias: bool, default: True
+        Whether the network includes a bias term.
+
+    is_classifier: bool, default: True
+        Whether the network is for classification or regression.
+
+    dtype: data-type, default: np.float64
+        Floating point type of the weights and of the calculations.
+
+    Attributes
+    ----------
+    loss: float
+        Loss of the fitted weights on the training data, if known.
+
+    validation_loss: float
+        Loss of the fitted weights on the validation data, if known.
+
+    Example
+    -------
+    .. highlight:: python
+    .. code-block:: python
+
+        >>> import mlrose
+        >>> nn = mlrose.NeuralNetwork(hidden_nodes=[10]).fit(X, y)
+        >>> nn.save('model.bin')
+        >>> model = mlrose.load_network('model.bin', inference_only=True)
+        >>> model.predict(X)
+    """
+
+    activation_dict = {'identity': identity,
+                       'relu': relu,
+                       'sigmoid': sigmoid,
+                       'tanh': tanh}
+
+    def __init__(self, fitted_weights, node_list, activation='relu',
+                 bias=True, is_classifier=True, dtype=np.float64):
+
+        self.fitted_weights = fitted_weights
+        self.node_list = node_list
+        self.activation = activation
+        self.bias = bias
+        self.is_classifier = is_classifier
+        self.dtype = dtype
+        self.output_activation = _output_activation(node_list, is_classifier)
+        self.loss = np.inf
+        self.validation_loss = np.inf
+        self.predicted_probs = []
+
+    def _forward(self, X):
+        """Pass a feature array through the fitted network.
+
+        Parameters
+        ----------
+        X: array
+            Numpy array containing feature dataset with each row
+            representing a single observation.
+
+        Returns
+        -------
+        y_pred: array
+            Numpy array containing the output layer values, i.e. predicted
+            probabilities for a classifier or predicted values otherwise.
+        """
+        if not np.shape(X)[1] == (self.node_list[0] - self.bias):
+            raise Exception("""The number of columns in X must equal %d"""
+                            % ((self.node_list[0] - self.bias),))
+
+        weights = unflatten_weights(self.fitted_weights, self.node_list)
+        inputs = np.asarray(X, dtype=self.dtype)
+
+        # Pass data through network
+        for i in range(len(weights)):
+            # Multiple inputs by weights. The bias term is added by
+            # broadcasting the last row of the first layer's weights, to
+            # avoid copying X to append a column of ones.
+            if i == 0 and self.bias:
+                outputs = np.dot(inputs, weights[i][:-1]) + weights[i][-1]
+            else:
+                outputs = np.dot(inputs, weights[i])
+
+            # Transform outputs to get inputs for next layer (or final preds)
+            if i < len(weights) - 1:
+                inputs = self.activation_dict[self.activation](outputs,
+                                                               out=outputs)
+            else:
+                y_pred = self.output_activation(outputs, out=outputs)
+
+        return y_pred
+
+    def _forward_chunks(self, X, batch_size=None):
+        """Pass a feature array through the fitted network in chunks of rows,
+        so that the hidden layer values are only held for one chunk at a
+        time.
+
+        Parameters
+        ----------
+        X: array
+            Numpy array containing feature dataset with each row
+            representing a single observation.
+
+        batch_size: int, default: None
+            Number of rows in each chunk. If :code:`None`, all rows are
+            passed through the network at once.
+
+        Returns
+        -------
+        y_pred: array
+            Numpy array containing the output layer values.
+        """
+        if batch_size is not None and (
+                not isinstance(batch_size, (int, float, np.integer,
+                                            np.floating))
+                or not float(batch_size).is_integer() or batch_size <= 0):
+            raise Exception("""batch_size must be None or a positive"""
+                            + """ integer.""")
+
+        if batch_size is None or batch_size >= np.shape(X)[0]:
+            return self._forward(X)
+
+        batch_size = int(batch_size)
+        y_pred = np.zeros([np.shape(X)[0], self.node_list[-1]],
+                          dtype=self.dtype)
+
+        for start in range(0, np.shape(X)[0], batch_size):
+            y_pred[start:start + batch_size] = self._forward(
+                X[start:start + batch_size])
+
+        return y_pred
+
+    def _probs_to_labels(self, probs):
+        """Convert predicted probabilities to 0-1 labels.
+
+        Parameters
+        ----------
+        probs: array
+            Numpy array containing predicted probabilities.
+
+        Returns
+        -------
+        labels: array
+            Numpy array containing predicted data labels.
+        """
+        if self.node_list[-1] == 1:
+            labels = np.round(probs).astype(int)
+        else:
+            labels = np.zeros(np.shape(probs), dtype=int)
+            labels[np.arange(len(probs)), np.argmax(probs, axis=1)] = 1
+
+        return labels
+
+    def predict(self, X, y=None, batch_size=None):
+        """Use model to predict data labels for given feature array.
+
+        Parameters
+        ----------
+        X: array
+            Numpy array containing feature dataset with each row
+            representing a single observation.
+
+        batch_size: int, default: None
+            Number of rows of X passed through the network at a time, which
+            bounds the memory used for the hidden layers. If :code:`None`,
+            all rows are passed through at once.
+
+        Returns
+        -------
+        y_pred: array
+            Numpy array containing predicted data labels.
+        """
+        y_pred = self._forward_chunks(X, batch_size)
+
+        # For classifier, convert predicted probabilities to 0-1 labels
+        if self.is_classifier:
+            self.predicted_probs = y_pred
+            y_pred = self._probs_to_labels(y_pred)
+
+        return y_pred
+
+    def predict_proba(self, X, batch_size=None):
+        """Use classifier to predict class probabilities for given feature
+        array.
+
+        Parameters
+        ----------
+        X: array
+            Numpy array containing feature dataset with each row
+            representing a single observation.
+
+        batch_size: int, default: None
+            Number of rows of X passed through the network at a time, which
+            bounds the memory used for the hidden layers. If :code:`None`,
+            all rows are passed through at once.
+
+        Returns
+        -------
+        probs: array
+            Numpy array containing the predicted probabilities for each class
+            for multi-class classification data; or the predicted probability
+            for class 1 for binary classification data.
+        """
+        if not self.is_classifier:
+            raise Exception("""predict_proba is only available for"""
+                            + """ classifiers.""")
+
+        probs = self._forward_chunks(X, batch_size)
+
+        return probs
+
+    def predict_iter(self, batches, proba=False):
+        """Predict data labels for each of a sequence of feature arrays, such
+        as chunks of rows read from a file, without holding more than one
+        chunk in memory.
+
+        Parameters
+        ----------
+        batches: iterable of arrays
+            Iterable (e.g. a generator) giving feature arrays with each row
+            representing a single observation.
+
+        proba: bool, default: False
+            Whether to return predicted probabilities instead of labels.
+            Only available for classifiers.
+
+        Returns
+        -------
+        y_pred: generator of arrays
+            Generator giving the predictions for each array in batches.
+
+        Note
+        ----
+        The first array is read from batches and checked when
+        :code:`predict_iter` is called, so that invalid input is reported
+        before any predictions are made.
+        """
+        if proba and not self.is_classifier:
+            raise Exception("""predict_proba is only available for"""
+                            + """ classifiers.""")
+
+        batches = iter(batches)
+        first = next(batches, None)
+
+        if first is not None and \
+                not np.shape(first)[1] == (self.node_list[0] - self.bias):
+            raise Exception("""The number of columns in X must equal %d"""
+                            % ((self.node_list[0] - self.bias),))
+
+        return self._predict_batches(first, batches, proba)
+
+    def _predict_batches(self, first, batches, proba):
+        """Generate the predictions for predict_iter.
+
+        Parameters
+        ----------
+        first: array
+            First feature array, already read from batches, or :code:`None`
+            if batches is empty.
+
+        batches: iterator of arrays
+            Iterator giving the remaining feature arrays.
+
+        proba: bool
+            Whether to return predicted probabilities instead of labels.
+
+        Returns
+        -------
+        y_pred: generator of arrays
+            Generator giving the predictions for each array.
+        """
+        if first is None:
+            return
+
+        X = first
+
+        while True:
+            y_pred = self._forward(X)
+
+            if self.is_classifier and not proba:
+                y_pred = self._probs_to_labels(y_pred)
+
+            yield y_pred
+
+            X = next(batches, None)
+
+            if X is None:
+                return
+
+    def _get_saved_params(self):
+        """Get the parameters saved with the network, other than those
+        needed for prediction.
+
+        Returns
+        -------
+        params: dictionary
+            Parameter names mapped to their values.
+        """
+        return {}
+
+    def save(self, path):
+        """Save the fitted network to a binary file, containing a JSON header
+        describing the network followed by the raw fitted weights. The
+        weights start at a multiple of 64 bytes, so can be memory-mapped.
+        The network can be loaded with :code:`load_network`.
+
+        Parameters
+        ----------
+        path: string
+            Path of file.
+        """
+        if len(self.node_list) == 0:
+            raise Exception("""The network must be fitted before it can be"""
+                            + """ saved.""")
+
+        header = {'version': 1,
+                  'class': type(self).__name__,
+                  'node_list': self.node_list,
+                  'nodes': len(self.fitted_weights),
+                  'activation': self.activation,
+                  'bias': self.bias,
+                  'is_classifier': self.is_classifier,
+                  'dtype': np.dtype(self.dtype).str,
+                  'loss': self.loss,
+                  'validation_loss': self.validation_loss,
+                  'params': self._get_saved_params()}
+
+        header = json.dumps(header, default=_json_default).encode('utf-8')
+
+        # Pad the header with spaces to align the weights
+        prefix = len(SAVED_NETWORK_ID) + 4
+        header += b' '*(-(prefix + len(header)) % 64)
+
+        with open(path, 'wb') as file:
+            file.write(SAVED_NETWORK_ID)
+            file.write(len(header).to_bytes(4, 'little'))
+            file.write(header)
+            file.write(np.ascontiguousarray(self.fitted_weights,
+                                            dtype=self.dtype).tobytes())
+
+
+class BaseNeuralNetwork(six.with_metaclass(ABCMeta, BaseEstimator,
+                                            FittedNetwork)):
     """Base class for neural networks.
 
     Warning: This class should not be used directly.
@@ -371,14 +1464,17 @@ class BaseNeuralNetwork(six.with_metaclass(ABCMeta, BaseEstimator)):
                  pop_size=200,
                  mutation_prob=0.1,
                  max_attempts=10,
-                 random_state=None):
+                 random_state=None,
+                 batch_size=None,
+                 batch_mode='random',
+                 batch_rescore=False,
+                 dtype=np.float64,
+                 optimizer=None,
+                 validation_fraction=None,
+                 validation_interval=10,
+                 validation_patience=5):
 
         self.hidden_nodes = hidden_nodes
-
-        self.activation_dict = {'identity': identity,
-                                'relu': relu,
-                                'sigmoid': sigmoid,
-                                'tanh': tanh}
         self.activation = activation
 
         self.algorithm = algorithm
@@ -394,10 +1490,19 @@ class BaseNeuralNetwork(six.with_metaclass(ABCMeta, BaseEstimator)):
         self.mutation_prob = mutation_prob
         self.max_attempts = max_attempts
         self.random_state = random_state
+        self.batch_size = batch_size
+        self.batch_mode = batch_mode
+        self.batch_rescore = batch_rescore
+        self.dtype = dtype
+        self.optimizer = optimizer
+        self.validation_fraction = validation_fraction
+        self.validation_interval = validation_interval
+        self.validation_patience = validation_patience
 
         self.node_list = []
         self.fitted_weights = []
         self.loss = np.inf
+        self.validation_loss = np.inf
         self.output_activation = None
         self.predicted_probs = []
 
@@ -445,7 +1550,48 @@ class BaseNeuralNetwork(six.with_metaclass(ABCMeta, BaseEstimator)):
             raise Exception("""Algorithm must be one of: 'random_hill_climb',
                     'simulated_annealing', 'genetic_alg', 'gradient_descent'.""")
 
-    def fit(self, X, y=None, init_weights=None):
+        if self.batch_size is not None and (
+                (not isinstance(self.batch_size, int)
+                 and not self.batch_size.is_integer())
+                or (self.batch_size <= 0)):
+            raise Exception("""batch_size must be None or a positive"""
+                            + """ integer.""")
+
+        if self.batch_mode not in ['random', 'rotate']:
+            raise Exception("""batch_mode must be one of: 'random' or"""
+                            + """ 'rotate'.""")
+
+        if not isinstance(self.batch_rescore, bool):
+            raise Exception("""batch_rescore must be True or False.""")
+
+        if not np.issubdtype(self.dtype, np.floating):
+            raise Exception("""dtype must be a floating point type.""")
+
+        if self.optimizer is not None \
+                and not hasattr(self.optimizer, 'calculate_updates'):
+            raise Exception("""optimizer must be None or an optimizer"""
+                            + """ object.""")
+
+        if self.validation_fraction is not None and (
+                (self.validation_fraction <= 0)
+                or (self.validation_fraction >= 1)):
+            raise Exception("""validation_fraction must be None or between"""
+                            + """ 0 and 1.""")
+
+        if (not isinstance(self.validation_interval, int)
+                and not self.validation_interval.is_integer()) \
+                or (self.validation_interval <= 0):
+            raise Exception("""validation_interval must be a positive"""
+                            + """ integer.""")
+
+        if (not isinstance(self.validation_patience, int)
+                and not self.validation_patience.is_integer()) \
+                or (self.validation_patience <= 0):
+            raise Exception("""validation_patience must be a positive"""
+                            + """ integer.""")
+
+    def fit(self, X, y=None, init_weights=None, X_val=None, y_val=None,
+            checkpoint=None):
         """Fit neural network to data.
 
         Parameters
@@ -461,6 +1607,26 @@ class BaseNeuralNetwork(six.with_metaclass(ABCMeta, BaseEstimator)):
         init_state: array, default: None
             Numpy array containing starting weights for algorithm.
             If :code:`None`, then a random state is used.
+
+        X_val: array, default: None
+            Numpy array containing validation feature dataset. If not
+            :code:`None`, it is used instead of setting aside
+            validation_fraction of X.
+
+        y_val: array, default: None
+            Numpy array containing validation data labels. Length must be
+            same as length of X_val.
+
+        checkpoint: Checkpoint object, default: None
+            Checkpoint to which the progress of the optimization algorithm
+            is saved periodically, e.g. :code:`mlrose.Checkpoint('nn.ckpt')`.
+            If the checkpoint file already exists, fitting resumes from the
+            saved progress, including the mini-batch position and the
+            optimizer's running values. With random restarts, each restart
+            is saved to its own file, as given by :code:`checkpoint.part()`.
+            The validation loss tracking is not saved, so restarts when
+            resuming, and a resumed fit with validation data can differ from
+            an uninterrupted one. If :code:`None`, no checkpoint is saved.
         """
         self._validate()
 
@@ -493,14 +1659,57 @@ class BaseNeuralNetwork(six.with_metaclass(ABCMeta, BaseEstimator)):
         if isinstance(self.random_state, int) and self.random_state > 0:
             np.random.seed(self.random_state)
 
+        # Set aside validation data, if required
+        if X_val is None and self.validation_fraction is not None:
+            X = np.asarray(X)
+            inds = np.random.permutation(np.shape(X)[0])
+            n_val = int(np.ceil(self.validation_fraction*len(inds)))
+
+            X_val, y_val = X[inds[:n_val]], y[inds[:n_val]]
+            X, y = X[inds[n_val:]], y[inds[n_val:]]
+
+        # Random hill climbing and simulated annealing only change one weight
+        # at a time, so can update the previous layer values incrementally
+        incremental = self.algorithm in ['random_hill_climb',
+                                         'simulated_annealing'] \
+            and self.batch_size is None
+
         # Initialize optimization problem
         fitness = NetworkWeights(X, y, node_list,
                                  self.activation_dict[self.activation], self.bias,
-                                 self.is_classifier, learning_rate=self.learning_rate)
+                                 self.is_classifier, learning_rate=self.learning_rate,
+                                 batch_size=self.batch_size,
+                                 batch_mode=self.batch_mode,
+                                 batch_rescore=self.batch_rescore,
+                                 dtype=self.dtype,
+                                 incremental=incremental)
 
         problem = ContinuousOpt(num_nodes, fitness, maximize=False,
                                 min_val=-1*self.clip_max,
-                                max_val=self.clip_max, step=self.learning_rate)
+                                max_val=self.clip_max, step=self.learning_rate,
+                                dtype=self.dtype)
+
+        if init_weights is not None:
+            init_weights = np.asarray(init_weights, dtype=self.dtype)
+
+        # Initialize validation loss tracking
+        if X_val is not None:
+            if y_val is None or np.shape(X_val)[0] != len(y_val):
+                raise Exception("""y_val must be given and have the same"""
+                                + """ length as X_val.""")
+
+            # The validation loss is only evaluated every few iterations,
+            # when the weights have changed in many places, so the layer
+            # values are not cached for incremental evaluation
+            val_fitness = NetworkWeights(
+                X_val, y_val, node_list,
+                self.activation_dict[self.activation], self.bias,
+                self.is_classifier, dtype=self.dtype, incremental=False)
+            monitor = ValidationMonitor(val_fitness,
+                                        interval=self.validation_interval,
+                                        patience=self.validation_patience)
+        else:
+            monitor = None
 
         if self.algorithm == 'random_hill_climb':
             fitted_weights = None
@@ -508,14 +1717,24 @@ class BaseNeuralNetwork(six.with_metaclass(ABCMeta, BaseEstimator)):
 
             # Can't use restart feature of random_hill_climb function, since
             # want to keep initial weights in the range -1 to 1.
-            for _ in range(self.restarts + 1):
+            for restart in range(self.restarts + 1):
+                if monitor is not None:
+                    monitor.reset()
+
+                if checkpoint is None or self.restarts == 0:
+                    restart_checkpoint = checkpoint
+                else:
+                    restart_checkpoint = checkpoint.part(restart)
+
                 if init_weights is None:
-                    init_weights = np.random.uniform(-1, 1, num_nodes)
+                    init_weights = np.random.uniform(
+                        -1, 1, num_nodes).astype(self.dtype)
 
                 current_weights, current_loss = random_hill_climb(
                     problem,
                     max_attempts=self.max_attempts if self.early_stopping else self.max_iters, max_iters=self.max_iters,
-                    restarts=0, init_state=init_weights)
+                    restarts=0, init_state=init_weights, callback=monitor,
+                    checkpoint=restart_checkpoint)
 
                 if current_loss < loss:
                     fitted_weights = current_weights
@@ -523,25 +1742,45 @@ class BaseNeuralNetwork(six.with_metaclass(ABCMeta, BaseEstimator)):
 
         elif self.algorithm == 'simulated_annealing':
             if init_weights is None:
-                init_weights = np.random.uniform(-1, 1, num_nodes)
+                init_weights = np.random.uniform(
+                    -1, 1, num_nodes).astype(self.dtype)
             fitted_weights, loss = simulated_annealing(
                 problem,
                 schedule=self.schedule, max_attempts=self.max_attempts if self.early_stopping else self.max_iters,
-                max_iters=self.max_iters, init_state=init_weights)
+                max_iters=self.max_iters, init_state=init_weights,
+                callback=monitor, checkpoint=checkpoint)
 
         elif self.algorithm == 'genetic_alg':
             fitted_weights, loss = genetic_alg(
                 problem,
                 pop_size=self.pop_size, mutation_prob=self.mutation_prob,
-                max_attempts=self.max_attempts if self.early_stopping else self.max_iters, max_iters=self.max_iters)
+                max_attempts=self.max_attempts if self.early_stopping else self.max_iters, max_iters=self.max_iters,
+                callback=monitor, checkpoint=checkpoint)
 
         else:  # Gradient descent case
             if init_weights is None:
-                init_weights = np.random.uniform(-1, 1, num_nodes)
+                init_weights = np.random.uniform(
+                    -1, 1, num_nodes).astype(self.dtype)
             fitted_weights, loss = gradient_descent(
                 problem,
                 max_attempts=self.max_attempts if self.early_stopping else self.max_iters, max_iters=self.max_iters,
-                init_state=init_weights)
+                init_state=init_weights, optimizer=self.optimizer,
+                callback=monitor, checkpoint=checkpoint)
+
+        # Keep the weights with the lowest validation loss
+        self.validation_loss = np.inf
+
+        if monitor is not None and monitor.best_weights is not None:
+            fitted_weights = monitor.best_weights
+            self.validation_loss = monitor.best_loss
+
+        # Losses found during fitting are measured on mini-batches, so
+        # report the loss of the fitted weights on the full dataset
+        if self.batch_size is not None:
+            fitness.set_batch(None)
+            loss = fitness.evaluate(fitted_weights)
+        elif monitor is not None and monitor.best_weights is not None:
+            loss = fitness.evaluate(fitted_weights)
 
         # Save fitted weights and node list
         self.node_list = node_list
@@ -551,58 +1790,6 @@ class BaseNeuralNetwork(six.with_metaclass(ABCMeta, BaseEstimator)):
 
         return self
 
-    def predict(self, X, y=None):
-        """Use model to predict data labels for given feature array.
-
-        Parameters
-        ----------
-        X: array
-            Numpy array containing feature dataset with each row
-            representing a single observation.
-
-        Returns
-        -------
-        y_pred: array
-            Numpy array containing predicted data labels.
-        """
-        if not np.shape(X)[1] == (self.node_list[0] - self.bias):
-            raise Exception("""The number of columns in X must equal %d"""
-                            % ((self.node_list[0] - self.bias),))
-
-        weights = unflatten_weights(self.fitted_weights, self.node_list)
-
-        # Add bias column to inputs matrix, if required
-        if self.bias:
-            ones = np.ones([np.shape(X)[0], 1])
-            inputs = np.hstack((X, ones))
-
-        else:
-            inputs = X
-
-        # Pass data through network
-        for i in range(len(weights)):
-            # Multiple inputs by weights
-            outputs = np.dot(inputs, weights[i])
-
-            # Transform outputs to get inputs for next layer (or final preds)
-            if i < len(weights) - 1:
-                inputs = self.activation_dict[self.activation](outputs)
-            else:
-                y_pred = self.output_activation(outputs)
-
-        # For classifier, convert predicted probabilities to 0-1 labels
-        if self.is_classifier:
-            self.predicted_probs = y_pred
-
-            if self.node_list[-1] == 1:
-                y_pred = np.round(y_pred).astype(int)
-            else:
-                zeros = np.zeros_like(y_pred)
-                zeros[np.arange(len(y_pred)), np.argmax(y_pred, axis=1)] = 1
-                y_pred = zeros.astype(int)
-
-        return y_pred
-
     def get_params(self):
         """Get parameters for this estimator.
 
@@ -612,16 +1799,45 @@ class BaseNeuralNetwork(six.with_metaclass(ABCMeta, BaseEstimator)):
             Parameter names mapped to their values.
         """
         params = {'hidden_nodes': self.hidden_nodes,
+                  'activation': self.activation,
+                  'algorithm': self.algorithm,
                   'max_iters': self.max_iters,
                   'bias': self.bias,
                   'is_classifier': self.is_classifier,
-                  'learning_rate': self.lr,
+                  'learning_rate': self.learning_rate,
                   'early_stopping': self.early_stopping,
                   'clip_max': self.clip_max,
                   'restarts': self.restarts,
                   'schedule': self.schedule,
                   'pop_size': self.pop_size,
-                  'mutation_prob': self.mutation_prob}
+                  'mutation_prob': self.mutation_prob,
+                  'max_attempts': self.max_attempts,
+                  'random_state': self.random_state,
+                  'batch_size': self.batch_size,
+                  'batch_mode': self.batch_mode,
+                  'batch_rescore': self.batch_rescore,
+                  'dtype': self.dtype,
+                  'optimizer': self.optimizer,
+                  'validation_fraction': self.validation_fraction,
+                  'validation_interval': self.validation_interval,
+                  'validation_patience': self.validation_patience}
+
+        return params
+
+    def _get_saved_params(self):
+        """Get the parameters saved with the network, other than those
+        needed for prediction. The schedule and optimizer are objects, so
+        are not saved.
+
+        Returns
+        -------
+        params: dictionary
+            Parameter names mapped to their values.
+        """
+        params = self.get_params()
+        del params['schedule']
+        del params['optimizer']
+        params['dtype'] = np.dtype(self.dtype).name
 
         return params
 
@@ -635,6 +1851,10 @@ class BaseNeuralNetwork(six.with_metaclass(ABCMeta, BaseEstimator)):
         """
         if 'hidden_nodes' in in_params.keys():
             self.hidden_nodes = in_params['hidden_nodes']
+        if 'activation' in in_params.keys():
+            self.activation = in_params['activation']
+        if 'algorithm' in in_params.keys():
+            self.algorithm = in_params['algorithm']
         if 'max_iters' in in_params.keys():
             self.max_iters = in_params['max_iters']
         if 'bias' in in_params.keys():
@@ -642,7 +1862,7 @@ class BaseNeuralNetwork(six.with_metaclass(ABCMeta, BaseEstimator)):
         if 'is_classifier' in in_params.keys():
             self.is_classifier = in_params['is_classifier']
         if 'learning_rate' in in_params.keys():
-            self.lr = in_params['learning_rate']
+            self.learning_rate = in_params['learning_rate']
         if 'early_stopping' in in_params.keys():
             self.early_stopping = in_params['early_stopping']
         if 'clip_max' in in_params.keys():
@@ -655,6 +1875,26 @@ class BaseNeuralNetwork(six.with_metaclass(ABCMeta, BaseEstimator)):
             self.pop_size = in_params['pop_size']
         if 'mutation_prob' in in_params.keys():
             self.mutation_prob = in_params['mutation_prob']
+        if 'max_attempts' in in_params.keys():
+            self.max_attempts = in_params['max_attempts']
+        if 'random_state' in in_params.keys():
+            self.random_state = in_params['random_state']
+        if 'batch_size' in in_params.keys():
+            self.batch_size = in_params['batch_size']
+        if 'batch_mode' in in_params.keys():
+            self.batch_mode = in_params['batch_mode']
+        if 'batch_rescore' in in_params.keys():
+            self.batch_rescore = in_params['batch_rescore']
+        if 'dtype' in in_params.keys():
+            self.dtype = in_params['dtype']
+        if 'optimizer' in in_params.keys():
+            self.optimizer = in_params['optimizer']
+        if 'validation_fraction' in in_params.keys():
+            self.validation_fraction = in_params['validation_fraction']
+        if 'validation_interval' in in_params.keys():
+            self.validation_interval = in_params['validation_interval']
+        if 'validation_patience' in in_params.keys():
+            self.validation_patience = in_params['validation_patience']
 
 
 class NeuralNetwork(BaseNeuralNetwork, ClassifierMixin):
@@ -720,6 +1960,51 @@ class NeuralNetwork(BaseNeuralNetwork, ClassifierMixin):
         If random_state is a positive integer, random_state is the seed used
         by np.random.seed(); otherwise, the random seed is not set.
 
+    batch_size: int, default: None
+        Number of observations in each mini-batch used to evaluate the loss
+        while fitting the weights. If :code:`None`, the full dataset is used.
+
+    batch_mode: string, default: 'random'
+        How mini-batches are drawn. Must be one of: 'random' (batches from a
+        random permutation of the data, reshuffled after each pass through
+        it) or 'rotate' (consecutive batches in the order of the data). Only
+        required if :code:`batch_size` is not :code:`None`.
+
+    batch_rescore: bool, default: False
+        Whether to re-evaluate the current weights on each new mini-batch, so
+        that they are compared with candidate weights on the same data. Only
+        required if :code:`batch_size` is not :code:`None`.
+
+    dtype: data-type, default: np.float64
+        Floating point type used for the data, weights, layer outputs and
+        populations while fitting and predicting. Set :code:`np.float32` to
+        halve memory use and speed up matrix products. The loss is always
+        accumulated in float64.
+
+    optimizer: optimizer object, default: None
+        Optimizer used to calculate the weight updates from the gradient, such
+        as :code:`mlrose.Momentum()`, :code:`mlrose.Nesterov()`,
+        :code:`mlrose.RMSProp()` or :code:`mlrose.Adam()`, which each have
+        their own learning rate. If :code:`None`, plain gradient descent
+        updates scaled by learning_rate are used. Only required if
+        :code:`algorithm = 'gradient_descent'`.
+
+    validation_fraction: float, default: None
+        Proportion of the training data to set aside as validation data, if
+        validation data is not passed to :code:`fit`. If validation data is
+        used, the validation loss is evaluated every validation_interval
+        iterations, the algorithm is stopped when it has not improved for
+        validation_patience evaluations, and the weights with the lowest
+        validation loss are kept. If :code:`None` and no validation data is
+        passed to :code:`fit`, validation data is not used.
+
+    validation_interval: int, default: 10
+        Number of iterations between evaluations of the validation loss.
+
+    validation_patience: int, default: 5
+        Number of consecutive evaluations of the validation loss without
+        improvement after which the algorithm is stopped.
+
     Attributes
     ----------
     fitted_weights: array
@@ -729,6 +2014,10 @@ class NeuralNetwork(BaseNeuralNetwork, ClassifierMixin):
         Value of loss function for fitted weights when :code:`fit` is
         performed.
 
+    validation_loss: float
+        Lowest value of loss function on the validation data when :code:`fit`
+        is performed with validation data.
+
     predicted_probs: array
         Numpy array giving the predicted probabilities for each class when
         :code:`predict` is performed for multi-class classification data; or
@@ -750,7 +2039,15 @@ class NeuralNetwork(BaseNeuralNetwork, ClassifierMixin):
                  pop_size=200,
                  mutation_prob=0.1,
                  max_attempts=10,
-                 random_state=None):
+                 random_state=None,
+                 batch_size=None,
+                 batch_mode='random',
+                 batch_rescore=False,
+                 dtype=np.float64,
+                 optimizer=None,
+                 validation_fraction=None,
+                 validation_interval=10,
+                 validation_patience=5):
         super(NeuralNetwork, self).__init__(
             hidden_nodes=hidden_nodes,
             activation=activation,
@@ -766,7 +2063,15 @@ class NeuralNetwork(BaseNeuralNetwork, ClassifierMixin):
             pop_size=pop_size,
             mutation_prob=mutation_prob,
             max_attempts=max_attempts,
-            random_state=random_state)
+            random_state=random_state,
+            batch_size=batch_size,
+            batch_mode=batch_mode,
+            batch_rescore=batch_rescore,
+            dtype=dtype,
+            optimizer=optimizer,
+            validation_fraction=validation_fraction,
+            validation_interval=validation_interval,
+            validation_patience=validation_patience)
 
 
 class LinearRegression(BaseNeuralNetwork, RegressorMixin):
@@ -823,6 +2128,51 @@ class LinearRegression(BaseNeuralNetwork, RegressorMixin):
         If random_state is a positive integer, random_state is the seed used
         by np.random.seed(); otherwise, the random seed is not set.
 
+    batch_size: int, default: None
+        Number of observations in each mini-batch used to evaluate the loss
+        while fitting the weights. If :code:`None`, the full dataset is used.
+
+    batch_mode: string, default: 'random'
+        How mini-batches are drawn. Must be one of: 'random' (batches from a
+        random permutation of the data, reshuffled after each pass through
+        it) or 'rotate' (consecutive batches in the order of the data). Only
+        required if :code:`batch_size` is not :code:`None`.
+
+    batch_rescore: bool, default: False
+        Whether to re-evaluate the current weights on each new mini-batch, so
+        that they are compared with candidate weights on the same data. Only
+        required if :code:`batch_size` is not :code:`None`.
+
+    dtype: data-type, default: np.float64
+        Floating point type used for the data, weights, layer outputs and
+        populations while fitting and predicting. Set :code:`np.float32` to
+        halve memory use and speed up matrix products. The loss is always
+        accumulated in float64.
+
+    optimizer: optimizer object, default: None
+        Optimizer used to calculate the weight updates from the gradient, such
+        as :code:`mlrose.Momentum()`, :code:`mlrose.Nesterov()`,
+        :code:`mlrose.RMSProp()` or :code:`mlrose.Adam()`, which each have
+        their own learning rate. If :code:`None`, plain gradient descent
+        updates scaled by learning_rate are used. Only required if
+        :code:`algorithm = 'gradient_descent'`.
+
+    validation_fraction: float, default: None
+        Proportion of the training data to set aside as validation data, if
+        validation data is not passed to :code:`fit`. If validation data is
+        used, the validation loss is evaluated every validation_interval
+        iterations, the algorithm is stopped when it has not improved for
+        validation_patience evaluations, and the weights with the lowest
+        validation loss are kept. If :code:`None` and no validation data is
+        passed to :code:`fit`, validation data is not used.
+
+    validation_interval: int, default: 10
+        Number of iterations between evaluations of the validation loss.
+
+    validation_patience: int, default: 5
+        Number of consecutive evaluations of the validation loss without
+        improvement after which the algorithm is stopped.
+
     Attributes
     ----------
     fitted_weights: array
@@ -831,19 +2181,39 @@ class LinearRegression(BaseNeuralNetwork, RegressorMixin):
     loss: float
         Value of loss function for fitted weights when :code:`fit` is
         performed.
+
+    validation_loss: float
+        Lowest value of loss function on the validation data when :code:`fit`
+        is performed with validation data.
     """
 
     def __init__(self, algorithm='random_hill_climb', max_iters=100, bias=True,
                  learning_rate=0.1, early_stopping=False, clip_max=1e+10,
                  restarts=0, schedule=GeomDecay(), pop_size=200,
-                 mutation_prob=0.1, max_attempts=10, random_state=None):
+                 mutation_prob=0.1, max_attempts=10, random_state=None,
+                 batch_size=None,
+                 batch_mode='random',
+                 batch_rescore=False,
+                 dtype=np.float64,
+                 optimizer=None,
+                 validation_fraction=None,
+                 validation_interval=10,
+                 validation_patience=5):
         BaseNeuralNetwork.__init__(
             self, hidden_nodes=[], activation='identity',
             algorithm=algorithm, max_iters=max_iters, bias=bias,
             is_classifier=False, learning_rate=learning_rate,
             early_stopping=early_stopping, clip_max=clip_max, restarts=restarts,
             schedule=schedule, pop_size=pop_size, mutation_prob=mutation_prob,
-            max_attempts=max_attempts, random_state=random_state)
+            max_attempts=max_attempts, random_state=random_state,
+            batch_size=batch_size,
+            batch_mode=batch_mode,
+            batch_rescore=batch_rescore,
+            dtype=dtype,
+            optimizer=optimizer,
+            validation_fraction=validation_fraction,
+            validation_interval=validation_interval,
+            validation_patience=validation_patience)
 
 
 
@@ -901,6 +2271,51 @@ class LogisticRegression(BaseNeuralNetwork, ClassifierMixin):
         If random_state is a positive integer, random_state is the seed used
         by np.random.seed(); otherwise, the random seed is not set.
 
+    batch_size: int, default: None
+        Number of observations in each mini-batch used to evaluate the loss
+        while fitting the weights. If :code:`None`, the full dataset is used.
+
+    batch_mode: string, default: 'random'
+        How mini-batches are drawn. Must be one of: 'random' (batches from a
+        random permutation of the data, reshuffled after each pass through
+        it) or 'rotate' (consecutive batches in the order of the data). Only
+        required if :code:`batch_size` is not :code:`None`.
+
+    batch_rescore: bool, default: False
+        Whether to re-evaluate the current weights on each new mini-batch, so
+        that they are compared with candidate weights on the same data. Only
+        required if :code:`batch_size` is not :code:`None`.
+
+    dtype: data-type, default: np.float64
+        Floating point type used for the data, weights, layer outputs and
+        populations while fitting and predicting. Set :code:`np.float32` to
+        halve memory use and speed up matrix products. The loss is always
+        accumulated in float64.
+
+    optimizer: optimizer object, default: None
+        Optimizer used to calculate the weight updates from the gradient, such
+        as :code:`mlrose.Momentum()`, :code:`mlrose.Nesterov()`,
+        :code:`mlrose.RMSProp()` or :code:`mlrose.Adam()`, which each have
+        their own learning rate. If :code:`None`, plain gradient descent
+        updates scaled by learning_rate are used. Only required if
+        :code:`algorithm = 'gradient_descent'`.
+
+    validation_fraction: float, default: None
+        Proportion of the training data to set aside as validation data, if
+        validation data is not passed to :code:`fit`. If validation data is
+        used, the validation loss is evaluated every validation_interval
+        iterations, the algorithm is stopped when it has not improved for
+        validation_patience evaluations, and the weights with the lowest
+        validation loss are kept. If :code:`None` and no validation data is
+        passed to :code:`fit`, validation data is not used.
+
+    validation_interval: int, default: 10
+        Number of iterations between evaluations of the validation loss.
+
+    validation_patience: int, default: 5
+        Number of consecutive evaluations of the validation loss without
+        improvement after which the algorithm is stopped.
+
     Attributes
     ----------
     fitted_weights: array
@@ -909,16 +2324,105 @@ class LogisticRegression(BaseNeuralNetwork, ClassifierMixin):
     loss: float
         Value of loss function for fitted weights when :code:`fit` is
         performed.
+
+    validation_loss: float
+        Lowest value of loss function on the validation data when :code:`fit`
+        is performed with validation data.
     """
 
     def __init__(self, algorithm='random_hill_climb', max_iters=100, bias=True,
                  learning_rate=0.1, early_stopping=False, clip_max=1e+10,
                  restarts=0, schedule=GeomDecay(), pop_size=200, mutation_prob=0.1,
-                 max_attempts=10, random_state=None):
+                 max_attempts=10, random_state=None,
+                 batch_size=None,
+                 batch_mode='random',
+                 batch_rescore=False,
+                 dtype=np.float64,
+                 optimizer=None,
+                 validation_fraction=None,
+                 validation_interval=10,
+                 validation_patience=5):
         BaseNeuralNetwork.__init__(
             self, hidden_nodes=[], activation='sigmoid',
             algorithm=algorithm, max_iters=max_iters, bias=bias,
             is_classifier=True, learning_rate=learning_rate,
             early_stopping=early_stopping, clip_max=clip_max, restarts=restarts,
             schedule=schedule, pop_size=pop_size, mutation_prob=mutation_prob,
-            max_attempts=max_attempts, random_state=random_state)
+            max_attempts=max_attempts, random_state=random_state,
+            batch_size=batch_size,
+            batch_mode=batch_mode,
+            batch_rescore=batch_rescore,
+            dtype=dtype,
+            optimizer=optimizer,
+            validation_fraction=validation_fraction,
+            validation_interval=validation_interval,
+            validation_patience=validation_patience)
+
+
+def load_network(path, inference_only=False, mmap=False):
+    """Load a network saved with :code:`save`. The saved values are trusted,
+    so are not validated again.
+
+    Parameters
+    ----------
+    path: string
+        Path of file.
+
+    inference_only: bool, default: False
+        Whether to return a :code:`FittedNetwork`, which can only be used for
+        prediction but is quicker to create, rather than an estimator of the
+        class that was saved.
+
+    mmap: bool, default: False
+        Whether to memory-map the fitted weights read-only, rather than read
+        them into memory. Processes that memory-map the same file share one
+        copy of the weights.
+
+    Returns
+    -------
+    network: estimator or FittedNetwork object
+        Fitted network. If the saved estimator parameters included a schedule
+        or optimizer, these are reset to their defaults.
+    """
+    with open(path, 'rb') as file:
+        if file.read(len(SAVED_NETWORK_ID)) != SAVED_NETWORK_ID:
+            raise Exception("""%s does not contain a saved network."""
+                            % (path,))
+
+        header_size = int.from_bytes(file.read(4), 'little')
+        header = json.loads(file.read(header_size).decode('utf-8'))
+
+        if mmap:
+            fitted_weights = np.memmap(
+                file, dtype=header['dtype'], mode='r',
+                offset=len(SAVED_NETWORK_ID) + 4 + header_size,
+                shape=(header['nodes'],))
+        else:
+            fitted_weights = np.fromfile(file, dtype=header['dtype'],
+                                         count=header['nodes'])
+
+    estimators = {'NeuralNetwork': NeuralNetwork,
+                  'LinearRegression': LinearRegression,
+                  'LogisticRegression': LogisticRegression}
+
+    if inference_only or header['class'] not in estimators:
+        network = FittedNetwork(fitted_weights, header['node_list'],
+                                activation=header['activation'],
+                                bias=header['bias'],
+                                is_classifier=header['is_classifier'],
+                                dtype=np.dtype(header['dtype']))
+    else:
+        params = header['params']
+        params['dtype'] = np.dtype(params['dtype'])
+
+        network = estimators[header['class']]()
+        network.set_params(**params)
+        network.node_list = header['node_list']
+        network.fitted_weights = fitted_weights
+        network.output_activation = _output_activation(
+            header['node_list'], header['is_classifier'])
+
+    network.loss = header['loss']
+    network.validation_loss = header['validation_loss']
+
+    return network
@@ -1,6 +1,7 @@
 """ Classes for defining optimization problem objects."""
 
 
+import time
 import numpy as np
 from sklearn.metrics import mutual_info_score
 from scipy.sparse import csr_matrix
@@ -20,6 +21,30 @@ class OptProb:
     maximize: bool, default: True
         Whether to maximize the fitness function.
         Set :code:`False` for minimization problem.
+
+    Attributes
+    ----------
+    stats: dict
+        Counters and timings accumulated since the last call to
+        :code:`reset_stats()`: the number of single fitness evaluations
+        (:code:`evals`), states evaluated in batches (:code:`batch_evals`),
+        batched calls (:code:`batches`) and fitness values reused from the
+        population instead of being re-evaluated (:code:`cached_evals`); and
+        the time in seconds spent on fitness evaluation
+        (:code:`fitness_time`), neighbor generation (:code:`neighbor_time`),
+        sampling (:code:`sample_time`) and reproduction
+        (:code:`reproduce_time`).
+
+    stats_history: list
+        List of snapshots of :code:`stats` taken at the end of every
+        algorithm iteration. Only recorded after calling
+        :code:`record_stats()`; otherwise :code:`None`.
+
+    debug: bool
+        Whether to validate states on the trusted internal evaluation path
+        used by the optimization algorithms. Defaults to :code:`False`,
+        since states generated by the problem object are valid by
+        construction. Set :code:`True` to re-enable full validation.
     """
 
     def __init__(self, length, fitness_fn, maximize=True):
@@ -41,12 +66,29 @@ class OptProb:
         self.population = []
         self.pop_fitness = []
         self.mate_probs = []
+        self.stats = {}
+        self.stats_history = None
+        self.reset_stats()
+        self.debug = False
 
         if maximize:
             self.maximize = 1.0
         else:
             self.maximize = -1.0
 
+    def add_time(self, phase, start):
+        """Add the time elapsed since start to the timing for a phase.
+
+        Parameters
+        ----------
+        phase: string
+            Phase to be timed. One of 'fitness', 'neighbor', 'sample' or
+            'reproduce'.
+        start: float
+            Start time of the phase, as given by :code:`time.perf_counter()`.
+        """
+        self.stats[phase + '_time'] += time.perf_counter() - start
+
     def best_child(self):
         """Return the best state in the current population.
 
@@ -59,6 +101,19 @@ class OptProb:
 
         return best
 
+    def best_child_fitness(self):
+        """Return the fitness of the best state in the current population,
+        reusing the stored population fitness values.
+
+        Returns
+        -------
+        fitness: float
+            Fitness value of best child.
+        """
+        self.stats['cached_evals'] += 1
+
+        return np.max(self.pop_fitness)
+
     def best_neighbor(self):
         """Return the best neighbor of current state.
 
@@ -67,33 +122,84 @@ class OptProb:
         best: array
             State vector defining best neighbor.
         """
-        fitness_list = []
-
-        for neigh in self.neighbors:
-            fitness = self.eval_fitness(neigh)
-            fitness_list.append(fitness)
-
+        fitness_list = self.eval_fitness_many(self.neighbors, trusted=True)
         best = self.neighbors[np.argmax(fitness_list)]
 
         return best
 
-    def eval_fitness(self, state):
+    def eval_fitness(self, state, trusted=False):
         """Evaluate the fitness of a state vector.
 
         Parameters
         ----------
         state: array
             State vector for evaluation.
+        trusted: bool, default: False
+            Whether state was generated by the problem object and so is
+            known to be valid. If :code:`True` (and :code:`debug` is
+            :code:`False`), input validation is skipped and the fitness
+            function's :code:`evaluate_trusted` method is used, if it has one.
 
         Returns
         -------
         fitness: float
             Value of fitness function.
         """
-        if len(state) != self.length:
+        if trusted and not self.debug:
+            evaluate = getattr(self.fitness_fn, 'evaluate_trusted',
+                               self.fitness_fn.evaluate)
+
+        elif len(state) != self.length:
             raise Exception("state length must match problem length")
 
-        fitness = self.maximize*self.fitness_fn.evaluate(state)
+        else:
+            evaluate = self.fitness_fn.evaluate
+
+        start = time.perf_counter()
+        fitness = self.maximize*evaluate(state)
+        self.add_time('fitness', start)
+        self.stats['evals'] += 1
+
+        return fitness
+
+    def eval_fitness_many(self, states, trusted=False):
+        """Evaluate the fitness of several state vectors.
+
+        If the fitness function object provides an :code:`evaluate_many`
+        method, all states are passed to it in a single call. Otherwise each
+        state is evaluated in turn.
+
+        Parameters
+        ----------
+        states: array
+            2-D array (or list of state vectors) containing one state vector
+            per row.
+        trusted: bool, default: False
+            Whether the states were generated by the problem object and so
+            are known to be valid. If :code:`True` (and :code:`debug` is
+            :code:`False`), input validation is skipped.
+
+        Returns
+        -------
+        fitness: array
+            Numpy array containing the fitness of each state vector.
+        """
+        if not hasattr(self.fitness_fn, 'evaluate_many'):
+            return np.array([self.eval_fitness(state, trusted)
+                             for state in states])
+
+        states = np.asarray(states)
+
+        if (not trusted or self.debug) and (
+                states.ndim != 2 or np.shape(states)[1] != self.length):
+            raise Exception("state length must match problem length")
+
+        start = time.perf_counter()
+        fitness = self.maximize*np.asarray(
+            self.fitness_fn.evaluate_many(states))
+        self.add_time('fitness', start)
+        self.stats['batch_evals'] += len(states)
+        self.stats['batches'] += 1
 
         return fitness
 
@@ -175,6 +281,21 @@ class OptProb:
         """
         return self.population
 
+    def get_stats(self):
+        """ Return a copy of the evaluation counters and phase timings.
+
+        Returns
+        -------
+        stats: dict
+            Copy of :code:`self.stats`, with the additional key
+            :code:`total_evals` giving the total number of fitness function
+            evaluations.
+        """
+        stats = dict(self.stats)
+        stats['total_evals'] = stats['evals'] + stats['batch_evals']
+
+        return stats
+
     def get_state(self):
         """ Return the current state vector.
 
@@ -185,27 +306,75 @@ class OptProb:
         """
         return self.state
 
-    def set_population(self, new_population):
+    def log_stats(self, iters):
+        """Append a snapshot of the current stats to the stats history, if
+        stats recording is switched on.
+
+        Parameters
+        ----------
+        iters: int
+            Current iteration of the algorithm.
+        """
+        if self.stats_history is not None:
+            snapshot = self.get_stats()
+            snapshot['iteration'] = iters
+            self.stats_history.append(snapshot)
+
+    def record_stats(self, record=True):
+        """Switch per-iteration recording of stats on or off.
+
+        Parameters
+        ----------
+        record: bool, default: True
+            Whether to record a snapshot of the stats at the end of every
+            algorithm iteration in :code:`self.stats_history`.
+        """
+        if record:
+            self.stats_history = []
+        else:
+            self.stats_history = None
+
+    def reset_stats(self):
+        """Reset the evaluation counters, phase timings and stats history.
+        """
+        self.stats = {'evals': 0,
+                      'batch_evals': 0,
+                      'batches': 0,
+                      'cached_evals': 0,
+                      'fitness_time': 0.0,
+                      'neighbor_time': 0.0,
+                      'sample_time': 0.0,
+                      'reproduce_time': 0.0}
+
+        if self.stats_history is not None:
+            self.stats_history = []
+
+    def set_population(self, new_population, pop_fitness=None):
         """ Change the current population to a specified new population and get
-        the fitness of all members.
+        the fitness of all members. The members of the new population are
+        assumed to be valid state vectors, unless :code:`debug` is
+        :code:`True`.
 
         Parameters
         ----------
         new_population: array
             Numpy array containing new population.
+        pop_fitness: array, default: None
+            Fitness of each member of new_population, if already known. If
+            not :code:`None`, the population is not re-evaluated.
         """
         self.population = new_population
 
-        # Calculate fitness
-        pop_fitness = []
+        if pop_fitness is not None:
+            self.pop_fitness = pop_fitness
 
-        for i in range(len(self.population)):
-            fitness = self.eval_fitness(self.population[i])
-            pop_fitness.append(fitness)
+            return
 
-        self.pop_fitness = np.array(pop_fitness)
+        # Calculate fitness
+        self.pop_fitness = self.eval_fitness_many(self.population,
+                                                  trusted=True)
 
-    def set_state(self, new_state):
+    def set_state(self, new_state, fitness=None):
         """
         Change the current state vector to a specified value
         and get its fitness.
@@ -214,7 +383,18 @@ class OptProb:
         ----------
         new_state: array
             New state vector value.
+        fitness: float, default: None
+            Fitness of new_state, as returned by :code:`eval_fitness`, if
+            already known. If not :code:`None` (and :code:`debug` is
+            :code:`False`), new_state is trusted and is not re-evaluated.
         """
+        if fitness is not None and not self.debug:
+            self.state = new_state
+            self.fitness = fitness
+            self.stats['cached_evals'] += 1
+
+            return
+
         if len(new_state) != self.length:
             raise Exception("""new_state length must match problem length""")
 
@@ -265,7 +445,7 @@ class DiscreteOpt(OptProb):
             self.max_val = max_val
 
         self.keep_sample = []
-        self.node_probs = np.zeros([self.length, self.max_val, self.max_val])
+        self.node_probs = []
         self.parent_nodes = []
         self.sample_order = []
         self.prob_type = 'discrete'
@@ -449,20 +629,14 @@ class DiscreteOpt(OptProb):
             else:
                 raise Exception("""pop_size must be a positive integer.""")
 
-        population = []
-        pop_fitness = []
-
-        for _ in range(pop_size):
-            state = self.random()
-            fitness = self.eval_fitness(state)
-
-            population.append(state)
-            pop_fitness.append(fitness)
+        population = [self.random() for _ in range(pop_size)]
 
         self.population = np.array(population)
-        self.pop_fitness = np.array(pop_fitness)
+        self.pop_fitness = self.eval_fitness_many(self.population,
+                                                  trusted=True)
 
-    def reproduce(self, parent_1, parent_2, mutation_prob=0.1):
+    def reproduce(self, parent_1, parent_2, mutation_prob=0.1,
+                  trusted=False):
         """Create child state vector from two parent state vectors.
 
         Parameters
@@ -474,17 +648,22 @@ class DiscreteOpt(OptProb):
         mutation_prob: float
             Probability of a mutation at each state element during
             reproduction.
+        trusted: bool, default: False
+            Whether the inputs are known to be valid. If :code:`True` (and
+            :code:`debug` is :code:`False`), input validation is skipped.
 
         Returns
         -------
         child: array
             Child state vector produced from parents 1 and 2.
         """
-        if len(parent_1) != self.length or len(parent_2) != self.length:
-            raise Exception("""Lengths of parents must match problem length""")
+        if not trusted or self.debug:
+            if len(parent_1) != self.length or len(parent_2) != self.length:
+                raise Exception("""Lengths of parents must match problem"""
+                                + """ length""")
 
-        if (mutation_prob < 0) or (mutation_prob > 1):
-            raise Exception("""mutation_prob must be between 0 and 1.""")
+            if (mutation_prob < 0) or (mutation_prob > 1):
+                raise Exception("""mutation_prob must be between 0 and 1.""")
 
         # Reproduce parents
         if self.length > 1:
@@ -517,7 +696,7 @@ class DiscreteOpt(OptProb):
         """Set the current state vector to a random value and get its fitness.
         """
         self.state = self.random()
-        self.fitness = self.eval_fitness(self.state)
+        self.fitness = self.eval_fitness(self.state, trusted=True)
 
     def sample_pop(self, sample_size):
         """Generate new sample from probability density.
@@ -587,10 +766,13 @@ class ContinuousOpt(OptProb):
 
     step: float, default: 0.1
         Step size used in determining neighbors of current state.
+
+    dtype: data-type, default: np.float64
+        Floating point type of the state vectors and populations.
     """
 
     def __init__(self, length, fitness_fn, maximize=True, min_val=0,
-                 max_val=1, step=0.1):
+                 max_val=1, step=0.1, dtype=np.float64):
 
         OptProb.__init__(self, length, fitness_fn, maximize=maximize)
 
@@ -612,26 +794,56 @@ class ContinuousOpt(OptProb):
             raise Exception("""step size must be less than"""
                             + """ (max_val - min_val).""")
 
+        if not np.issubdtype(dtype, np.floating):
+            raise Exception("""dtype must be a floating point type.""")
+
+        self.dtype = np.dtype(dtype)
         self.min_val = min_val
         self.max_val = max_val
         self.step = step
         self.prob_type = 'continuous'
 
-    def calculate_updates(self):
+    def calculate_gradient(self):
+        """Calculate the gradient of the fitness function at the current
+        state.
+
+        Returns
+        -------
+        gradient: array
+            1D gradient array. For a :code:`NetworkWeights` fitness function,
+            this array is reused by the next call.
+        """
+        gradient = self.fitness_fn.calculate_gradient()
+
+        return gradient
+
+    def calculate_updates(self, flat=False):
         """Calculate gradient descent updates.
 
+        Parameters
+        ----------
+        flat: bool, default: False
+            Whether to return the updates as a 1D array, in the same order as
+            the state vector, rather than as a list of 2D arrays.
+
         Returns
         -------
         updates: list
-            List of back propagation weight updates.
+            List of back propagation weight updates. If flat is :code:`True`,
+            1D updates array instead, which for a :code:`NetworkWeights`
+            fitness function is reused by the next call.
         """
-        updates = self.fitness_fn.calculate_updates()
+        if flat:
+            updates = self.fitness_fn.calculate_updates(flat=True)
+        else:
+            updates = self.fitness_fn.calculate_updates()
 
         return updates
 
     def find_neighbors(self):
         """Find all neighbors of the current state."""
 
+        self.next_batch()
         self.neighbors = []
 
         for i in range(self.length):
@@ -668,7 +880,22 @@ class ContinuousOpt(OptProb):
         """
         state = np.random.uniform(self.min_val, self.max_val, self.length)
 
-        return state
+        return state.astype(self.dtype, copy=False)
+
+    def next_batch(self):
+        """Move the fitness function on to its next mini-batch of data, if it
+        evaluates fitness on mini-batches, and re-evaluate the current state
+        on the new batch if the fitness function requires it. Called at the
+        start of each algorithm iteration, before any new states are
+        evaluated.
+        """
+        if getattr(self.fitness_fn, 'batch_size', None) is None:
+            return
+
+        self.fitness_fn.next_batch()
+
+        if self.fitness_fn.batch_rescore:
+            self.fitness = self.eval_fitness(self.state, trusted=True)
 
     def random_neighbor(self):
         """Return random neighbor of current state vector.
@@ -678,6 +905,8 @@ class ContinuousOpt(OptProb):
         neighbor: array
             State vector of random neighbor.
         """
+        self.next_batch()
+
         while True:
             neighbor = np.copy(self.state)
             i = np.random.randint(0, self.length)
@@ -711,20 +940,14 @@ class ContinuousOpt(OptProb):
             else:
                 raise Exception("""pop_size must be a positive integer.""")
 
-        population = []
-        pop_fitness = []
-
-        for _ in range(pop_size):
-            state = self.random()
-            fitness = self.eval_fitness(state)
-
-            population.append(state)
-            pop_fitness.append(fitness)
+        population = [self.random() for _ in range(pop_size)]
 
         self.population = np.array(population)
-        self.pop_fitness = np.array(pop_fitness)
+        self.pop_fitness = self.eval_fitness_many(self.population,
+                                                  trusted=True)
 
-    def reproduce(self, parent_1, parent_2, mutation_prob=0.1):
+    def reproduce(self, parent_1, parent_2, mutation_prob=0.1,
+                  trusted=False):
         """Create child state vector from two parent state vectors.
 
         Parameters
@@ -739,21 +962,27 @@ class ContinuousOpt(OptProb):
             Probability of a mutation at each state vector element during
             reproduction.
 
+        trusted: bool, default: False
+            Whether the inputs are known to be valid. If :code:`True` (and
+            :code:`debug` is :code:`False`), input validation is skipped.
+
         Returns
         -------
         child: array
             Child state vector produced from parents 1 and 2.
         """
-        if len(parent_1) != self.length or len(parent_2) != self.length:
-            raise Exception("""Lengths of parents must match problem length""")
+        if not trusted or self.debug:
+            if len(parent_1) != self.length or len(parent_2) != self.length:
+                raise Exception("""Lengths of parents must match problem"""
+                                + """ length""")
 
-        if (mutation_prob < 0) or (mutation_prob > 1):
-            raise Exception("""mutation_prob must be between 0 and 1.""")
+            if (mutation_prob < 0) or (mutation_prob > 1):
+                raise Exception("""mutation_prob must be between 0 and 1.""")
 
         # Reproduce parents
         if self.length > 1:
             _n = np.random.randint(self.length - 1)
-            child = np.array([0.0]*self.length)
+            child = np.zeros(self.length, dtype=self.dtype)
             child[0:_n+1] = parent_1[0:_n+1]
             child[_n+1:] = parent_2[_n+1:]
         elif np.random.randint(2) == 0:
@@ -774,7 +1003,26 @@ class ContinuousOpt(OptProb):
         """Set the current state vector to a random value and get its fitness.
         """
         self.state = self.random()
-        self.fitness = self.eval_fitness(self.state)
+        self.fitness = self.eval_fitness(self.state, trusted=True)
+
+    def set_population(self, new_population, pop_fitness=None):
+        """ Change the current population to a specified new population and get
+        the fitness of all members, after moving on to the next mini-batch of
+        data if the fitness function uses mini-batches.
+
+        Parameters
+        ----------
+        new_population: array
+            Numpy array containing new population.
+        pop_fitness: array, default: None
+            Fitness of each member of new_population, if already known. If
+            not :code:`None`, the population is not re-evaluated and the
+            mini-batch is not changed.
+        """
+        if pop_fitness is None:
+            self.next_batch()
+
+        OptProb.set_population(self, new_population, pop_fitness)
 
     def update_state(self, updates):
         """Update current state given a vector of updates.
@@ -792,6 +1040,7 @@ class ContinuousOpt(OptProb):
         if len(updates) != self.length:
             raise Exception("""Length of updates must match problem length""")
 
+        self.next_batch()
         updated_state = self.state + updates
 
         updated_state[updated_state > self.max_val] = self.max_val
@@ -831,10 +1080,19 @@ class TSPOpt(DiscreteOpt):
         considered to be the same. If a pair is missing from the list, it is
         assumed that travel between the two nodes is not possible. This
         argument is ignored if fitness_fn or coords is not :code:`None`.
+
+    candidate_k: int, default: None
+        Number of nearest nodes to keep in each node's candidate list. If not
+        :code:`None`, neighbors and mutations are restricted to moves that
+        make a node adjacent on the tour to one of its k nearest nodes, by
+        reversing the section of the tour between them. Must be at least 3,
+        so that every node has a candidate it is not already adjacent to.
+        Requires a :code:`TravellingSales` fitness function defined using
+        coords.
     """
 
     def __init__(self, length, fitness_fn=None, maximize=False, coords=None,
-                 distances=None):
+                 distances=None, candidate_k=None):
 
         if (fitness_fn is None) and (coords is None) and (distances is None):
             raise Exception("""At least one of fitness_fn, coords and"""
@@ -848,6 +1106,22 @@ class TSPOpt(DiscreteOpt):
         if self.fitness_fn.get_prob_type() != 'tsp':
             raise Exception("""fitness_fn must have problem type 'tsp'.""")
 
+        if candidate_k is None:
+            self.candidates = None
+
+        elif (not isinstance(candidate_k, int)
+              and not candidate_k.is_integer()) or (candidate_k < 3):
+            raise Exception("""candidate_k must be None or an integer"""
+                            + """ greater than or equal to 3.""")
+
+        elif isinstance(self.fitness_fn, TravellingSales) \
+                and self.fitness_fn.is_coords:
+            self.candidates = self.fitness_fn.nearest_nodes(candidate_k)
+
+        else:
+            raise Exception("""candidate_k requires a TravellingSales"""
+                            + """ fitness function defined using coords.""")
+
         self.prob_type = 'tsp'
 
     def adjust_probs(self, probs):
@@ -874,16 +1148,110 @@ class TSPOpt(DiscreteOpt):
 
     def find_neighbors(self):
         """Find all neighbors of the current state.
+
+        If candidate lists are used, the neighbors are the tours given by
+        joining each node to each of its candidates. Each of these moves is
+        scored by the change in tour length, from the two legs it removes and
+        the two legs it adds, and only the best one is stored, since it is
+        the neighbor that :code:`best_neighbor()` would choose.
         """
         self.neighbors = []
 
-        for node1 in range(self.length - 1):
-            for node2 in range(node1 + 1, self.length):
-                neighbor = np.copy(self.state)
+        if self.candidates is not None:
+            state = self.state
+            positions = np.argsort(state)
+
+            # Positions of each node and each of its candidates
+            pos1 = np.repeat(np.arange(self.length),
+                             np.shape(self.candidates)[1])
+            pos2 = positions[self.candidates[state].ravel()]
+
+            # Each node has at least 3 candidates, and only 2 nodes adjacent
+            # to it on the tour, so there is always a valid move
+            gap = np.abs(pos1 - pos2)
+            valid = (gap > 1) & (gap < self.length - 1)
+            pos1 = pos1[valid]
+            pos2 = pos2[valid]
+
+            # Each move replaces the legs (u, v) and (w, x) with (u, w) and
+            # (v, x), where u and w are at positions i and j
+            i = np.where(pos2 > pos1, pos1, pos2 - 1)
+            j = np.where(pos2 > pos1, pos2, pos1 - 1)
+            u = state[i]
+            v = state[(i + 1) % self.length]
+            w = state[j]
+            x = state[(j + 1) % self.length]
+
+            coords = self.fitness_fn.coord_array
+            dist = (lambda a, b:
+                    np.sqrt(np.sum((coords[a] - coords[b])**2, axis=1)))
+            delta = dist(u, w) + dist(v, x) - dist(u, v) - dist(w, x)
+
+            best = np.argmax(self.maximize*delta)
+            neighbor = np.copy(state)
+            self.join_nodes(neighbor, pos1[best], pos2[best])
+            self.neighbors.append(neighbor)
 
-                neighbor[node1] = self.state[node2]
-                neighbor[node2] = self.state[node1]
-                self.neighbors.append(neighbor)
+        else:
+            for node1 in range(self.length - 1):
+                for node2 in range(node1 + 1, self.length):
+                    neighbor = np.copy(self.state)
+
+                    neighbor[node1] = self.state[node2]
+                    neighbor[node2] = self.state[node1]
+                    self.neighbors.append(neighbor)
+
+    def join_nodes(self, state, pos1, pos2):
+        """Make the nodes at two positions of a tour adjacent, by reversing
+        the section of the tour between them. The state vector is modified in
+        place.
+
+        Parameters
+        ----------
+        state: array
+            State vector to be modified.
+        pos1: int
+            Position of first node.
+        pos2: int
+            Position of second node.
+
+        Returns
+        -------
+        moved: bool
+            Whether the state vector was changed. Returns :code:`False` if the
+            two nodes are already adjacent.
+        """
+        if abs(pos1 - pos2) in (0, 1, self.length - 1):
+            return False
+
+        if pos2 > pos1:
+            state[pos1 + 1:pos2 + 1] = state[pos1 + 1:pos2 + 1][::-1]
+        else:
+            state[pos2:pos1] = state[pos2:pos1][::-1]
+
+        return True
+
+    def random_candidate_move(self, state, pos):
+        """Make the node at a given position of a tour adjacent to a randomly
+        chosen node from its candidate list. The state vector is modified in
+        place.
+
+        Parameters
+        ----------
+        state: array
+            State vector to be modified.
+        pos: int
+            Position of node to be moved next to one of its candidates.
+
+        Returns
+        -------
+        moved: bool
+            Whether the state vector was changed.
+        """
+        node_list = self.candidates[state[pos]]
+        node = node_list[np.random.randint(len(node_list))]
+
+        return self.join_nodes(state, pos, np.where(state == node)[0][0])
 
     def random(self):
         """Return a random state vector.
@@ -947,6 +1315,15 @@ class TSPOpt(DiscreteOpt):
             State vector of random neighbor.
         """
         neighbor = np.copy(self.state)
+
+        if self.candidates is not None:
+            # Candidates may already be adjacent, so allow a few attempts
+            # before falling back to a uniformly random swap
+            for _ in range(10):
+                if self.random_candidate_move(
+                        neighbor, np.random.randint(self.length)):
+                    return neighbor
+
         node1, node2 = np.random.choice(np.arange(self.length),
                                         size=2, replace=False)
 
@@ -955,7 +1332,8 @@ class TSPOpt(DiscreteOpt):
 
         return neighbor
 
-    def reproduce(self, parent_1, parent_2, mutation_prob=0.1):
+    def reproduce(self, parent_1, parent_2, mutation_prob=0.1,
+                  trusted=False):
         """Create child state vector from two parent state vectors.
 
         Parameters
@@ -970,16 +1348,22 @@ class TSPOpt(DiscreteOpt):
             Probability of a mutation at each state element during
             reproduction.
 
+        trusted: bool, default: False
+            Whether the inputs are known to be valid. If :code:`True` (and
+            :code:`debug` is :code:`False`), input validation is skipped.
+
         Returns
         -------
         child: array
             Child state vector produced from parents 1 and 2.
         """
-        if len(parent_1) != self.length or len(parent_2) != self.length:
-            raise Exception("""Lengths of parents must match problem length""")
+        if not trusted or self.debug:
+            if len(parent_1) != self.length or len(parent_2) != self.length:
+                raise Exception("""Lengths of parents must match problem"""
+                                + """ length""")
 
-        if (mutation_prob < 0) or (mutation_prob > 1):
-            raise Exception("""mutation_prob must be between 0 and 1.""")
+            if (mutation_prob < 0) or (mutation_prob > 1):
+                raise Exception("""mutation_prob must be between 0 and 1.""")
 
         # Reproduce parents
         if self.length > 1:
@@ -999,7 +1383,11 @@ class TSPOpt(DiscreteOpt):
         rand = np.random.uniform(size=self.length)
         mutate = np.where(rand < mutation_prob)[0]
 
-        if len(mutate) > 0:
+        if self.candidates is not None:
+            for i in mutate:
+                self.random_candidate_move(child, i)
+
+        elif len(mutate) > 0:
             mutate_perm = np.random.permutation(mutate)
             temp = np.copy(child)
 
@@ -0,0 +1,498 @@
+""" Classes for defining first-order optimizers for gradient descent."""
+
+
+import numpy as np
+
+
+class Momentum:
+    """
+    Gradient descent with momentum. At each step, the update is given by:
+
+    .. math::
+
+        v_{t} = \\mu v_{t-1} - \\alpha g_{t}
+
+    where:
+
+    * :math:`v_{t}` is the update (velocity) at step t;
+    * :math:`\\mu` is the momentum;
+    * :math:`\\alpha` is the learning rate;
+    * :math:`g_{t}` is the gradient at step t.
+
+    Parameters
+    ----------
+    learning_rate: float, default: 0.1
+        Learning rate. Must be greater than 0.
+
+    momentum: float, default: 0.9
+        Fraction of the previous update carried over to the next one. Must be
+        greater than or equal to 0 and less than 1.
+
+    Example
+    -------
+    .. highlight:: python
+    .. code-block:: python
+
+        >>> import mlrose
+        >>> optimizer = mlrose.Momentum(learning_rate=0.01, momentum=0.9)
+        >>> nn = mlrose.NeuralNetwork(algorithm='gradient_descent',
+        ...                           optimizer=optimizer)
+    """
+
+    def __init__(self, learning_rate=0.1, momentum=0.9):
+
+        if learning_rate <= 0:
+            raise Exception("""learning_rate must be greater than 0.""")
+
+        if (momentum < 0) or (momentum >= 1):
+            raise Exception("""momentum must be greater than or equal to 0"""
+                            + """ and less than 1.""")
+
+        self.learning_rate = learning_rate
+        self.momentum = momentum
+        self.velocity = np.zeros(0)
+
+    def reset(self, length, dtype=np.float64):
+        """Clear the optimizer state, allocating it for a new state vector.
+
+        Parameters
+        ----------
+        length: int
+            Number of elements in state vector.
+
+        dtype: data-type, default: np.float64
+            Floating point type of the state vector.
+        """
+        self.velocity = np.zeros(length, dtype=dtype)
+
+    def get_state(self):
+        """Get the optimizer state, so that it can be saved to a checkpoint.
+
+        Returns
+        -------
+        state: dict
+            Dictionary of copies of the optimizer's running values.
+        """
+        return {'velocity': np.copy(self.velocity)}
+
+    def set_state(self, state):
+        """Restore an optimizer state returned by :code:`get_state()`.
+
+        Parameters
+        ----------
+        state: dict
+            Dictionary of the optimizer's running values.
+        """
+        self.velocity = np.array(state['velocity'])
+
+    def calculate_updates(self, gradient):
+        """Calculate the update to apply to the current state.
+
+        Parameters
+        ----------
+        gradient: array
+            Gradient of the loss at the current state.
+
+        Returns
+        -------
+        updates: array
+            Update array. This array is reused by the next call.
+        """
+        self.velocity *= self.momentum
+        self.velocity -= self.learning_rate*gradient
+
+        return self.velocity
+
+
+class Nesterov:
+    """
+    Gradient descent with Nesterov momentum. The gradient is assumed to be
+    taken at the current state, rather than at the look-ahead state, using
+    the equivalent form of the update:
+
+    .. math::
+
+        v_{t} = \\mu v_{t-1} - \\alpha g_{t}
+
+        u_{t} = \\mu v_{t} - \\alpha g_{t}
+
+    where:
+
+    * :math:`u_{t}` is the update at step t;
+    * :math:`v_{t}` is the velocity at step t;
+    * :math:`\\mu` is the momentum;
+    * :math:`\\alpha` is the learning rate;
+    * :math:`g_{t}` is the gradient at step t.
+
+    Parameters
+    ----------
+    learning_rate: float, default: 0.1
+        Learning rate. Must be greater than 0.
+
+    momentum: float, default: 0.9
+        Fraction of the previous velocity carried over to the next one. Must
+        be greater than or equal to 0 and less than 1.
+
+    Example
+    -------
+    .. highlight:: python
+    .. code-block:: python
+
+        >>> import mlrose
+        >>> optimizer = mlrose.Nesterov(learning_rate=0.01, momentum=0.9)
+        >>> nn = mlrose.NeuralNetwork(algorithm='gradient_descent',
+        ...                           optimizer=optimizer)
+    """
+
+    def __init__(self, learning_rate=0.1, momentum=0.9):
+
+        if learning_rate <= 0:
+            raise Exception("""learning_rate must be greater than 0.""")
+
+        if (momentum < 0) or (momentum >= 1):
+            raise Exception("""momentum must be greater than or equal to 0"""
+                            + """ and less than 1.""")
+
+        self.learning_rate = learning_rate
+        self.momentum = momentum
+        self.velocity = np.zeros(0)
+        self.updates = np.zeros(0)
+
+    def reset(self, length, dtype=np.float64):
+        """Clear the optimizer state, allocating it for a new state vector.
+
+        Parameters
+        ----------
+        length: int
+            Number of elements in state vector.
+
+        dtype: data-type, default: np.float64
+            Floating point type of the state vector.
+        """
+        self.velocity = np.zeros(length, dtype=dtype)
+        self.updates = np.zeros(length, dtype=dtype)
+
+    def get_state(self):
+        """Get the optimizer state, so that it can be saved to a checkpoint.
+
+        Returns
+        -------
+        state: dict
+            Dictionary of copies of the optimizer's running values.
+        """
+        return {'velocity': np.copy(self.velocity)}
+
+    def set_state(self, state):
+        """Restore an optimizer state returned by :code:`get_state()`.
+
+        Parameters
+        ----------
+        state: dict
+            Dictionary of the optimizer's running values.
+        """
+        self.velocity = np.array(state['velocity'])
+        self.updates = np.zeros_like(self.velocity)
+
+    def calculate_updates(self, gradient):
+        """Calculate the update to apply to the current state.
+
+        Parameters
+        ----------
+        gradient: array
+            Gradient of the loss at the current state.
+
+        Returns
+        -------
+        updates: array
+            Update array. This array is reused by the next call.
+        """
+        self.velocity *= self.momentum
+        self.velocity -= self.learning_rate*gradient
+
+        np.multiply(self.velocity, self.momentum, out=self.updates)
+        self.updates -= self.learning_rate*gradient
+
+        return self.updates
+
+
+class RMSProp:
+    """
+    RMSProp optimizer, which scales the learning rate of each weight by a
+    running average of the magnitude of its recent gradients. At each step,
+    the update is given by:
+
+    .. math::
+
+        s_{t} = \\rho s_{t-1} + (1 - \\rho) g_{t}^{2}
+
+        u_{t} = -\\alpha g_{t} / (\\sqrt{s_{t}} + \\epsilon)
+
+    where:
+
+    * :math:`u_{t}` is the update at step t;
+    * :math:`s_{t}` is the average squared gradient at step t;
+    * :math:`\\rho` is the decay rate of the average;
+    * :math:`\\alpha` is the learning rate;
+    * :math:`g_{t}` is the gradient at step t.
+
+    Parameters
+    ----------
+    learning_rate: float, default: 0.001
+        Learning rate. Must be greater than 0.
+
+    rho: float, default: 0.9
+        Decay rate of the average squared gradient. Must be between 0 and 1.
+
+    epsilon: float, default: 1e-8
+        Small constant added to the denominator for numerical stability. Must
+        be greater than 0.
+
+    Example
+    -------
+    .. highlight:: python
+    .. code-block:: python
+
+        >>> import mlrose
+        >>> optimizer = mlrose.RMSProp(learning_rate=0.001)
+        >>> nn = mlrose.NeuralNetwork(algorithm='gradient_descent',
+        ...                           optimizer=optimizer)
+    """
+
+    def __init__(self, learning_rate=0.001, rho=0.9, epsilon=1e-8):
+
+        if learning_rate <= 0:
+            raise Exception("""learning_rate must be greater than 0.""")
+
+        if (rho < 0) or (rho > 1):
+            raise Exception("""rho must be between 0 and 1.""")
+
+        if epsilon <= 0:
+            raise Exception("""epsilon must be greater than 0.""")
+
+        self.learning_rate = learning_rate
+        self.rho = rho
+        self.epsilon = epsilon
+        self.mean_square = np.zeros(0)
+        self.updates = np.zeros(0)
+
+    def reset(self, length, dtype=np.float64):
+        """Clear the optimizer state, allocating it for a new state vector.
+
+        Parameters
+        ----------
+        length: int
+            Number of elements in state vector.
+
+        dtype: data-type, default: np.float64
+            Floating point type of the state vector.
+        """
+        self.mean_square = np.zeros(length, dtype=dtype)
+        self.updates = np.zeros(length, dtype=dtype)
+
+    def get_state(self):
+        """Get the optimizer state, so that it can be saved to a checkpoint.
+
+        Returns
+        -------
+        state: dict
+            Dictionary of copies of the optimizer's running values.
+        """
+        return {'mean_square': np.copy(self.mean_square)}
+
+    def set_state(self, state):
+        """Restore an optimizer state returned by :code:`get_state()`.
+
+        Parameters
+        ----------
+        state: dict
+            Dictionary of the optimizer's running values.
+        """
+        self.mean_square = np.array(state['mean_square'])
+        self.updates = np.zeros_like(self.mean_square)
+
+    def calculate_updates(self, gradient):
+        """Calculate the update to apply to the current state.
+
+        Parameters
+        ----------
+        gradient: array
+            Gradient of the loss at the current state.
+
+        Returns
+        -------
+        updates: array
+            Update array. This array is reused by the next call.
+        """
+        # Update average squared gradient
+        np.square(gradient, out=self.updates)
+        self.updates *= 1 - self.rho
+        self.mean_square *= self.rho
+        self.mean_square += self.updates
+
+        # Calculate updates
+        np.sqrt(self.mean_square, out=self.updates)
+        self.updates += self.epsilon
+        np.divide(gradient, self.updates, out=self.updates)
+        self.updates *= -self.learning_rate
+
+        return self.updates
+
+
+class Adam:
+    """
+    Adam optimizer, which combines momentum with per-weight learning rates
+    scaled by a running average of the squared gradients. At each step, the
+    update is given by:
+
+    .. math::
+
+        m_{t} = \\beta_{1} m_{t-1} + (1 - \\beta_{1}) g_{t}
+
+        v_{t} = \\beta_{2} v_{t-1} + (1 - \\beta_{2}) g_{t}^{2}
+
+        u_{t} = -\\alpha \\frac{\\sqrt{1 - \\beta_{2}^{t}}}{1 - \\beta_{1}^{t}}
+        \\frac{m_{t}}{\\sqrt{v_{t}} + \\epsilon}
+
+    where:
+
+    * :math:`u_{t}` is the update at step t;
+    * :math:`m_{t}` and :math:`v_{t}` are the averages of the gradient and
+      squared gradient at step t;
+    * :math:`\\beta_{1}` and :math:`\\beta_{2}` are the decay rates of the
+      averages;
+    * :math:`\\alpha` is the learning rate;
+    * :math:`g_{t}` is the gradient at step t.
+
+    Parameters
+    ----------
+    learning_rate: float, default: 0.001
+        Learning rate. Must be greater than 0.
+
+    beta_1: float, default: 0.9
+        Decay rate of the average gradient. Must be greater than or equal to
+        0 and less than 1.
+
+    beta_2: float, default: 0.999
+        Decay rate of the average squared gradient. Must be greater than or
+        equal to 0 and less than 1.
+
+    epsilon: float, default: 1e-8
+        Small constant added to the denominator for numerical stability. Must
+        be greater than 0.
+
+    Example
+    -------
+    .. highlight:: python
+    .. code-block:: python
+
+        >>> import mlrose
+        >>> optimizer = mlrose.Adam(learning_rate=0.001)
+        >>> nn = mlrose.NeuralNetwork(algorithm='gradient_descent',
+        ...                           optimizer=optimizer)
+    """
+
+    def __init__(self, learning_rate=0.001, beta_1=0.9, beta_2=0.999,
+                 epsilon=1e-8):
+
+        if learning_rate <= 0:
+            raise Exception("""learning_rate must be greater than 0.""")
+
+        if (beta_1 < 0) or (beta_1 >= 1):
+            raise Exception("""beta_1 must be greater than or equal to 0"""
+                            + """ and less than 1.""")
+
+        if (beta_2 < 0) or (beta_2 >= 1):
+            raise Exception("""beta_2 must be greater than or equal to 0"""
+                            + """ and less than 1.""")
+
+        if epsilon <= 0:
+            raise Exception("""epsilon must be greater than 0.""")
+
+        self.learning_rate = learning_rate
+        self.beta_1 = beta_1
+        self.beta_2 = beta_2
+        self.epsilon = epsilon
+        self.steps = 0
+        self.mean = np.zeros(0)
+        self.mean_square = np.zeros(0)
+        self.updates = np.zeros(0)
+
+    def reset(self, length, dtype=np.float64):
+        """Clear the optimizer state, allocating it for a new state vector.
+
+        Parameters
+        ----------
+        length: int
+            Number of elements in state vector.
+
+        dtype: data-type, default: np.float64
+            Floating point type of the state vector.
+        """
+        self.steps = 0
+        self.mean = np.zeros(length, dtype=dtype)
+        self.mean_square = np.zeros(length, dtype=dtype)
+        self.updates = np.zeros(length, dtype=dtype)
+
+    def get_state(self):
+        """Get the optimizer state, so that it can be saved to a checkpoint.
+
+        Returns
+        -------
+        state: dict
+            Dictionary of copies of the optimizer's running values.
+        """
+        return {'steps': self.steps,
+                'mean': np.copy(self.mean),
+                'mean_square': np.copy(self.mean_square)}
+
+    def set_state(self, state):
+        """Restore an optimizer state returned by :code:`get_state()`.
+
+        Parameters
+        ----------
+        state: dict
+            Dictionary of the optimizer's running values.
+        """
+        self.steps = int(state['steps'])
+        self.mean = np.array(state['mean'])
+        self.mean_square = np.array(state['mean_square'])
+        self.updates = np.zeros_like(self.mean)
+
+    def calculate_updates(self, gradient):
+        """Calculate the update to apply to the current state.
+
+        Parameters
+        ----------
+        gradient: array
+            Gradient of the loss at the current state.
+
+        Returns
+        -------
+        updates: array
+            Update array. This array is reused by the next call.
+        """
+        self.steps += 1
+
+        # Update average gradient
+        np.multiply(gradient, 1 - self.beta_1, out=self.updates)
+        self.mean *= self.beta_1
+        self.mean += self.updates
+
+        # Update average squared gradient
+        np.square(gradient, out=self.updates)
+        self.updates *= 1 - self.beta_2
+        self.mean_square *= self.beta_2
+        self.mean_square += self.updates
+
+        # Calculate bias-corrected learning rate
+        step_size = self.learning_rate \
+            * np.sqrt(1 - self.beta_2**self.steps) \
+            / (1 - self.beta_1**self.steps)
+
+        # Calculate updates
+        np.sqrt(self.mean_square, out=self.updates)
+        self.updates += self.epsilon
+        np.divide(self.mean, self.updates, out=self.updates)
+        self.updates *= -step_size
+
+        return self.updates
@@ -0,0 +1,262 @@
+""" Functions to search over neural network hyperparameters in parallel."""
+
+
+import copy
+import os
+import shutil
+import tempfile
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from sklearn.model_selection import ParameterGrid
+
+
+# Arrays opened by each worker process, keyed by file path, so that each
+# worker only opens each memory-mapped file once
+_worker_arrays = {}
+
+
+def _load_array(path):
+    """Open a memory-mapped array saved in a .npy file, reusing it if it
+    has already been opened by this process.
+
+    Parameters
+    ----------
+    path: string
+        Path of .npy file. If :code:`None`, then :code:`None` is returned.
+
+    Returns
+    -------
+    array: array
+        Read-only memory-mapped array.
+    """
+    if path is None:
+        return None
+
+    if path not in _worker_arrays:
+        _worker_arrays[path] = np.load(path, mmap_mode='r')
+
+    return _worker_arrays[path]
+
+
+def _fit_params(estimator, params, paths, return_estimator):
+    """Fit a copy of an estimator with given parameters in a worker process.
+
+    Parameters
+    ----------
+    estimator: estimator object
+        Unfitted estimator, e.g. :code:`mlrose.NeuralNetwork()`.
+
+    params: dict
+        Parameters to set on the estimator before fitting.
+
+    paths: dict
+        Paths of the .npy files containing X, y, X_val and y_val.
+
+    return_estimator: bool
+        Whether to include the fitted estimator in the result.
+
+    Returns
+    -------
+    result: dict
+        Result of fitting, as described in :code:`parallel_search`.
+    """
+    X = _load_array(paths['X'])
+    y = _load_array(paths['y'])
+    X_val = _load_array(paths['X_val'])
+    y_val = _load_array(paths['y_val'])
+
+    estimator = copy.deepcopy(estimator)
+    estimator.set_params(**params)
+
+    start = time.perf_counter()
+    estimator.fit(X, y, X_val=X_val, y_val=y_val)
+    fit_time = time.perf_counter() - start
+
+    result = {'params': params,
+              'loss': estimator.loss,
+              'validation_loss': estimator.validation_loss,
+              'fit_time': fit_time}
+
+    if return_estimator:
+        result['estimator'] = estimator
+
+    return result
+
+
+def parallel_search(estimator, param_grid, X, y, X_val=None, y_val=None,
+                    n_jobs=None, temp_dir=None, return_estimator=False):
+    """Fit an estimator with each combination of parameters in a parameter
+    grid, using a pool of worker processes.
+
+    The data is saved once to memory-mapped .npy files, which all of the
+    workers read from, rather than being pickled and sent to the workers for
+    every combination of parameters. Results are returned as soon as each
+    fit completes, so they are in order of completion rather than in the
+    order of the grid.
+
+    Parameters
+    ----------
+    estimator: estimator object
+        Unfitted estimator, e.g. :code:`mlrose.NeuralNetwork()`. Parameters
+        not in the grid keep the values set on this estimator.
+
+    param_grid: dict or list of dicts
+        Dictionary mapping parameter names to lists of values to try, or a
+        list of such dictionaries, as for
+        :code:`sklearn.model_selection.ParameterGrid`.
+
+    X: array
+        Numpy array containing feature dataset with each row representing a
+        single observation.
+
+    y: array
+        Numpy array containing data labels. Length must be same as length of
+        X.
+
+    X_val: array, default: None
+        Numpy array containing validation feature dataset, passed to
+        :code:`fit`.
+
+    y_val: array, default: None
+        Numpy array containing validation data labels, passed to :code:`fit`.
+
+    n_jobs: int, default: None
+        Number of worker processes. If :code:`None`, the number of CPUs is
+        used.
+
+    temp_dir: string, default: None
+        Directory in which to save the memory-mapped data. A memory-backed
+        file system, such as :code:`'/dev/shm'` on Linux, avoids writing the
+        data to disk. If :code:`None`, the system default temporary directory
+        is used. The saved data is deleted when the search finishes.
+
+    return_estimator: bool, default: False
+        Whether to include the fitted estimators in the results.
+
+    Returns
+    -------
+    results: generator of dicts
+        Generator giving a dictionary for each completed fit with the keys
+        :code:`params` (the grid parameters), :code:`loss`,
+        :code:`validation_loss`, :code:`fit_time` (in seconds) and, if
+        return_estimator is :code:`True`, :code:`estimator`.
+
+    Example
+    -------
+    .. highlight:: python
+    .. code-block:: python
+
+        >>> import mlrose
+        >>> grid = {'hidden_nodes': [[5], [10]],
+        ...         'algorithm': ['random_hill_climb', 'genetic_alg']}
+        >>> for result in mlrose.parallel_search(mlrose.NeuralNetwork(),
+        ...                                      grid, X, y, n_jobs=4):
+        ...     print(result['params'], result['loss'])
+
+    Note
+    ----
+    The arguments are checked and the data is saved when
+    :code:`parallel_search` is called, so that invalid input is reported
+    before any fits are started. The saved data is also deleted if the
+    generator is discarded without being used.
+
+    Sharing the saved data avoids sending a copy of it with every
+    combination of parameters, but each fit still makes its own copy of X
+    (and of X_val) in the estimator's dtype, with a column of ones added for
+    the bias term, when it sets up its loss function. Only inputs that
+    already have the estimator's dtype, fitted with :code:`bias=False` and
+    without a :code:`validation_fraction`, are used directly from the
+    shared files.
+    """
+    if not np.shape(X)[0] == np.shape(y)[0]:
+        raise Exception("""The length of X and y must be equal.""")
+
+    if (X_val is None) != (y_val is None):
+        raise Exception("""X_val and y_val must both be given or both be"""
+                        + """ None.""")
+
+    if n_jobs is not None and ((not isinstance(n_jobs, int)
+                                and not n_jobs.is_integer()) or n_jobs <= 0):
+        raise Exception("""n_jobs must be None or a positive integer.""")
+
+    grid = list(ParameterGrid(param_grid))
+    data_dir = tempfile.mkdtemp(prefix='mlrose_', dir=temp_dir)
+
+    try:
+        # Save each array once, for all of the workers to share
+        paths = {}
+
+        for name, array in [('X', X), ('y', y), ('X_val', X_val),
+                            ('y_val', y_val)]:
+            if array is None:
+                paths[name] = None
+            else:
+                paths[name] = os.path.join(data_dir, name + '.npy')
+                np.save(paths[name], np.asarray(array))
+
+    except BaseException:
+        shutil.rmtree(data_dir, ignore_errors=True)
+        raise
+
+    results = _search_results(estimator, grid, paths, data_dir, n_jobs,
+                              return_estimator)
+
+    # A generator that is never started does not run its cleanup, so also
+    # delete the data when the generator is garbage collected
+    weakref.finalize(results, shutil.rmtree, data_dir, ignore_errors=True)
+
+    return results
+
+
+def _search_results(estimator, grid, paths, data_dir, n_jobs,
+                    return_estimator):
+    """Generate the results for parallel_search, deleting the saved data
+    when the search finishes or is stopped.
+
+    Parameters
+    ----------
+    estimator: estimator object
+        Unfitted estimator.
+
+    grid: list of dicts
+        Parameters to fit the estimator with.
+
+    paths: dict
+        Paths of the .npy files containing X, y, X_val and y_val.
+
+    data_dir: string
+        Directory containing the .npy files.
+
+    n_jobs: int
+        Number of worker processes, or :code:`None` for the number of CPUs.
+
+    return_estimator: bool
+        Whether to include the fitted estimators in the results.
+
+    Returns
+    -------
+    results: generator of dicts
+        Generator giving a dictionary for each completed fit.
+    """
+    try:
+        with ProcessPoolExecutor(
+                max_workers=None if n_jobs is None else int(n_jobs)) \
+                as executor:
+            futures = [executor.submit(_fit_params, estimator, params, paths,
+                                       return_estimator)
+                       for params in grid]
+
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+
+            finally:
+                # Don't start any remaining fits if the search is stopped
+                for future in futures:
+                    future.cancel()
+
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
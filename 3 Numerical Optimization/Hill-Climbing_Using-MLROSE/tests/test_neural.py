@@ -0,0 +1,167 @@
+""" Unit tests for neural.py"""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from mlrose import NeuralNetwork, Checkpoint, Adam
+# NetworkWeights and the activation functions are not imported at
+# initialization, so must be imported explicitly
+from mlrose.neural import NetworkWeights
+from mlrose.activation import relu
+
+
+class TestNetworkWeights(unittest.TestCase):
+    """Tests for NetworkWeights class."""
+
+    @staticmethod
+    def test_evaluate_many_chunk_size():
+        """Test a realistic population is evaluated in large chunks."""
+        np.random.seed(1)
+        X = np.random.uniform(-1, 1, [10000, 20])
+        y = np.random.randint(2, size=[10000, 1])
+
+        # A population of 200 is evaluated in one chunk for 1000 samples,
+        # and in a few chunks for 10000 samples
+        network = NetworkWeights(X[:1000], y[:1000], [21, 10, 1], relu)
+        assert network.get_chunk_size() >= 200
+
+        network = NetworkWeights(X, y, [21, 10, 1], relu)
+        assert network.get_chunk_size() >= 20
+
+    @staticmethod
+    def test_evaluate_many_matches_evaluate():
+        """Test evaluate_many gives the same fitness as evaluate when the
+        states are split across several chunks."""
+        np.random.seed(1)
+        X = np.random.uniform(-1, 1, [50, 4])
+        y = np.random.randint(2, size=[50, 1])
+
+        network = NetworkWeights(X, y, [5, 3, 1], relu)
+        states = np.random.uniform(-1, 1, [7, network.nodes])
+
+        import mlrose.neural
+        budget = mlrose.neural.EVALUATE_MANY_BYTES
+        mlrose.neural.EVALUATE_MANY_BYTES = 2*50*3*8
+
+        try:
+            assert network.get_chunk_size() == 2
+            fitness = network.evaluate_many(states)
+        finally:
+            mlrose.neural.EVALUATE_MANY_BYTES = budget
+
+        assert np.allclose(fitness, [network.evaluate(state)
+                                     for state in states])
+
+    @staticmethod
+    def test_incremental_refresh():
+        """Test chained incremental updates are replaced by a full
+        evaluation after INCREMENTAL_REFRESH updates."""
+        from mlrose.neural import INCREMENTAL_REFRESH
+
+        np.random.seed(1)
+        X = np.random.uniform(-1, 1, [50, 4])
+        y = np.random.randint(2, size=[50, 1])
+
+        network = NetworkWeights(X, y, [5, 3, 1], relu, incremental=True)
+        reference = NetworkWeights(X, y, [5, 3, 1], relu)
+        state = np.random.uniform(-1, 1, network.nodes)
+        network.evaluate(state)
+
+        updates = []
+
+        for _ in range(3*INCREMENTAL_REFRESH):
+            state = np.copy(state)
+            state[np.random.randint(network.nodes)] += 0.1
+            fitness = network.evaluate(state)
+            updates.append(network.last_cache[4])
+
+        # Each state is evaluated from at most INCREMENTAL_REFRESH chained
+        # updates, and some states are evaluated in full again
+        assert max(updates) == INCREMENTAL_REFRESH
+        assert updates.count(0) >= 2
+        assert np.isclose(fitness, reference.evaluate(state))
+
+    @staticmethod
+    def test_calculate_updates_not_overwritten():
+        """Test the list of updates returned by calculate_updates is not
+        overwritten by the next call."""
+        np.random.seed(1)
+        X = np.random.uniform(-1, 1, [50, 4])
+        y = np.random.randint(2, size=[50, 1])
+
+        network = NetworkWeights(X, y, [5, 3, 1], relu)
+        network.evaluate(np.random.uniform(-1, 1, network.nodes))
+        updates = network.calculate_updates()
+        first = [np.copy(layer) for layer in updates]
+
+        network.evaluate(np.random.uniform(-1, 1, network.nodes))
+        network.calculate_updates()
+
+        assert all(np.array_equal(layer, copy)
+                   for layer, copy in zip(updates, first))
+
+
+
+class InterruptedCheckpoint(Checkpoint):
+    """Checkpoint that interrupts the run by raising KeyboardInterrupt
+    after a given number of saves."""
+
+    def __init__(self, path, interval, saves):
+        Checkpoint.__init__(self, path, interval)
+        self.saves = saves
+
+    def save(self, values):
+        Checkpoint.save(self, values)
+        self.saves -= 1
+
+        if self.saves == 0:
+            raise KeyboardInterrupt
+
+
+class TestNeuralNetwork(unittest.TestCase):
+    """Tests for NeuralNetwork class."""
+
+    @staticmethod
+    def test_checkpoint_resume():
+        """Test a fit interrupted and resumed from its checkpoint gives the
+        same weights as an uninterrupted fit, with mini-batches and with an
+        optimizer."""
+        np.random.seed(1)
+        X = np.random.uniform(-1, 1, [100, 4])
+        y = (X[:, 0] > 0).astype(int)
+
+        params = [{'algorithm': 'genetic_alg', 'pop_size': 20,
+                   'batch_size': 32},
+                  {'algorithm': 'simulated_annealing', 'batch_size': 32},
+                  {'algorithm': 'gradient_descent', 'batch_size': 32,
+                   'optimizer': Adam()}]
+
+        path = tempfile.mkdtemp()
+
+        try:
+            for i, param in enumerate(params):
+                fitted = []
+
+                for checkpoint in [None, InterruptedCheckpoint(
+                        os.path.join(path, str(i)), 5, 3),
+                                   Checkpoint(os.path.join(path, str(i)), 5)]:
+                    network = NeuralNetwork(hidden_nodes=[5], max_iters=40,
+                                            early_stopping=False,
+                                            random_state=7, **param)
+                    try:
+                        network.fit(X, y, checkpoint=checkpoint)
+                    except KeyboardInterrupt:
+                        continue
+
+                    fitted.append(network.fitted_weights)
+
+                assert np.array_equal(fitted[0], fitted[1])
+        finally:
+            shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    unittest.main()